@@ -1,19 +1,147 @@
 """Conftest.py for driver manager and other fixtures"""
 
+import base64
 import logging
+import mimetypes
+import os
+from typing import TYPE_CHECKING
 
 import pytest
 import pytest_html.extras
-import yaml
 
-from helpers.driver_manager import capture_screenshot, get_driver
+import constants
+from helpers.command_profiler import CommandProfiler
+from helpers.locator_profiler import LocatorProfiler
+from helpers.profile_template import NavigationMetrics, ProfileTemplate
+from helpers.property_results import EXPORT_FORMATS, PropertyResultsTable
+from helpers.scenarios import REDUCTIONS, load_grouped_scenarios
+from helpers.session_runner import parse_shard
+from helpers.screencast import ScreencastBuffer
+from helpers.stream_report import StreamReport
+from helpers.test_selection import DependencyRecorder, select_tests
+from helpers.timeout_history import TimeoutHistory
+
+if TYPE_CHECKING:
+    from helpers.caching_proxy import CachingProxy
 
 logger = logging.getLogger(__name__)
 
+LOCATOR_PROFILER_KEY = pytest.StashKey[LocatorProfiler]()
+COMMAND_PROFILER_KEY = pytest.StashKey[CommandProfiler]()
+DEPENDENCY_RECORDER_KEY = pytest.StashKey[DependencyRecorder]()
+STREAM_REPORT_KEY = pytest.StashKey[StreamReport]()
+TIMEOUT_HISTORY_KEY = pytest.StashKey[TimeoutHistory]()
+SCREENCAST_KEY = pytest.StashKey[ScreencastBuffer]()
+PROFILE_TEMPLATE_KEY = pytest.StashKey[ProfileTemplate]()
+NAVIGATION_METRICS_KEY = pytest.StashKey[NavigationMetrics]()
+CACHING_PROXY_KEY = pytest.StashKey["CachingProxy"]()
+REPORT_DIR = constants.RESULTS_DIR
+COMMAND_PROFILE_DIR = os.path.join(REPORT_DIR, "command-profile")
+LOCATOR_PROFILE_REPORT = os.path.join(REPORT_DIR, "locator-profile.json")
+PROPERTY_RESULTS_DIR = os.path.join(REPORT_DIR, "property-results")
+TRACES_DIR = os.path.join(REPORT_DIR, "traces")
+NAVIGATION_METRICS_REPORT = os.path.join(REPORT_DIR, "first-navigation.json")
+DEPENDENCY_MAP = os.path.join(REPORT_DIR, "dependency-map.json")
+TIMEOUT_HISTORY = os.path.join(REPORT_DIR, "timeout-history.json")
+SCENARIOS_FILE = "tests/data/scenarios.yaml"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config):
+    """Create session wide helpers enabled by command-line options"""
+    if config.getoption("--stream-report"):
+        # Replaces the in-memory self-contained pytest-html report
+        config.option.htmlpath = None
+        config.stash[STREAM_REPORT_KEY] = StreamReport(REPORT_DIR)
+    if config.getoption("--profile-locators"):
+        config.stash[LOCATOR_PROFILER_KEY] = LocatorProfiler()
+    if config.getoption("--profile-commands"):
+        config.stash[COMMAND_PROFILER_KEY] = CommandProfiler()
+    if config.getoption("--record-dependencies"):
+        config.stash[DEPENDENCY_RECORDER_KEY] = DependencyRecorder()
+    if config.getoption("--navigation-metrics") or config.getoption("--profile-template"):
+        config.stash[NAVIGATION_METRICS_KEY] = NavigationMetrics()
+    if config.getoption("--profile-template"):
+        config.stash[PROFILE_TEMPLATE_KEY] = ProfileTemplate(config.stash[NAVIGATION_METRICS_KEY])
+    if config.getoption("--caching-proxy"):
+        from helpers.caching_proxy import CachingProxy  # pylint:disable=C0415,W0621
+
+        config.stash[CACHING_PROXY_KEY] = CachingProxy(
+            config.getoption("--proxy-host"),
+            cache_dir=config.getoption("--proxy-cache-dir"),
+            max_bytes=config.getoption("--proxy-cache-mb") * 1024 * 1024,
+        ).start()
+    if config.getoption("--adaptive-timeouts"):
+        config.stash[TIMEOUT_HISTORY_KEY] = TimeoutHistory(
+            config.getoption("--timeout-history"), config.getoption("--env")
+        )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list):
+    """Deselect tests not affected by changes since --changed-since ref and tests of other --shard workers"""
+    base_ref = config.getoption("--changed-since")
+    selected = None
+    if base_ref:
+        selected = select_tests(
+            [item.nodeid for item in items], config.getoption("--dependency-map"), base_ref
+        )
+    if selected is not None:
+        deselected = [item for item in items if item.nodeid not in selected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item.nodeid in selected]
+    shard = config.getoption("--shard")
+    if shard:
+        index, count = shard
+        config.hook.pytest_deselected(
+            items=[item for position, item in enumerate(items) if position % count != index]
+        )
+        items[:] = items[index::count]
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    """Parametrize `scenario` with the scenarios of --scenarios data file, grouped by search,
+    the scenario matrix is left out of the default run"""
+    if "scenario" in metafunc.fixturenames:
+        scenarios_file = metafunc.config.getoption("--scenarios")
+        if not scenarios_file:
+            metafunc.parametrize(
+                "scenario",
+                [pytest.param(None, marks=pytest.mark.skip(reason="Scenarios run with --scenarios only"))],
+                ids=["scenarios"],
+            )
+            return
+        scenarios = load_grouped_scenarios(
+            scenarios_file, metafunc.config.getoption("--scenario-reduction")
+        )
+        metafunc.parametrize(
+            "scenario", scenarios, ids=[scenario.id for scenario in scenarios]
+        )
+
+
+@pytest.fixture(scope="session")
+def locator_profiler(request):
+    """Locator Profiler when --profile-locators is set else None"""
+    return request.config.stash.get(LOCATOR_PROFILER_KEY, None)
+
+
+@pytest.fixture(scope="session")
+def timeout_history(request):
+    """Timeout History when --adaptive-timeouts is set else None"""
+    return request.config.stash.get(TIMEOUT_HISTORY_KEY, None)
+
+
+@pytest.fixture(scope="session")
+def navigation_metrics(request):
+    """Navigation Metrics when --navigation-metrics or --profile-template is set else None"""
+    return request.config.stash.get(NAVIGATION_METRICS_KEY, None)
+
 
 @pytest.fixture(scope="module")
 def env_config(request):
     """Environment Config"""
+    import yaml  # pylint:disable=C0415
+
     env = request.config.getoption("--env")
     with open("config.yaml", encoding="utf-8") as f:
         config = yaml.safe_load(f)
@@ -36,15 +164,101 @@ def browser_config(request, env_config):  # pylint:disable=W0621
     if not grid_url:
         grid_url = env_config.get("grid_url", None)
 
-    return {"browser": browser, "headless": headless, "grid_url": grid_url}
+    network_events = request.config.getoption("--network-events") or env_config.get(
+        "network_events", False
+    )
+
+    caching_proxy = request.config.stash.get(CACHING_PROXY_KEY, None)
+
+    return {
+        "browser": browser,
+        "headless": headless,
+        "grid_url": grid_url,
+        "network_events": network_events,
+        "proxy_address": caching_proxy.address if caching_proxy else None,
+        "proxy_ca_spki": caching_proxy.authority.spki_hash if caching_proxy else None,
+    }
 
 
 @pytest.fixture(scope="module", autouse=True)
-def driver(browser_config: dict):  # pylint:disable=W0621
-    """Provides a WebDriverManager instance and ensures the browser is quit after use."""
-    driver_instance = get_driver(**browser_config)
+def driver(request, browser_config: dict, env_config, navigation_metrics):  # pylint:disable=W0621
+    """Provides a WebDriverManager instance and ensures the browser is quit after use.
+
+    With --webdriver-trace the session commands are recorded to / replayed from a trace per test module.
+    With --screencast the last frames of the browser are buffered, in the module stash, for failure reports.
+    With --profile-template local browsers start from a clone of the warmed profile template.
+    """
+    # Selenium is imported once a driver is needed, not at collection
+    from helpers.driver_manager import get_driver  # pylint:disable=C0415
+    from helpers.webdriver_trace import ReplayWebDriver, start_recording  # pylint:disable=C0415
+
+    trace_mode = request.config.getoption("--webdriver-trace")
+    trace_path = os.path.join(TRACES_DIR, f"{request.module.__name__}.jsonl.gz")
+    screencast = profile_dir = None
+    if trace_mode == "replay":
+        driver_instance = ReplayWebDriver(trace_path)
+    else:
+        profile_template = request.config.stash.get(PROFILE_TEMPLATE_KEY, None)
+        if profile_template and not browser_config["grid_url"]:
+            profile_dir = profile_template.clone(
+                browser_config["browser"], browser_config["headless"], env_config["url"]
+            )
+        driver_instance = get_driver(**browser_config, profile_dir=profile_dir)
+        if navigation_metrics:
+            navigation_metrics.set_profile(driver_instance, "template clone" if profile_dir else "clean")
+        if request.config.getoption("--screencast"):
+            # Started before the command executor is wrapped, screencast commands stay out of traces and profiles
+            screencast = ScreencastBuffer(driver_instance).start()
+            request.node.stash[SCREENCAST_KEY] = screencast
+    recorder = start_recording(driver_instance, trace_path) if trace_mode == "record" else None
+    command_profiler = request.config.stash.get(COMMAND_PROFILER_KEY, None)
+    if command_profiler:
+        command_profiler.attach(driver_instance)
     yield driver_instance
+    if screencast:
+        screencast.stop()
     driver_instance.quit()
+    if profile_dir:
+        ProfileTemplate.remove_clone(profile_dir)
+    if recorder:
+        recorder.close()
+
+
+@pytest.fixture(scope="class")
+def searched_results():
+    """Results page URL and search request per search key, to reuse the results of a search within the class"""
+    return {}
+
+
+@pytest.fixture
+def property_results(request):
+    """Property results table of the test, exported per --results-export format after the test"""
+    results = PropertyResultsTable()
+    yield results
+    export_format = request.config.getoption("--results-export")
+    if export_format and len(results):
+        results.export(
+            os.path.join(PROPERTY_RESULTS_DIR, request.node.name), export_format
+        )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):  # pylint:disable=W0613
+    """Profile WebDriver commands, record page object dependencies and restart screencast per test"""
+    screencast = item.getparent(pytest.Module).stash.get(SCREENCAST_KEY, None)
+    if screencast:
+        screencast.clear()
+    command_profiler = item.config.stash.get(COMMAND_PROFILER_KEY, None)
+    if command_profiler:
+        command_profiler.start(item.nodeid)
+    dependency_recorder = item.config.stash.get(DEPENDENCY_RECORDER_KEY, None)
+    if dependency_recorder:
+        dependency_recorder.start()
+    yield
+    if dependency_recorder:
+        dependency_recorder.stop(item.nodeid)
+    if command_profiler:
+        command_profiler.finish(COMMAND_PROFILE_DIR)
 
 
 @pytest.hookimpl(hookwrapper=True)
@@ -52,17 +266,40 @@ def pytest_runtest_makereport(item, call):
     """Pytest Hook to update report with screenshot and log errors"""
     outcome = yield
     report = outcome.get_result()
+    stream_report = item.config.stash.get(STREAM_REPORT_KEY, None)
+    artifacts = {}
     # Only on failure
     if report.when == "call" and report.failed:
+        from helpers import driver_manager  # pylint:disable=C0415
+
         report_driver = item.funcargs.get("driver")
         test_name = item.name
 
         report.extras = getattr(report, "extras", [])
         if report_driver:
             try:
-                screenshot_base64 = capture_screenshot(report_driver, test_name)
-                img_data = f"data:image/png;base64,{screenshot_base64}"
-                report.extras.append(pytest_html.extras.image(img_data, name=test_name))
+                artifacts["page source"] = driver_manager.capture_page_source(report_driver, test_name)
+                screencast = item.getparent(pytest.Module).stash.get(SCREENCAST_KEY, None)
+                screencast_path = screencast.save(test_name) if screencast else None
+                if screencast_path:
+                    artifacts["screencast"] = screencast_path
+                    if not stream_report:
+                        with open(screencast_path, "rb") as f:
+                            img_data = (
+                                f"data:{mimetypes.guess_type(screencast_path)[0]};base64,"
+                                f"{base64.b64encode(f.read()).decode()}"
+                            )
+                        report.extras.append(
+                            pytest_html.extras.image(img_data, name=f"{test_name} screencast")
+                        )
+                if stream_report:
+                    artifacts["screenshot"] = driver_manager.capture_screenshot(
+                        report_driver, test_name, return_base64=False
+                    )
+                else:
+                    screenshot_base64 = driver_manager.capture_screenshot(report_driver, test_name)
+                    img_data = f"data:image/png;base64,{screenshot_base64}"
+                    report.extras.append(pytest_html.extras.image(img_data, name=test_name))
             except Exception as e:  # pylint:disable=W0718
                 logger.error(
                     "Error capturing screenshot for '%s' : %s",
@@ -76,6 +313,24 @@ def pytest_runtest_makereport(item, call):
             test_name,
             exc_info=(call.excinfo.type, call.excinfo.value, call.excinfo.tb),
         )
+    if stream_report:
+        stream_report.add(report, artifacts)
+
+
+def pytest_unconfigure(config: pytest.Config):
+    """Finish stream report, save timeout history, remove profile templates and stop caching proxy"""
+    caching_proxy = config.stash.get(CACHING_PROXY_KEY, None)
+    if caching_proxy:
+        caching_proxy.stop()
+    profile_template = config.stash.get(PROFILE_TEMPLATE_KEY, None)
+    if profile_template:
+        profile_template.cleanup()
+    history = config.stash.get(TIMEOUT_HISTORY_KEY, None)
+    if history:
+        history.save()
+    stream_report = config.stash.get(STREAM_REPORT_KEY, None)
+    if stream_report:
+        stream_report.close()
 
 
 def pytest_addoption(parser: pytest.Parser):
@@ -88,6 +343,123 @@ def pytest_addoption(parser: pytest.Parser):
     )
     parser.addoption("--headless", action="store_true", help="Set Headless Mode")
     parser.addoption("--grid-url", type=str, help="Selenium Grid Hub URL")
+    parser.addoption(
+        "--network-events",
+        action="store_true",
+        help="Track network idle with CDP Network events on Chromium browsers",
+    )
+    parser.addoption(
+        "--profile-locators",
+        action="store_true",
+        help="Time every locator template in browser and rank the most expensive ones",
+    )
+    parser.addoption(
+        "--profile-commands",
+        action="store_true",
+        help="Profile WebDriver commands per test as call tree and flame graph folded stacks",
+    )
+    parser.addoption(
+        "--results-export",
+        type=str,
+        choices=EXPORT_FORMATS,
+        help="Export scraped property results of each test as csv, jsonl or parquet",
+    )
+    parser.addoption(
+        "--webdriver-trace",
+        type=str,
+        choices=["record", "replay"],
+        help="Record WebDriver commands per test module to test-results/traces, or replay them without browser",
+    )
+    parser.addoption(
+        "--stream-report",
+        action="store_true",
+        help="Stream results to test-results/report.jsonl and report.html with screenshots and page sources as files",
+    )
+    parser.addoption(
+        "--adaptive-timeouts",
+        action="store_true",
+        help="Wait for p99 of recorded wait durations per locator template times safety factor, capped at timeout",
+    )
+    parser.addoption(
+        "--timeout-history",
+        type=str,
+        default=TIMEOUT_HISTORY,
+        help="Wait duration history file used by --adaptive-timeouts",
+    )
+    parser.addoption(
+        "--screencast",
+        action="store_true",
+        help="Buffer the last browser frames in memory and save them as animated GIF on failure",
+    )
+    parser.addoption(
+        "--profile-template",
+        action="store_true",
+        help="Warm a browser profile once per run and start every local session from a clone of it",
+    )
+    parser.addoption(
+        "--navigation-metrics",
+        action="store_true",
+        help="Report first navigation time and transferred bytes per session, set by --profile-template",
+    )
+    parser.addoption(
+        "--caching-proxy",
+        action="store_true",
+        help="Route browsers through a local proxy caching immutable static assets on disk across runs",
+    )
+    parser.addoption(
+        "--proxy-cache-dir",
+        type=str,
+        help="Disk cache directory of --caching-proxy, defaults to ~/.cache/bookingdotcom-proxy",
+    )
+    parser.addoption(
+        "--proxy-cache-mb",
+        type=int,
+        default=500,
+        help="Max disk cache size of --caching-proxy, least recently used assets are evicted",
+    )
+    parser.addoption(
+        "--proxy-host",
+        type=str,
+        default="127.0.0.1",
+        help="Interface --caching-proxy listens on, 0.0.0.0 for browsers on a Selenium Grid",
+    )
+    parser.addoption(
+        "--record-dependencies",
+        action="store_true",
+        help="Record page object methods and locators exercised by each test into the dependency map",
+    )
+    parser.addoption(
+        "--changed-since",
+        type=str,
+        metavar="REF",
+        help="Run only tests affected by changes since git REF, full suite if the dependency map is stale",
+    )
+    parser.addoption(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        help="Run only every Nth selected test starting at zero based index I, set by helpers.session_runner",
+    )
+    parser.addoption(
+        "--dependency-map",
+        type=str,
+        default=DEPENDENCY_MAP,
+        help="Dependency map file used by --record-dependencies and --changed-since",
+    )
+    parser.addoption(
+        "--scenarios",
+        type=str,
+        nargs="?",
+        const=SCENARIOS_FILE,
+        help=f"Run data driven scenarios of a YAML dimensions or JSON Lines file, {SCENARIOS_FILE} without value",
+    )
+    parser.addoption(
+        "--scenario-reduction",
+        type=str,
+        choices=REDUCTIONS,
+        default="pairwise",
+        help="Combine YAML scenario dimensions covering every value pair or every combination",
+    )
     parser.addoption(
         "--env",
         type=str,
@@ -95,3 +467,28 @@ def pytest_addoption(parser: pytest.Parser):
         help="Test Environment",
         default="stage",
     )
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config):
+    """Report locator and command profiles, first navigations, proxy cache and save dependency map"""
+    profiler = config.stash.get(LOCATOR_PROFILER_KEY, None)
+    if profiler and profiler.stats:
+        terminalreporter.write_sep("-", "Most expensive locator templates")
+        terminalreporter.write_line(profiler.format_ranking())
+        profiler.write_report(LOCATOR_PROFILE_REPORT)
+    command_profiler = config.stash.get(COMMAND_PROFILER_KEY, None)
+    if command_profiler and command_profiler.totals:
+        terminalreporter.write_sep("-", "Steps issuing the most WebDriver commands")
+        terminalreporter.write_line(command_profiler.format_top_steps())
+    navigation_metrics = config.stash.get(NAVIGATION_METRICS_KEY, None)  # pylint:disable=W0621
+    if navigation_metrics and navigation_metrics.entries:
+        terminalreporter.write_sep("-", "First navigation per session by profile")
+        terminalreporter.write_line(navigation_metrics.format_summary())
+        navigation_metrics.save(NAVIGATION_METRICS_REPORT)
+    caching_proxy = config.stash.get(CACHING_PROXY_KEY, None)
+    if caching_proxy:
+        terminalreporter.write_sep("-", "Caching proxy")
+        terminalreporter.write_line(caching_proxy.format_stats())
+    dependency_recorder = config.stash.get(DEPENDENCY_RECORDER_KEY, None)
+    if dependency_recorder and dependency_recorder.dependencies:
+        dependency_recorder.save(config.getoption("--dependency-map"))
@@ -1,6 +1,12 @@
 """Constants"""
+import os
+
+# Artifacts directory, set per browser by the matrix runner
+RESULTS_DIR = os.environ.get("TEST_RESULTS_DIR", "test-results")
 HOME_PAGE_TITLE = "Booking.com | Official site | The best hotels, flights, car rentals & accommodations"
 YMD_DATE_FORMAT = "%Y-%m-%d"
 DAY_MONTH_FORMAT = "%a, %b"
 DATE_SINGLE_DIGIT_FORMAT = '%e'
-
+AUTOCOMPLETE_REQUEST_PATTERN = "autocomplete"
+SEARCH_RESULTS_REQUEST_PATTERN = "graphql|searchresults"
+NETWORK_QUIET_MS = 500
@@ -0,0 +1,117 @@
+"""Action Batch to perform the pointer and keyboard steps of a UI gesture in one W3C Actions command"""
+
+from typing import TYPE_CHECKING, List, Tuple, Union
+
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions as EC
+
+if TYPE_CHECKING:
+    from helpers.driver_manager import WebDriverOps
+
+
+class ActionBatch:
+    """Pointer and keyboard steps of a UI gesture performed as one W3C Actions sequence
+
+    Elements are waited for when steps are added, `perform()` then sends all steps in one command.
+    """
+
+    def __init__(self, webdriver_ops: "WebDriverOps"):
+        self.webdriver_ops = webdriver_ops
+        self.actions = ActionChains(webdriver_ops.driver)
+        self.steps: List[str] = []
+        platform = webdriver_ops.driver.capabilities.get("platformName", "") or ""
+        self.select_all_key = Keys.COMMAND if platform.lower().startswith("mac") else Keys.CONTROL
+
+    def _element(self, locator, elem_name, replace_value, condition, wait_time) -> Tuple[WebElement, str]:
+        locator, elem_name = self.webdriver_ops.get_element_name_locator(
+            locator, elem_name, replace_value
+        )
+        element = self.webdriver_ops.wait_for_element_condition(
+            locator, elem_name, condition, wait_time
+        )
+        return element, elem_name
+
+    def click(
+        self,
+        locator: Tuple[By, str],
+        elem_name: str,
+        replace_value: Union[str, List, Tuple] = None,
+        wait_time: float = None,
+        xoffset: int = None,
+        yoffset: int = 0,
+    ) -> "ActionBatch":
+        """Move to the element, or to an offset from its center, and click it
+
+        Args:
+            locator (Tuple): Tuple with locator type and locator string.
+            elem_name (str): description of the element.
+            replace_value (str | list, optional): values to replace in the locator. Defaults to None.
+            wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
+            xoffset (int, optional): X offset from the element center. Defaults to the center.
+            yoffset (int, optional): Y offset from the element center. Defaults to 0.
+
+        Returns:
+            ActionBatch: self
+        """
+        element, elem_name = self._element(
+            locator, elem_name, replace_value, EC.element_to_be_clickable, wait_time
+        )
+        if xoffset is None:
+            self.actions.move_to_element(element)
+        else:
+            self.actions.move_to_element_with_offset(element, xoffset, yoffset)
+        self.actions.click()
+        self.steps.append(
+            f"click {elem_name}"
+            + (f" by offset {[xoffset, yoffset]}" if xoffset is not None else "")
+        )
+        return self
+
+    def enter_text(
+        self,
+        locator: Tuple[By, str],
+        value: str,
+        elem_name: str,
+        replace_value: Union[str, List, Tuple] = None,
+        wait_time: float = None,
+    ) -> "ActionBatch":
+        """Focus the element, replace its text with select all and type value
+
+        Args:
+            locator (Tuple): Tuple with locator type and locator string.
+            value (str): value to type inside input
+            elem_name (str): description of the element.
+            replace_value (str | list, optional): values to replace in the locator. Defaults to None.
+            wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
+
+        Returns:
+            ActionBatch: self
+        """
+        element, elem_name = self._element(
+            locator, elem_name, replace_value, EC.visibility_of_element_located, wait_time
+        )
+        self.actions.click(element)
+        self.actions.key_down(self.select_all_key).send_keys("a").key_up(self.select_all_key)
+        self.actions.send_keys(Keys.BACKSPACE, value)
+        self.steps.append(f"enter text {value} in {elem_name}")
+        return self
+
+    def send_keys(self, *keys: str) -> "ActionBatch":
+        """Type keys into the focused element"""
+        self.actions.send_keys(*keys)
+        self.steps.append("send keys")
+        return self
+
+    def pause(self, seconds: float) -> "ActionBatch":
+        """Pause between steps, e.g. for an animation"""
+        self.actions.pause(seconds)
+        self.steps.append(f"pause {seconds}s")
+        return self
+
+    def perform(self):
+        """Perform all steps in one W3C Actions command"""
+        self.actions.perform()
+        self.webdriver_ops.log.info("Performed %s action steps: %s", len(self.steps), ", ".join(self.steps))
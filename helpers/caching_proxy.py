@@ -0,0 +1,430 @@
+"""Caching Proxy to serve immutable static assets from a size bounded disk cache across runs
+
+Usage: python -m helpers.caching_proxy [--port PORT] [--cache-dir DIR] [--max-mb MB] [--static-host PATTERN ...]
+HTTPS static hosts are intercepted with certificates of a generated authority (needs `cryptography`),
+browsers trust only that authority by its public key hash. All other requests and HTTPS tunnels are passed
+through unchanged.
+"""
+
+import argparse
+import base64
+import datetime
+import fnmatch
+import hashlib
+import http.client
+import json
+import logging
+import os
+import select
+import socket
+import ssl
+import tempfile
+import threading
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+PROXY_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "bookingdotcom-proxy")
+STATIC_HOSTS = ("*.bstatic.com",)
+# Responses fresh for less than a day are not worth keeping across runs
+MIN_MAX_AGE = 86400
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "proxy-connection",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+}
+
+Headers = List[Tuple[str, str]]
+
+
+def is_cacheable(status: int, headers: Headers) -> bool:
+    """Whether response is a shared, long lived or immutable, successful response"""
+    header_map = {name.lower(): value for name, value in headers}
+    if status != 200 or header_map.get("vary", "").strip() == "*":
+        return False
+    directives = {}
+    for directive in header_map.get("cache-control", "").lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name] = value.strip('"')
+    if {"no-store", "no-cache", "private"} & directives.keys():
+        return False
+    if "immutable" in directives:
+        return True
+    max_age = directives.get("s-maxage") or directives.get("max-age") or "0"
+    return max_age.isdigit() and int(max_age) >= MIN_MAX_AGE
+
+
+class DiskCache:
+    """Responses stored as files, the least recently used are evicted above `max_bytes`
+
+    Recency survives runs through the modification time of the body files.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        entries = []
+        for name in os.listdir(cache_dir):
+            if name.endswith(".body"):
+                stats = os.stat(os.path.join(cache_dir, name))
+                entries.append((stats.st_mtime, name[: -len(".body")], stats.st_size))
+        self.entries: "OrderedDict[str, int]" = OrderedDict(
+            (key, size) for _, key, size in sorted(entries)
+        )
+        self.size = sum(self.entries.values())
+        with self.lock:
+            self._evict()
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        path = os.path.join(self.cache_dir, key)
+        return path + ".json", path + ".body"
+
+    def get(self, key: str) -> Optional[Tuple[int, Headers, bytes]]:
+        """Get cached status, headers and body, None on cache miss"""
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+            os.utime(body_path)
+        except (OSError, ValueError):
+            # Evicted meanwhile or incomplete
+            return None
+        return meta["status"], [tuple(header) for header in meta["headers"]], body
+
+    def put(self, key: str, url: str, status: int, headers: Headers, body: bytes):
+        """Store response and evict least recently used responses above max size"""
+        if len(body) > self.max_bytes:
+            return
+        meta_path, body_path = self._paths(key)
+        for path, content in (
+            (body_path, body),
+            (meta_path, json.dumps({"url": url, "status": status, "headers": headers}).encode("utf-8")),
+        ):
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        with self.lock:
+            self.size += len(body) - self.entries.pop(key, 0)
+            self.entries[key] = len(body)
+            self._evict()
+
+    def _evict(self):
+        """Remove least recently used responses until cache fits max size, lock must be held"""
+        while self.size > self.max_bytes:
+            evicted, size = self.entries.popitem(last=False)
+            self.size -= size
+            for path in self._paths(evicted):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+class CertificateAuthority:
+    """Certificate authority generated per proxy run to sign certificates of intercepted hosts
+
+    `spki_hash` is the base64 SHA-256 of its public key, as Chromium `--ignore-certificate-errors-spki-list`
+    expects, so browsers trust this authority only instead of accepting any certificate.
+
+    Raises:
+        ImportError: if cryptography is not installed
+    """
+
+    def __init__(self, cert_dir: str):
+        # pylint:disable=C0415,E0401
+        from cryptography import x509
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.x509.oid import NameOID
+
+        self.x509, self.hashes, self.serialization, self.ec, self.name_oid = (
+            x509,
+            hashes,
+            serialization,
+            ec,
+            NameOID,
+        )
+        self.cert_dir = cert_dir
+        self.lock = threading.Lock()
+        self.contexts: Dict[str, ssl.SSLContext] = {}
+        self.key = ec.generate_private_key(ec.SECP256R1())
+        self.name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Caching Proxy CA")])
+        self.cert = (
+            self._builder(self.name, self.key.public_key())
+            .add_extension(x509.BasicConstraints(ca=True, path_length=0), critical=True)
+            .sign(self.key, hashes.SHA256())
+        )
+        spki = self.key.public_key().public_bytes(
+            serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        self.spki_hash = base64.b64encode(hashlib.sha256(spki).digest()).decode("ascii")
+
+    def _builder(self, subject, public_key):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return (
+            self.x509.CertificateBuilder()
+            .subject_name(subject)
+            .issuer_name(self.name)
+            .public_key(public_key)
+            .serial_number(self.x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=30))
+        )
+
+    def context(self, host: str) -> ssl.SSLContext:
+        """TLS server context with a certificate of host signed by this authority"""
+        with self.lock:
+            if host not in self.contexts:
+                key = self.ec.generate_private_key(self.ec.SECP256R1())
+                subject = self.x509.Name([self.x509.NameAttribute(self.name_oid.COMMON_NAME, host)])
+                cert = (
+                    self._builder(subject, key.public_key())
+                    .add_extension(self.x509.SubjectAlternativeName([self.x509.DNSName(host)]), critical=False)
+                    .sign(self.key, self.hashes.SHA256())
+                )
+                cert_path = os.path.join(self.cert_dir, f"{host}.pem")
+                with open(cert_path, "wb") as f:
+                    f.write(cert.public_bytes(self.serialization.Encoding.PEM))
+                    f.write(self.cert.public_bytes(self.serialization.Encoding.PEM))
+                    f.write(
+                        key.private_bytes(
+                            self.serialization.Encoding.PEM,
+                            self.serialization.PrivateFormat.PKCS8,
+                            self.serialization.NoEncryption(),
+                        )
+                    )
+                context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+                context.load_cert_chain(cert_path)
+                self.contexts[host] = context
+            return self.contexts[host]
+
+
+class CachingProxyHandler(BaseHTTPRequestHandler):
+    """Proxies requests, GET requests of static hosts are served from the disk cache"""
+
+    protocol_version = "HTTP/1.1"
+    proxy: "CachingProxy" = None
+    # Origin of requests received inside an intercepted HTTPS tunnel
+    tunnel_origin: str = None
+
+    def log_message(self, format, *args):  # pylint:disable=W0622
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_CONNECT(self):  # pylint:disable=C0103
+        """Intercept HTTPS of static hosts, tunnel everything else"""
+        host, _, port = self.path.rpartition(":")
+        if self.proxy.is_static_host(host):
+            self.send_response(200, "Connection Established")
+            self.end_headers()
+            tls_connection = self.proxy.authority.context(host).wrap_socket(
+                self.connection, server_side=True
+            )
+            handler = type(self)
+            tunnel_handler = type(handler.__name__, (handler,), {"tunnel_origin": f"https://{self.path}"})
+            tunnel_handler(tls_connection, self.client_address, self.server)
+        else:
+            self.tunnel(host, int(port or 443))
+        self.close_connection = True
+
+    def tunnel(self, host: str, port: int):
+        """Relay bytes between client and origin until either side closes"""
+        try:
+            upstream = socket.create_connection((host, port), timeout=30)
+        except OSError as e:
+            self.send_error(502, f"Tunnel to {host}:{port} failed : {e}")
+            return
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        with upstream:
+            sockets = [self.connection, upstream]
+            while True:
+                readable, _, failed = select.select(sockets, [], sockets, 60)
+                if failed or not readable:
+                    return
+                for source in readable:
+                    data = source.recv(65536)
+                    if not data:
+                        return
+                    (upstream if source is self.connection else self.connection).sendall(data)
+
+    def proxy_request(self):
+        """Serve request from cache or origin"""
+        url = self.path if self.path.startswith(("http://", "https://")) else self.tunnel_origin + self.path
+        parts = urlsplit(url)
+        body = self.read_body()
+        cache_key = None
+        if self.command == "GET" and self.proxy.is_static_host(parts.hostname):
+            cache_key = hashlib.sha256(
+                f"{url} {self.headers.get('Accept-Encoding', '')}".encode("utf-8")
+            ).hexdigest()
+            cached = self.proxy.cache.get(cache_key)
+            if cached:
+                self.respond(*cached, "HIT")
+                return
+        status, headers, response_body = self.fetch(parts, body)
+        if cache_key and is_cacheable(status, headers):
+            self.proxy.cache.put(cache_key, url, status, headers, response_body)
+        self.respond(status, headers, response_body, "MISS" if cache_key else "PASS")
+
+    def read_body(self) -> bytes:
+        """Read request body sent with Content-Length or chunked transfer encoding"""
+        if "chunked" not in self.headers.get("Transfer-Encoding", "").lower():
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";", 1)[0].strip() or b"0", 16)
+            if not size:
+                break
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+        # Trailer fields end with an empty line
+        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+            pass
+        return b"".join(chunks)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_PATCH = do_DELETE = do_OPTIONS = proxy_request  # pylint:disable=C0103
+
+    def fetch(self, parts, body: bytes) -> Tuple[int, Headers, bytes]:
+        """Send request to origin and read the whole response"""
+        if parts.scheme == "https":
+            connection = http.client.HTTPSConnection(
+                parts.hostname, parts.port or 443, timeout=60, context=ssl.create_default_context()
+            )
+        else:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        headers = {
+            name: value for name, value in self.headers.items() if name.lower() not in HOP_BY_HOP_HEADERS
+        }
+        try:
+            connection.request(self.command, path, body=body or None, headers=headers)
+            response = connection.getresponse()
+            response_body = response.read()
+            response_headers = [
+                (name, value)
+                for name, value in response.getheaders()
+                if name.lower() not in HOP_BY_HOP_HEADERS
+            ]
+            return response.status, response_headers, response_body
+        except (OSError, http.client.HTTPException) as e:
+            logger.warning("Proxy request to %s failed : %s", parts.geturl(), e)
+            return 502, [("Content-Type", "text/plain")], str(e).encode("utf-8")
+        finally:
+            connection.close()
+
+    def respond(self, status: int, headers: Headers, body: bytes, cache_status: str):
+        """Send response with its length and cache status"""
+        self.send_response(status)
+        for name, value in headers:
+            if name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Cache", cache_status)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+
+class CachingProxy:
+    """Caching proxy served from a background thread
+
+    Raises:
+        ImportError: if cryptography is not installed
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        cache_dir: str = None,
+        max_bytes: int = 500 * 1024 * 1024,
+        static_hosts: Tuple[str, ...] = STATIC_HOSTS,
+    ):
+        self.cache = DiskCache(cache_dir or PROXY_CACHE_DIR, max_bytes)
+        self.static_hosts = static_hosts
+        try:
+            self.authority = CertificateAuthority(tempfile.mkdtemp(prefix="proxy-certs-"))
+        except ImportError as e:
+            raise ImportError("Caching proxy requires cryptography: pip install cryptography") from e
+        handler = type("Handler", (CachingProxyHandler,), {"proxy": self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="caching-proxy", daemon=True
+        )
+
+    @property
+    def address(self) -> str:
+        """host:port of the proxy for browsers, the host name when listening on all interfaces"""
+        host, port = self.server.server_address[:2]
+        return f"{socket.gethostname() if host in ('0.0.0.0', '') else host}:{port}"  # nosec B104
+
+    def is_static_host(self, host: str) -> bool:
+        """Whether responses of host may be cached, HTTPS of static hosts is intercepted"""
+        return bool(host) and any(fnmatch.fnmatch(host, pattern) for pattern in self.static_hosts)
+
+    def format_stats(self) -> str:
+        """Cache hits, misses and size"""
+        return (
+            f"Caching proxy: {self.cache.hits} hits, {self.cache.misses} misses, "
+            f"{len(self.cache.entries)} responses ({self.cache.size / 1024 / 1024:.1f} MB) cached"
+        )
+
+    def start(self) -> "CachingProxy":
+        """Start serving requests"""
+        self.thread.start()
+        logger.info("Caching proxy is served at %s, cache at Location : %s", self.address, self.cache.cache_dir)
+        return self
+
+    def stop(self):
+        """Stop serving requests and log cache stats"""
+        self.server.shutdown()
+        self.server.server_close()
+        logger.info(self.format_stats())
+
+
+def main():
+    """Serve caching proxy until interrupted"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--cache-dir", default=PROXY_CACHE_DIR)
+    parser.add_argument("--max-mb", type=int, default=500, help="Max disk cache size")
+    parser.add_argument(
+        "--static-host", nargs="+", default=list(STATIC_HOSTS), help="Host patterns whose responses are cached"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    proxy = CachingProxy(args.host, args.port, args.cache_dir, args.max_mb * 1024 * 1024, tuple(args.static_host))
+    print(f"Serving caching proxy at {proxy.start().address}, press Ctrl+C to stop")
+    try:
+        proxy.thread.join()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.stop()
+
+
+if __name__ == "__main__":
+    main()
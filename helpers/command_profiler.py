@@ -0,0 +1,164 @@
+"""Command Profiler to time every WebDriver wire command and attribute it to the step which issued it"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Command executor wrappers are not steps
+EXCLUDED_FILES = (
+    os.path.abspath(__file__),
+    os.path.join(PROJECT_DIR, "helpers", "webdriver_trace.py"),
+)
+
+
+def _is_step_frame(filename: str, qualname: str) -> bool:
+    """Check frame is a test, fixture, page object or WebDriverOps step of this project"""
+    return (
+        filename.startswith(PROJECT_DIR)
+        and "site-packages" not in filename
+        and filename not in EXCLUDED_FILES
+        and "<locals>" not in qualname
+    )
+
+
+def get_step_stack() -> List[str]:
+    """Get project steps of current call stack, outermost first
+
+    Returns:
+        list: Qualified names of test, page object and WebDriverOps functions on the stack
+    """
+    steps = []
+    frame = sys._getframe(1)  # pylint:disable=W0212
+    while frame is not None:
+        code = frame.f_code
+        qualname = getattr(code, "co_qualname", code.co_name)
+        if _is_step_frame(code.co_filename, qualname):
+            steps.append(qualname)
+        frame = frame.f_back
+    return steps[::-1]
+
+
+class ProfilingConnection:
+    """Command executor wrapper which times every command sent to the remote end"""
+
+    def __init__(self, connection, profiler: "CommandProfiler"):
+        self.wrapped = connection
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def execute(self, command: str, params: dict):
+        """Execute command and record its duration against the issuing steps"""
+        stack = get_step_stack()
+        start = time.perf_counter()
+        try:
+            return self.wrapped.execute(command, params)
+        finally:
+            self.profiler.record(stack, command, time.perf_counter() - start)
+
+
+class CommandProfiler:
+    """Profile WebDriver commands per test as call tree and flame graph folded stacks
+
+    The current test and its stacks are kept per thread, session totals are shared by all threads.
+    """
+
+    def __init__(self):
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.totals: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])
+
+    @property
+    def test_name(self) -> str:
+        """Test profiled on the current thread"""
+        return getattr(self.local, "test_name", "session")
+
+    @property
+    def stacks(self) -> Dict[Tuple[str, ...], List[float]]:
+        """Command count and time per call stack of the test profiled on the current thread"""
+        if not hasattr(self.local, "stacks"):
+            self.local.stacks = defaultdict(lambda: [0, 0.0])
+        return self.local.stacks
+
+    def attach(self, driver: "WebDriver"):
+        """Profile all commands of the driver session"""
+        driver.command_executor = ProfilingConnection(driver.command_executor, self)
+
+    def record(self, stack: List[str], command: str, duration: float):
+        """Record command duration for the call stack"""
+        stat = self.stacks[tuple(stack) + (command,)]
+        stat[0] += 1
+        stat[1] += duration
+        step = stack[-1] if stack else command
+        with self.lock:
+            total = self.totals[f"{step} -> {command}"]
+            total[0] += 1
+            total[1] += duration
+
+    def start(self, test_name: str):
+        """Start profiling commands of a test"""
+        self.local.test_name = test_name
+        self.stacks.clear()
+
+    def format_call_tree(self) -> str:
+        """Format recorded stacks as call tree with command count and time per node"""
+        tree = {}
+        for stack, (count, duration) in self.stacks.items():
+            node = tree
+            for frame in stack:
+                child = node.setdefault(frame, {"count": 0, "time": 0.0, "children": {}})
+                child["count"] += count
+                child["time"] += duration
+                node = child["children"]
+
+        lines = []
+
+        def add_lines(nodes: dict, depth: int):
+            for name, node in sorted(nodes.items(), key=lambda item: -item[1]["time"]):
+                lines.append(
+                    f"{'  ' * depth}{name}  [{node['count']} commands, {node['time'] * 1000:.1f} ms]"
+                )
+                add_lines(node["children"], depth + 1)
+
+        add_lines(tree, 0)
+        return "\n".join(lines)
+
+    def finish(self, output_dir: str):
+        """Write call tree and flame graph folded stacks of the current test
+
+        Args:
+            output_dir (str): Directory for `<test>.tree.txt` and `<test>.folded` files
+        """
+        if not self.stacks:
+            return
+        os.makedirs(output_dir, exist_ok=True)
+        file_name = re.sub(r"[^\w.-]+", "_", self.test_name)
+        with open(os.path.join(output_dir, file_name + ".folded"), "w", encoding="utf-8") as f:
+            for stack, (_, duration) in self.stacks.items():
+                f.write(f"{';'.join(stack)} {round(duration * 1_000_000)}\n")
+        tree_path = os.path.join(output_dir, file_name + ".tree.txt")
+        with open(tree_path, "w", encoding="utf-8") as f:
+            f.write(self.format_call_tree() + "\n")
+        logger.info("Command profile saved at Location : %s", tree_path)
+        self.stacks.clear()
+
+    def format_top_steps(self, top: int = 15) -> str:
+        """Format steps issuing the most commands across the session"""
+        lines = [f"{'Commands':>9} {'Time ms':>10}  Step -> Command"]
+        with self.lock:
+            ranked = sorted(self.totals.items(), key=lambda item: -item[1][0])[:top]
+        for name, (count, duration) in ranked:
+            lines.append(f"{count:>9} {duration * 1000:>10.1f}  {name}")
+        return "\n".join(lines)
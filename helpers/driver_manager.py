@@ -2,27 +2,61 @@
 
 import base64
 import functools
+import gzip
 import logging
 import os
+import time
 from datetime import datetime
 from typing import List, Tuple, Union
 
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.proxy import Proxy, ProxyType
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.wait import WebDriverWait
 
-from locators.home_page_locators import dismiss_sign_in_popup_button
+import constants
+from helpers import utils
+from helpers.action_batch import ActionBatch
+from helpers.element_cache import CSS_SELECTOR_FORMATS, IS_DISPLAYED_ATOM, ElementCache
+from helpers.locator_profiler import LocatorProfiler, to_css_locator
+from helpers.network_tracker import Checkpoint, NetworkTracker
+from helpers.page_snapshot import SnapshotCheck, evaluate_checks
+from helpers.timeout_history import TimeoutHistory, template_key
 
 logger = logging.getLogger(__name__)
 
-SCREENSHOTS_DIR = os.path.join("test-results", "screenshots")
-os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+# Element state checks which satisfy a wait condition for a cached element
+CACHEABLE_CONDITIONS = {
+    EC.presence_of_element_located: (),
+    EC.visibility_of_element_located: ("displayed",),
+    EC.element_to_be_clickable: ("displayed", "enabled"),
+}
+
+COUNT_VISIBLE_ELEMENTS_SCRIPT = """
+const isXPath = arguments[0], selector = arguments[1], withElements = arguments[2];
+let elements = [];
+if (isXPath) {
+    const result = document.evaluate(
+        selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    for (let i = 0; i < result.snapshotLength; i++) {
+        elements.push(result.snapshotItem(i));
+    }
+} else {
+    elements = Array.from(document.querySelectorAll(selector));
+}
+const isDisplayed = __IS_DISPLAYED_ATOM__;
+const visible = elements.filter((el) => isDisplayed.apply(null, [el]));
+return [elements.length, visible.length, withElements ? visible : null];
+""".replace("__IS_DISPLAYED_ATOM__", IS_DISPLAYED_ATOM)
+
+SCREENSHOTS_DIR = os.path.join(constants.RESULTS_DIR, "screenshots")
+PAGE_SOURCES_DIR = os.path.join(constants.RESULTS_DIR, "page-sources")
 
 
 def add_chromium_options(options, width, height, headless):
@@ -37,8 +71,56 @@ def add_chromium_options(options, width, height, headless):
         options.add_argument("--start-maximized")
 
 
-def get_driver(browser="chrome", headless=None, grid_url=None):
-    """To create and get webdriver"""
+def add_profile_option(options, browser, profile_dir):
+    """Add User Data / Profile Directory Option when profile_dir is set"""
+    if not profile_dir:
+        return
+    if browser == "firefox":
+        options.add_argument("-profile")
+        options.add_argument(profile_dir)
+    else:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+
+
+def add_proxy_option(options, browser, proxy_address, proxy_ca_spki=None):
+    """Add Proxy Option when proxy_address is set
+
+    Chromium browsers trust the authority of HTTPS hosts intercepted by the proxy by its public key hash
+    `proxy_ca_spki`. Firefox has no such option, it is not routed through an intercepting proxy.
+    """
+    if not proxy_address:
+        return
+    if proxy_ca_spki and browser == "firefox":
+        logger.warning("Firefox can not trust the proxy certificate authority, it is not routed through the proxy")
+        return
+    options.proxy = Proxy(
+        {"proxyType": ProxyType.MANUAL, "httpProxy": proxy_address, "sslProxy": proxy_address}
+    )
+    # Loopback is bypassed by default, a local origin has to go through the proxy too
+    if browser == "firefox":
+        options.set_preference("network.proxy.allow_hijacking_localhost", True)
+    else:
+        options.add_argument("--proxy-bypass-list=<-loopback>")
+        if proxy_ca_spki:
+            options.add_argument(f"--ignore-certificate-errors-spki-list={proxy_ca_spki}")
+
+
+def get_driver(
+    browser="chrome",
+    headless=None,
+    grid_url=None,
+    network_events=False,
+    profile_dir=None,
+    proxy_address=None,
+    proxy_ca_spki=None,
+):
+    """To create and get webdriver
+
+    `network_events` records CDP Network events in the performance log of Chromium browsers
+    for network idle waits. `profile_dir` starts the browser with that user data / profile directory.
+    `proxy_address` (host:port) routes HTTP and HTTPS of the browser through that proxy, whose certificate
+    authority is trusted by its public key hash `proxy_ca_spki`.
+    """
     driver = None
     browser = browser.lower()
     width, height = 1920, 1080
@@ -63,6 +145,15 @@ def get_driver(browser="chrome", headless=None, grid_url=None):
     else:
         raise ValueError("Unsupported browser name " + browser)
 
+    add_profile_option(options, browser, profile_dir)
+    add_proxy_option(options, browser, proxy_address, proxy_ca_spki)
+
+    if network_events and browser in ("chrome", "edge"):
+        options.set_capability(
+            "goog:loggingPrefs" if browser == "chrome" else "ms:loggingPrefs",
+            {"performance": "ALL"},
+        )
+
     if grid_url:
         driver = webdriver.Remote(command_executor=grid_url, options=options)
     else:
@@ -76,25 +167,32 @@ def get_driver(browser="chrome", headless=None, grid_url=None):
     return driver
 
 
-def capture_screenshot(driver: WebDriver, screenshot_name: str) -> str:
+def capture_screenshot(
+    driver: WebDriver, screenshot_name: str, return_base64: bool = True
+) -> str:
     """Allow to capture screenshot
 
     Args:
         driver (WebDriver): WebDriver instance
         screenshot_name (str): Screenshot name prefix
+        return_base64 (bool, optional): Return base64 string else saved file path. Defaults to True.
 
     Returns:
-        str: Screenshot base64 string
+        str: Screenshot base64 string or file path
     """
+    screenshots_dir = utils.thread_artifact_dir(SCREENSHOTS_DIR)
+    os.makedirs(screenshots_dir, exist_ok=True)
     time_stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     screenshot_path = os.path.join(
-        SCREENSHOTS_DIR, f"{screenshot_name}_{time_stamp}.png"
+        screenshots_dir, f"{screenshot_name}_{time_stamp}.png"
     )
 
     browser = driver.capabilities["browserName"].lower()
     if browser == "firefox":
         driver.save_full_page_screenshot(screenshot_path)
-        screenshot_base64 = driver.get_full_page_screenshot_as_base64()
+        screenshot_base64 = (
+            driver.get_full_page_screenshot_as_base64() if return_base64 else None
+        )
     else:
         metrics = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
         width = metrics["contentSize"]["width"]
@@ -133,24 +231,135 @@ def capture_screenshot(driver: WebDriver, screenshot_name: str) -> str:
 
     logger.info("Screenshot saved at Location : %s", screenshot_path)
 
-    return screenshot_base64
+    return screenshot_base64 if return_base64 else screenshot_path
+
 
+def capture_page_source(driver: WebDriver, page_source_name: str) -> str:
+    """Save page source as gzip compressed HTML snapshot, e.g. for offline locator validation
 
-class WebDriverOps:
+    Args:
+        driver (WebDriver): WebDriver instance
+        page_source_name (str): Page source file name prefix
+
+    Returns:
+        str: Page source file path
+    """
+    time_stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    page_sources_dir = utils.thread_artifact_dir(PAGE_SOURCES_DIR)
+    os.makedirs(page_sources_dir, exist_ok=True)
+    page_source_path = os.path.join(
+        page_sources_dir, f"{page_source_name}_{time_stamp}.html.gz"
+    )
+    with gzip.open(page_source_path, "wt", encoding="utf-8") as f:
+        f.write(driver.page_source)
+    logger.info("Page source saved at Location : %s", page_source_path)
+    return page_source_path
+
+
+# Page objects use WebDriverOps as their one facade of browser actions, the session state it keeps (waits,
+# caches, profilers, network tracker) is shared by those actions, so it is kept a single class on purpose
+class WebDriverOps:  # pylint:disable=R0902,R0904
     """WebDriver Actions class with Browser Actions functions"""
 
     wait: WebDriverWait
     wait_msg = "Element {} with Locator {}"
 
-    def __init__(self, driver: WebDriver, timeout=60):
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout=60,
+        css_rewrite=True,
+        locator_profiler: LocatorProfiler = None,
+        timeout_history: TimeoutHistory = None,
+    ):
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.timeout = timeout
+        # Recording / replaying drivers provide a trace aware wait
+        self.wait_class = getattr(driver, "wait_class", WebDriverWait)
+        self.wait = self.wait_class(driver, timeout)
+        self.element_cache = ElementCache(driver)
+        self._network = None
+        self.css_rewrite = css_rewrite
+        self.locator_profiler = locator_profiler
+        self.timeout_history = timeout_history
+        # Resolved locator to its template key in timeout history
+        self.locator_templates = {}
+        self.sign_in_popup_dismissed = False
+        # Sessions may run concurrently on threads, every log line names its session
+        self.log = utils.SessionLogger(logger, {"session": (getattr(driver, "session_id", None) or "-")[:8]})
 
     def goto_url(self, url: str):
         """Navigate to URL"""
-        logger.info("Launching URL %s", url)
+        self.log.info("Launching URL %s", url)
+        self.element_cache.invalidate()
         self.driver.get(url)
 
+    def get_wait(
+        self,
+        wait_time: float = None,
+        poll_frequency: float = None,
+    ) -> WebDriverWait:
+        """Get WebDriverWait for custom wait time or poll frequency
+
+        Args:
+            wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
+            poll_frequency (float, optional): seconds between condition checks, Defaults to Selenium default.
+
+        Returns:
+            WebDriverWait: WebDriverWait instance
+        """
+        if not wait_time and not poll_frequency:
+            return self.wait
+        kwargs = {"poll_frequency": poll_frequency} if poll_frequency else {}
+        return self.wait_class(self.driver, wait_time or self.timeout, **kwargs)
+
+    @property
+    def network(self) -> NetworkTracker:
+        """Network tracker of the browser session, created on first use"""
+        if self._network is None:
+            self._network = NetworkTracker(self.driver)
+        return self._network
+
+    def network_checkpoint(self) -> Checkpoint:
+        """Mark the point after which requests are awaited by `wait_for_network_idle`,
+        take it right before the action which triggers the requests
+
+        Returns:
+            Checkpoint: Network checkpoint
+        """
+        return self.network.checkpoint()
+
+    def wait_for_network_idle(
+        self,
+        quiet_ms: float = 500,
+        match: str = None,
+        since: Checkpoint = None,
+        wait_time: float = None,
+    ):
+        """Wait for a matching fetch/XHR request to be made, then for none in flight and none finished
+        for `quiet_ms`
+
+        Args:
+            quiet_ms (float, optional): Quiet period in milliseconds. Defaults to 500.
+            match (str, optional): Regex pattern of request URLs to wait for. Defaults to all requests.
+            since (Checkpoint, optional): Only wait for requests made after checkpoint. Defaults to all requests.
+            wait_time (float, optional): custom wait time, Default driver default wait time.
+
+        Raises:
+            TimeoutException : if no matching request is made or network is not idle in a wait time.
+        """
+        try:
+            self.get_wait(wait_time, poll_frequency=0.1).until(
+                lambda _: self.network.is_idle(quiet_ms, match, since),
+                f"Network requests matching {match} are not idle for {quiet_ms} ms",
+            )
+        except TimeoutException as ex:
+            started, _, _ = self.network.status(match, since)
+            if not started:
+                raise TimeoutException(f"No network request matching {match} was made") from ex
+            raise
+        self.log.info("Network requests matching %s are idle for %s ms", match, quiet_ms)
+
     def wait_for_page_title_contains(self, title: str):
         """Wait for page title to contains given page title
 
@@ -168,10 +377,12 @@ class WebDriverOps:
 
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
+            # Page locators are imported once a page is used, not when helpers are imported
+            from locators.home_page_locators import (  # pylint:disable=C0415
+                dismiss_sign_in_popup_button,
+            )
 
-            if not getattr(
-                self, "sign_in_popup_dismissed", False
-            ) and self.is_element_present(
+            if not self.sign_in_popup_dismissed and self.is_element_present(
                 dismiss_sign_in_popup_button, "Sign in Pop up dismiss Icon", wait_time=1
             ):
                 element = self.wait_for_element_condition(
@@ -180,7 +391,7 @@ class WebDriverOps:
                     EC.element_to_be_clickable,
                 )
                 element.click()
-                logger.info("Closed Sign In Popup")
+                self.log.info("Closed Sign In Popup")
                 self.sign_in_popup_dismissed = True  # Mark as dismissed
             return func(self, *args, **kwargs)
 
@@ -194,21 +405,59 @@ class WebDriverOps:
     ) -> Tuple[Tuple[By, str], str]:
         """Get element and locator name
 
+        Document-wide XPath locators are resolved to the equivalent CSS selector when `css_rewrite` is enabled.
+
         Args:
             locator (Tuple): Tuple with locator type and locator string.
             elem_name (str): description of the element.
-            wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
+            replace_value (str | list, optional): values to replace in the locator. Defaults to None.
 
         Returns:
             Tuple: Tuple of updated locator with replace value and updated
         """
+        template = locator
         if replace_value is not None:
             if not isinstance(replace_value, (list, Tuple)):
                 replace_value = [replace_value]
             locator = locator[0], locator[1].format(*replace_value)
             elem_name += f" with replace value {replace_value}"
+        if self.locator_profiler:
+            self.locator_profiler.measure(self.driver, template, locator, elem_name)
+        if self.css_rewrite:
+            locator = to_css_locator(locator)
+        if self.timeout_history:
+            self.locator_templates[locator] = template_key(template)
         return locator, elem_name
 
+    def wait_until(
+        self,
+        locator: Tuple[By, str],
+        method: callable,
+        message: str,
+        wait_time: float = None,
+    ):
+        """Wait until method returns a truthy value, by default for the adaptive timeout of the locator
+        template when timeout history is enabled, and record the wait duration
+
+        Args:
+            locator (Tuple): Tuple with resolved locator type and locator string.
+            method (callable): Wait condition called with driver
+            message (str): Timeout exception message
+            wait_time (float, optional): custom wait time for the elements, Default adaptive or driver default wait time.
+
+        Returns:
+            Any: Return value of method
+        """
+        key = self.locator_templates.get(locator) if self.timeout_history else None
+        if key is None:
+            return self.get_wait(wait_time).until(method, message)
+        if not wait_time:
+            wait_time = self.timeout_history.timeout_for(key, self.timeout)
+        start = time.perf_counter()
+        value = self.get_wait(wait_time).until(method, message)
+        self.timeout_history.record(key, time.perf_counter() - start)
+        return value
+
     def wait_for_element_condition(
         self,
         locator: Tuple[By, str],
@@ -218,6 +467,9 @@ class WebDriverOps:
     ) -> WebElement:
         """Wait for element condition
 
+        Elements located for presence, visibility or clickability are cached and reused without a find
+        while the DOM generation is unchanged and they are still the first match of the locator.
+
         Args:
             locator (Tuple): Tuple with locator type and locator string.
             elem_name (str): description of the element.
@@ -226,10 +478,22 @@ class WebDriverOps:
         Returns:
             WebElement : WebElement once it is located and visible
         """
-        ele_wait = WebDriverWait(self.driver, wait_time) if wait_time else self.wait
-        elem = ele_wait.until(
-            condition(locator), self.wait_msg.format(elem_name, locator)
+        checks = CACHEABLE_CONDITIONS.get(condition)
+        cache_key = ElementCache.key(locator)
+        if checks is not None:
+            elem, state = self.element_cache.read(cache_key)
+            if elem is not None and all(state[check] for check in checks):
+                return elem
+            if self.element_cache.cacheable(cache_key):
+                self.element_cache.prepare()
+        elem = self.wait_until(
+            locator,
+            condition(locator),
+            self.wait_msg.format(elem_name, locator),
+            wait_time,
         )
+        if checks is not None:
+            self.element_cache.put(cache_key, elem)
         return elem
 
     def wait_for_element_to_be_visible(
@@ -250,11 +514,11 @@ class WebDriverOps:
         locator, elem_name = self.get_element_name_locator(
             locator, elem_name, replace_value
         )
-        logger.info("Waiting for element %s to be visible", elem_name)
+        self.log.info("Waiting for element %s to be visible", elem_name)
         self.wait_for_element_condition(
             locator, elem_name, EC.visibility_of_element_located, wait_time
         )
-        logger.info("Element %s is visible", elem_name)
+        self.log.info("Element %s is visible", elem_name)
 
     def is_element_present(
         self,
@@ -287,11 +551,11 @@ class WebDriverOps:
                 locator, elem_name, EC.visibility_of_element_located, wait_time
             )
         except (NoSuchElementException, TimeoutException) as ex:
-            logger.info("Element %s is not present", elem_name)
+            self.log.info("Element %s is not present", elem_name)
             if stop_on_fail:
                 raise ex
             return False
-        logger.info("Element %s is present", elem_name)
+        self.log.info("Element %s is present", elem_name)
         return True
 
     @handle_sign_in_popup
@@ -317,7 +581,7 @@ class WebDriverOps:
             locator, elem_name, EC.element_to_be_clickable, wait_time
         )
         element.click()
-        logger.info("Clicked on the %s", elem_name)
+        self.log.info("Clicked on the %s", elem_name)
 
     @handle_sign_in_popup
     def enter_text(
@@ -328,7 +592,7 @@ class WebDriverOps:
         replace_value: Union[str, List, Tuple] = None,
         wait_time: float = None,
     ):
-        """Type value inside the element
+        """Replace text of the element with value, in one action sequence
 
         Args:
             locator (Tuple): Tuple with locator type and locator string.
@@ -337,15 +601,9 @@ class WebDriverOps:
             replace_value (str | list, optional): values to replace in the locator. Defaults to None.
             wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
         """
-        locator, elem_name = self.get_element_name_locator(
-            locator, elem_name, replace_value
-        )
-        element = self.wait_for_element_condition(
-            locator, elem_name, EC.visibility_of_element_located, wait_time
-        )
-        element.clear()
-        element.send_keys(value)
-        logger.info("Entered text %s in the %s", value, elem_name)
+        ActionBatch(self).enter_text(
+            locator, value, elem_name, replace_value, wait_time
+        ).perform()
 
     @handle_sign_in_popup
     def select_value_from_dropdown(
@@ -374,7 +632,60 @@ class WebDriverOps:
             )
         )
         select.select_by_value((str)(value))
-        logger.info("Selected %s dropdown by value %s", elem_name, value)
+        self.log.info("Selected %s dropdown by value %s", elem_name, value)
+
+    @handle_sign_in_popup
+    def action_batch(self) -> "ActionBatch":
+        """Start collecting pointer and keyboard steps to perform in a single W3C Actions command
+
+        Returns:
+            ActionBatch: Batch to add steps to and `perform()`
+        """
+        return ActionBatch(self)
+
+    def execute_js_script(self, script: str, *args):
+        """Execute JS Script on the page
+
+        Args:
+            script (str): JS script to execute.
+            *args: Script arguments, e.g. WebElements.
+
+        Returns:
+            Value returned by the script
+        """
+        value = self.driver.execute_script(script, *args)
+        self.log.debug("Executed JS Script returned value %s", value)
+        return value
+
+    def execute_async_js_script(self, script: str, *args):
+        """Execute asynchronous JS Script on the page, the script signals completion by calling
+        its last argument with the result
+
+        Args:
+            script (str): JS script to execute.
+            *args: Script arguments, e.g. WebElements.
+
+        Returns:
+            Value passed to completion callback by the script
+        """
+        value = self.driver.execute_async_script(script, *args)
+        self.log.debug("Executed async JS Script returned value %s", value)
+        return value
+
+    def wait_for_element_to_be_stale(
+        self, element: WebElement, elem_name: str, wait_time: float = None
+    ):
+        """Wait for element to be removed from DOM, e.g. when page content is replaced
+
+        Args:
+            element (WebElement): WebElement located before page content is replaced.
+            elem_name (str): description of the element.
+            wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
+        """
+        self.get_wait(wait_time).until(
+            EC.staleness_of(element), f"Element {elem_name} is not removed from page"
+        )
+        self.log.info("Element %s is removed from page", elem_name)
 
     def execute_js_script_on_element(
         self,
@@ -399,7 +710,7 @@ class WebDriverOps:
             locator, elem_name, EC.presence_of_element_located, wait_time
         )
         value = self.driver.execute_script(script, element)
-        logger.info(
+        self.log.info(
             "Executed JS Script on Element %s on returned value %s", elem_name, value
         )
         return value
@@ -424,17 +735,61 @@ class WebDriverOps:
             replace_value (str | list, optional): values to replace in the locator. Defaults to None.
             wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
         """
+        ActionBatch(self).click(
+            locator, elem_name, replace_value, wait_time, xoffset=xoffset, yoffset=yoffset
+        ).perform()
+
+    def count_visible_elements(
+        self,
+        locator: Tuple[By, str],
+        elem_name: str,
+        replace_value: Union[str, List, Tuple] = None,
+        wait_time: float = None,
+        min_count: int = 1,
+        with_elements: bool = False,
+    ) -> Union[int, Tuple[int, List[WebElement]]]:
+        """Wait for at least `min_count` elements, all of them visible, evaluating locator and
+        visibility of every match in a single script per poll
+
+        Args:
+            locator (Tuple): Tuple with locator type and locator string.
+            elem_name (str): description of the element.
+            replace_value (str | list, optional): values to replace in the locator. Defaults to None.
+            wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
+            min_count (int, optional): Minimum number of visible elements to wait for. Defaults to 1.
+            with_elements (bool, optional): Return the visible webelements along with count. Defaults to False.
+
+        Returns
+            int | Tuple: Number of visible webelements, with list of webelements if `with_elements`
+        """
         locator, elem_name = self.get_element_name_locator(
             locator, elem_name, replace_value
         )
-        actions = ActionChains(self.driver)
-        ele = self.wait_for_element_condition(
-            locator, elem_name, EC.element_to_be_clickable, wait_time
-        )
-        actions.move_to_element_with_offset(ele, xoffset, yoffset).click().perform()
-        logger.info(
-            "Moved & Clicked on Element %s by offset %s", elem_name, [xoffset, yoffset]
+        by, value = locator
+        if by != By.XPATH and by not in CSS_SELECTOR_FORMATS:
+            elements = self.wait_until(
+                locator,
+                EC.visibility_of_all_elements_located(locator),
+                self.wait_msg.format(elem_name, locator),
+                wait_time,
+            )
+            return (len(elements), elements) if with_elements else len(elements)
+        selector = value if by == By.XPATH else CSS_SELECTOR_FORMATS[by].format(value)
+
+        def all_visible(_):
+            count, visible, elements = self.driver.execute_script(
+                COUNT_VISIBLE_ELEMENTS_SCRIPT,
+                by == By.XPATH,
+                selector,
+                with_elements,
+            )
+            return min_count <= count == visible and (visible, elements or [])
+
+        visible, elements = self.wait_until(
+            locator, all_visible, self.wait_msg.format(elem_name, locator), wait_time
         )
+        self.log.info("Found %s visible elements %s", visible, elem_name)
+        return (visible, elements) if with_elements else visible
 
     def get_number_of_elements(
         self,
@@ -454,15 +809,30 @@ class WebDriverOps:
         Returns
             int : Number of webelements
         """
-        locator, elem_name = self.get_element_name_locator(
-            locator, elem_name, replace_value
-        )
-        ele_wait = WebDriverWait(self.driver, wait_time) if wait_time else self.wait
-        elements = ele_wait.until(
-            EC.visibility_of_all_elements_located(locator),
-            self.wait_msg.format(elem_name, locator),
+        return self.count_visible_elements(locator, elem_name, replace_value, wait_time)
+
+    def get_elements(
+        self,
+        locator: Tuple[By, str],
+        elem_name: str,
+        replace_value: Union[str, List, Tuple] = None,
+        wait_time: float = None,
+    ) -> List[WebElement]:
+        """To get all visible webelements
+
+        Args:
+            locator (Tuple): Tuple with locator type and locator string.
+            elem_name (str): description of the element.
+            replace_value (str | list, optional): values to replace in the locator. Defaults to None.
+            wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
+
+        Returns
+            list : List of webelements
+        """
+        _, elements = self.count_visible_elements(
+            locator, elem_name, replace_value, wait_time, with_elements=True
         )
-        return len(elements)
+        return elements
 
     def get_element_text(
         self,
@@ -485,7 +855,55 @@ class WebDriverOps:
         locator, elem_name = self.get_element_name_locator(
             locator, elem_name, replace_value
         )
+        _, state = self.element_cache.read(ElementCache.key(locator))
+        if state is not None:
+            return state["text"]
         ele = self.wait_for_element_condition(
             locator, elem_name, EC.presence_of_element_located, wait_time
         )
         return ele.text or ele.get_attribute("textContent")
+
+    def assert_snapshot(
+        self,
+        checks: List[SnapshotCheck],
+        ready: SnapshotCheck = None,
+        scope: SnapshotCheck = None,
+        wait_time: float = None,
+    ):
+        """Wait once for the page to be ready, then evaluate all checks locally against a single
+        transfer of the page source, or of the scope element outerHTML
+
+        Checks only assert presence and text of elements, visibility is asserted for `ready` only.
+
+        Args:
+            checks (list): Locator presence and text checks
+            ready (SnapshotCheck, optional): Element to wait to be visible before snapshot. Defaults to first check.
+            scope (SnapshotCheck, optional): Element to snapshot instead of the whole page. Defaults to None.
+            wait_time (float, optional): custom wait time for the elements, Default driver default wait time.
+
+        Raises:
+            AssertionError: with every failed check
+        """
+        ready = ready or checks[0]
+        self.wait_for_element_to_be_visible(
+            ready.locator, ready.elem_name, ready.replace_value, wait_time
+        )
+        if scope:
+            locator, elem_name = self.get_element_name_locator(
+                scope.locator, scope.elem_name, scope.replace_value
+            )
+            element = self.wait_for_element_condition(
+                locator, elem_name, EC.presence_of_element_located, wait_time
+            )
+            source = self.driver.execute_script("return arguments[0].outerHTML", element)
+        else:
+            source = self.driver.page_source
+        failures, evaluation_ms = evaluate_checks(source, checks)
+        self.log.info(
+            "Evaluated %s snapshot checks in %.1f ms, %s failed",
+            len(checks),
+            evaluation_ms,
+            len(failures),
+        )
+        if failures:
+            raise AssertionError("Snapshot checks failed:\n" + "\n".join(failures))
@@ -0,0 +1,149 @@
+"""Element Cache to reuse located WebElements while the page DOM is unchanged"""
+
+import logging
+import pkgutil
+from typing import Dict, Optional, Tuple
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+logger = logging.getLogger(__name__)
+
+IS_DISPLAYED_ATOM = pkgutil.get_data(
+    "selenium.webdriver.remote", "isDisplayed.js"
+).decode("utf8")
+
+# Generation token changes on navigation (new time origin) and whenever an element is removed from the DOM
+_DOM_GENERATION_JS = """
+if (window.__wdOpsDomGeneration === undefined) {
+    window.__wdOpsDomGeneration = 0;
+    new MutationObserver(function (mutations) {
+        for (const mutation of mutations) {
+            for (const node of mutation.removedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) {
+                    window.__wdOpsDomGeneration++;
+                    return;
+                }
+            }
+        }
+    }).observe(document, {childList: true, subtree: true});
+}
+const generation = performance.timeOrigin + ":" + window.__wdOpsDomGeneration;
+"""
+
+_GENERATION_SCRIPT = _DOM_GENERATION_JS + "return generation;"
+
+# Cached element is only reused while it is still the first match of its locator, predicates on text or
+# attributes may stop matching without any node being removed
+_CACHED_READ_SCRIPT = (
+    _DOM_GENERATION_JS
+    + """
+const el = arguments[0], isXPath = arguments[2], selector = arguments[3];
+if (generation !== arguments[1] || !el.isConnected) {
+    return [generation, null];
+}
+const first = isXPath
+    ? document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(selector);
+if (first !== el) {
+    return [generation, null];
+}
+const displayed = (_IS_DISPLAYED_ATOM__).apply(null, [el]);
+return [generation, {
+    displayed: displayed,
+    enabled: !el.disabled,
+    text: el.innerText || el.textContent,
+}];
+"""
+).replace("_IS_DISPLAYED_ATOM__", IS_DISPLAYED_ATOM)
+
+# Locator strategies evaluated in browser as CSS selector
+CSS_SELECTOR_FORMATS = {
+    By.CSS_SELECTOR: "{}",
+    By.ID: '[id="{}"]',
+    By.NAME: '[name="{}"]',
+    By.CLASS_NAME: ".{}",
+    By.TAG_NAME: "{}",
+}
+
+CacheKey = Tuple[str, str]
+
+
+class ElementCache:
+    """Cache of located WebElements keyed by formatted locator
+
+    Every cached read runs a single script which validates the page side DOM generation token, checks the
+    element is still the first match of its locator and reads the element state together, so repeated reads
+    on a stable page skip the find round trips. Only XPath and CSS evaluable locators are cached.
+    """
+
+    def __init__(self, driver: WebDriver, max_size: int = 256):
+        self.driver = driver
+        self.max_size = max_size
+        self.generation: Optional[str] = None
+        self.elements: Dict[CacheKey, Tuple[WebElement, str]] = {}
+
+    @staticmethod
+    def key(locator: Tuple[By, str]) -> CacheKey:
+        """Build cache key for locator"""
+        return (locator[0], locator[1])
+
+    def invalidate(self):
+        """Drop all cached elements, e.g. on navigation"""
+        self.elements.clear()
+        self.generation = None
+
+    @staticmethod
+    def cacheable(key: CacheKey) -> bool:
+        """Check if elements of the key locator strategy can be validated in browser"""
+        return key[0] == By.XPATH or key[0] in CSS_SELECTOR_FORMATS
+
+    def prepare(self):
+        """Read the DOM generation before an element is located, so elements removed while it is located
+        invalidate it on the next read"""
+        if self.generation is None:
+            self.generation = self.driver.execute_script(_GENERATION_SCRIPT)
+
+    def put(self, key: CacheKey, element: WebElement):
+        """Cache element located after `prepare` under the DOM generation read by it"""
+        if not self.cacheable(key) or self.generation is None:
+            return
+        if len(self.elements) >= self.max_size:
+            self.elements.pop(next(iter(self.elements)))
+        self.elements[key] = (element, self.generation)
+
+    def read(self, key: CacheKey) -> Tuple[Optional[WebElement], Optional[dict]]:
+        """Read cached element state if the DOM generation is unchanged since it was located and the element
+        is still the first match of its locator
+
+        Args:
+            key (CacheKey): Cache key
+
+        Returns:
+            Tuple: cached WebElement and its state (displayed, enabled, text), (None, None) on cache miss
+        """
+        cached = self.elements.get(key)
+        if cached is None:
+            return None, None
+        element, generation = cached
+        by, value = key
+        selector = value if by == By.XPATH else CSS_SELECTOR_FORMATS[by].format(value)
+        try:
+            current, state = self.driver.execute_script(
+                _CACHED_READ_SCRIPT, element, generation, by == By.XPATH, selector
+            )
+        except StaleElementReferenceException:
+            current, state = None, None
+        if state is None and current is not None and current == generation:
+            logger.debug("Cached element no longer matches locator %s", value)
+            self.elements.pop(key, None)
+            return None, None
+        if state is None:
+            logger.debug("Element cache invalidated by DOM generation %s", current)
+            self.elements.clear()
+            self.generation = current
+            return None, None
+        self.generation = current
+        return element, state
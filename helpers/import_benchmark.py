@@ -0,0 +1,113 @@
+"""Import Benchmark to track import time and wall time of test collection against a budget
+
+Usage: python -m helpers.import_benchmark [--runs N] [--budget-ms MS] [--report PATH] [pytest args...]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess  # nosec B404
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Heavy modules only needed once a driver or a report is needed, never while collecting
+FORBIDDEN_MODULES = (
+    "selenium.webdriver.remote.webdriver",
+    "numpy",
+    "lxml.html",
+    "trio",
+    "PIL.Image",
+)
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_import_time(output: str) -> Dict[str, Tuple[int, int]]:
+    """Parse `-X importtime` output
+
+    Returns:
+        dict: Module name to self and cumulative import time in microseconds, in import order
+    """
+    modules = {}
+    for line in output.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules
+
+
+def run_collection(pytest_args: List[str]) -> Tuple[float, Dict[str, Tuple[int, int]]]:
+    """Collect tests in a fresh interpreter
+
+    Returns:
+        Tuple: Wall time in ms and imported modules with their import times
+    """
+    command = [sys.executable, "-X", "importtime", "-m", "pytest", "--collect-only", "-q", *pytest_args]
+    start = time.perf_counter()
+    process = subprocess.run(  # nosec B603
+        command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if process.returncode != 0:
+        raise RuntimeError(f"Collection failed with exit code {process.returncode}")
+    return wall_ms, parse_import_time(process.stderr)
+
+
+def benchmark(pytest_args: List[str], runs: int, top: int) -> dict:
+    """Collect tests `runs` times and summarize median wall and import time
+
+    The first run only warms bytecode and file system caches and is not measured.
+    """
+    run_collection(pytest_args)
+    wall_times, import_times, modules = [], [], {}
+    for _ in range(runs):
+        wall_ms, modules = run_collection(pytest_args)
+        wall_times.append(wall_ms)
+        import_times.append(sum(self_us for self_us, _ in modules.values()) / 1000)
+    project_modules = {
+        name: cumulative
+        for name, (_, cumulative) in modules.items()
+        if name.split(".")[0] in ("conftest", "constants", "helpers", "locators", "pages", "tests")
+    }
+    return {
+        "runs": runs,
+        "collection_wall_ms": round(statistics.median(wall_times), 1),
+        "import_ms": round(statistics.median(import_times), 1),
+        "modules": len(modules),
+        "slowest_project_modules_ms": {
+            name: round(cumulative / 1000, 1)
+            for name, cumulative in sorted(project_modules.items(), key=lambda item: -item[1])[:top]
+        },
+        "forbidden_imports": [name for name in FORBIDDEN_MODULES if name in modules],
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    """Run benchmark, fails on forbidden imports or when collection exceeds the budget"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Measured collection runs")
+    parser.add_argument("--budget-ms", type=float, default=3000, help="Max median collection wall time")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest project modules to list")
+    parser.add_argument("--report", help="Write summary as JSON to this file")
+    args, pytest_args = parser.parse_known_args(argv)
+    summary = benchmark(["-p", "no:cacheprovider", *pytest_args], args.runs, args.top)
+
+    print(
+        f"Collection: {summary['collection_wall_ms']} ms wall, {summary['import_ms']} ms importing "
+        f"{summary['modules']} modules (median of {summary['runs']} runs, budget {args.budget_ms:g} ms)"
+    )
+    for name, cumulative_ms in summary["slowest_project_modules_ms"].items():
+        print(f"{cumulative_ms:>8.1f} ms  {name}")
+    if summary["forbidden_imports"]:
+        print("Imported during collection: " + ", ".join(summary["forbidden_imports"]))
+    if args.report:
+        os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+    return 1 if summary["forbidden_imports"] or summary["collection_wall_ms"] > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
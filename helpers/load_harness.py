@@ -0,0 +1,229 @@
+"""Load Harness to run the search and filter flow with concurrent virtual users on the page objects
+
+Usage: python -m helpers.load_harness [--users N] [--ramp-up S] [--think-time S] [--duration S] [--url URL]
+Without `--url` the flow runs against the local stand-in site.
+"""
+
+import argparse
+import copy
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+from helpers.driver_manager import WebDriverOps, get_driver
+from helpers.stand_in_server import StandInServer
+from pages.home_page import HomePage
+
+logger = logging.getLogger(__name__)
+
+SEARCH_REQUEST = {
+    "destination": "Chennai, Tamil Nadu, India",
+    "dest_search": "Chennai",
+    "currency": "INR",
+}
+FILTER_DATA = {
+    "Property rating": "3 stars",
+    "Reservation policy": "Free cancellation",
+    "Your budget (per night)": 5000,
+}
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(durations: List[float], percent: float) -> float:
+    """Nearest rank percentile of sorted durations"""
+    index = max(0, min(len(durations) - 1, round(percent / 100 * len(durations) + 0.5) - 1))
+    return durations[index]
+
+
+class LoadStats:
+    """Step durations, errors and completed flows shared by all virtual users"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.flows = 0
+        self.failed_flows = 0
+
+    def record_step(self, step: str, duration: float, failed: bool):
+        """Record duration of a step, failed steps only count as errors"""
+        with self.lock:
+            if failed:
+                self.errors[step] += 1
+            else:
+                self.durations[step].append(duration)
+
+    def record_flow(self, failed: bool):
+        """Record finished flow"""
+        with self.lock:
+            self.flows += 1
+            self.failed_flows += failed
+
+    def summary(self, elapsed: float, users: int) -> dict:
+        """Throughput, per step latency percentiles and error rates"""
+        steps = {}
+        for step in list(self.durations) + [s for s in self.errors if s not in self.durations]:
+            durations = sorted(self.durations.get(step, []))
+            total = len(durations) + self.errors.get(step, 0)
+            steps[step] = {
+                "count": total,
+                "error_rate": round(self.errors.get(step, 0) / total, 4),
+                **{
+                    f"p{percent}": round(percentile(durations, percent), 3) if durations else None
+                    for percent in PERCENTILES
+                },
+            }
+        completed = self.flows - self.failed_flows
+        return {
+            "users": users,
+            "elapsed": round(elapsed, 1),
+            "flows": self.flows,
+            "flows_per_minute": round(completed / elapsed * 60, 2) if elapsed else 0,
+            "flow_error_rate": round(self.failed_flows / self.flows, 4) if self.flows else 0,
+            "steps": steps,
+        }
+
+
+class VirtualUser(threading.Thread):
+    """Browser session repeating the flow with think time until the load run ends"""
+
+    def __init__(self, index: int, harness: "LoadHarness"):
+        super().__init__(name=f"virtual-user-{index}", daemon=True)
+        self.index = index
+        self.harness = harness
+
+    def step(self, name: str, action: Callable):
+        """Run a step of the flow and record its duration"""
+        start = time.perf_counter()
+        try:
+            result = action()
+        except Exception:
+            self.harness.stats.record_step(name, time.perf_counter() - start, True)
+            raise
+        self.harness.stats.record_step(name, time.perf_counter() - start, False)
+        time.sleep(random.uniform(0.5, 1.5) * self.harness.think_time)  # nosec B311
+        return result
+
+    def run_flow(self, webdriver_ops: WebDriverOps):
+        """Search hotels and apply filters with unchanged page objects"""
+        search_request = copy.deepcopy(SEARCH_REQUEST)
+        self.step("goto_url", lambda: webdriver_ops.goto_url(self.harness.url))
+        homepage = HomePage(webdriver_ops)
+        self.step("verify_home_page", homepage.verify_home_page)
+        results_page = self.step("search_hotels", lambda: homepage.search_hotels(search_request))
+        self.step("verify_search_results", lambda: results_page.verify_search_results(search_request))
+        self.step("apply_filters", lambda: results_page.apply_filters(dict(FILTER_DATA)))
+
+    def run(self):
+        time.sleep(self.harness.ramp_up * self.index / self.harness.users)
+        if time.monotonic() >= self.harness.end_time:
+            return
+        driver = get_driver(self.harness.browser, True, self.harness.grid_url)
+        try:
+            webdriver_ops = WebDriverOps(driver, self.harness.timeout)
+            while time.monotonic() < self.harness.end_time:
+                try:
+                    self.run_flow(webdriver_ops)
+                    self.harness.stats.record_flow(False)
+                except Exception as e:  # pylint:disable=W0718
+                    logger.error("Flow of %s failed : %s", self.name, e)
+                    self.harness.stats.record_flow(True)
+        finally:
+            driver.quit()
+
+
+class LoadHarness:
+    """Run N virtual users with ramp-up and think time for a duration"""
+
+    def __init__(
+        self,
+        url: str,
+        users: int,
+        ramp_up: float,
+        think_time: float,
+        duration: float,
+        browser: str = "chrome",
+        grid_url: str = None,
+        timeout: float = 30,
+    ):
+        self.url = url
+        self.users = users
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.duration = duration
+        self.browser = browser
+        self.grid_url = grid_url
+        self.timeout = timeout
+        self.stats = LoadStats()
+        self.end_time = None
+
+    def run(self) -> dict:
+        """Run the load and return its summary"""
+        start = time.monotonic()
+        self.end_time = start + self.ramp_up + self.duration
+        virtual_users = [VirtualUser(index, self) for index in range(self.users)]
+        for virtual_user in virtual_users:
+            virtual_user.start()
+        for virtual_user in virtual_users:
+            virtual_user.join()
+        return self.stats.summary(time.monotonic() - start, self.users)
+
+
+def format_summary(summary: dict) -> str:
+    """Format summary as text table"""
+    lines = [
+        f"{summary['users']} users, {summary['flows']} flows in {summary['elapsed']}s: "
+        f"{summary['flows_per_minute']} flows/min, {summary['flow_error_rate']:.1%} flow errors",
+        f"{'Step':<24} {'Count':>6} {'Errors':>7} " + " ".join(f"{'p' + str(p):>8}" for p in PERCENTILES),
+    ]
+    for step, stat in summary["steps"].items():
+        values = " ".join(
+            f"{stat[f'p{p}']:>8.2f}" if stat[f"p{p}"] is not None else f"{'-':>8}" for p in PERCENTILES
+        )
+        lines.append(f"{step:<24} {stat['count']:>6} {stat['error_rate']:>7.1%} {values}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None):
+    """Run load harness, against the local stand-in site unless --url is given"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=2, help="Number of virtual users")
+    parser.add_argument("--ramp-up", type=float, default=10, help="Seconds to start all users")
+    parser.add_argument("--think-time", type=float, default=1, help="Mean seconds between steps")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to run after ramp-up")
+    parser.add_argument("--browser", choices=["chrome", "firefox", "edge"], default="chrome")
+    parser.add_argument("--grid-url", help="Selenium Grid Hub URL")
+    parser.add_argument("--url", help="Site URL, defaults to the local stand-in site")
+    parser.add_argument("--latency-ms", type=int, default=100, help="Stand-in site backend latency")
+    parser.add_argument("--site-host", default="127.0.0.1", help="Stand-in site host reachable by the browsers")
+    parser.add_argument("--report", help="Write summary as JSON to this file")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(threadName)s] [%(levelname)s] %(message)s")
+
+    server = None if args.url else StandInServer(args.site_host, latency_ms=args.latency_ms).start()
+    try:
+        harness = LoadHarness(
+            args.url or server.url,
+            args.users,
+            args.ramp_up,
+            args.think_time,
+            args.duration,
+            args.browser,
+            args.grid_url,
+        )
+        summary = harness.run()
+    finally:
+        if server:
+            server.stop()
+    print(format_summary(summary))
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
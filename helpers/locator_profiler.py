@@ -0,0 +1,194 @@
+"""Locator Profiler to time locator evaluation in browser and translate XPath to CSS selectors"""
+
+import functools
+import json
+import logging
+import os
+import re
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import JavascriptException
+from selenium.webdriver.common.by import By
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+# XPath made only of `//tag` or `//*` followed by attribute equality / contains predicates
+_SIMPLE_XPATH = re.compile(
+    r'^//(\*|[a-zA-Z][\w-]*)'
+    r'((?:\[(?:@[a-zA-Z][\w-]*="[^"]*"|contains\(\s*@[a-zA-Z][\w-]*\s*,\s*"[^"]+"\s*\))\])+)$'
+)
+_PREDICATE = re.compile(
+    r'\[(?:@([a-zA-Z][\w-]*)="([^"]*)"|contains\(\s*@([a-zA-Z][\w-]*)\s*,\s*"([^"]+)"\s*\))\]'
+)
+
+_PROFILE_SCRIPT = """
+const xpath = arguments[0], css = arguments[1], repeat = arguments[2];
+let count = 0;
+let start = performance.now();
+for (let i = 0; i < repeat; i++) {
+    count = document.evaluate(
+        xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    ).snapshotLength;
+}
+const xpathMs = (performance.now() - start) / repeat;
+let cssMs = null;
+if (css) {
+    start = performance.now();
+    for (let i = 0; i < repeat; i++) {
+        document.querySelectorAll(css);
+    }
+    cssMs = (performance.now() - start) / repeat;
+}
+return [xpathMs, cssMs, count];
+"""
+
+
+def _css_string(value: str) -> str:
+    """Quote value as CSS string"""
+    return '"' + value.replace("\\", "\\\\").replace("\n", "\\a ") + '"'
+
+
+@functools.lru_cache(maxsize=1024)
+def to_css_locator(locator: Tuple[By, str]) -> Tuple[By, str]:
+    """Translate XPath locator to equivalent CSS selector locator where possible
+
+    Only document-wide XPath with attribute equality and `contains(@attr, "...")` predicates
+    (e.g. `//*[@data-testid="property-card"]`) are translated, every other locator is returned as is.
+
+    Args:
+        locator (Tuple): Tuple with locator type and locator string.
+
+    Returns:
+        Tuple: CSS selector locator if XPath is translatable else given locator
+    """
+    by, value = locator
+    match = _SIMPLE_XPATH.match(value) if by == By.XPATH else None
+    if not match:
+        return locator
+    tag, predicates = match.groups()
+    selector = "" if tag == "*" else tag
+    for attr, attr_value, contains_attr, contains_value in _PREDICATE.findall(predicates):
+        if contains_attr:
+            selector += f"[{contains_attr}*={_css_string(contains_value)}]"
+        else:
+            selector += f"[{attr}={_css_string(attr_value)}]"
+    return By.CSS_SELECTOR, selector
+
+
+class LocatorProfiler:
+    """Time XPath locator evaluation in browser per locator template and rank the most expensive ones"""
+
+    def __init__(self, repeat: int = 5):
+        self.repeat = repeat
+        self.lock = threading.Lock()
+        self.stats: Dict[str, dict] = {}
+
+    def measure(
+        self,
+        driver: "WebDriver",
+        template: Tuple[By, str],
+        locator: Tuple[By, str],
+        elem_name: str,
+    ) -> Optional[Tuple[float, float, int]]:
+        """Time evaluation of formatted XPath locator in browser against current document
+
+        Args:
+            driver (WebDriver): WebDriver instance
+            template (Tuple): Locator template before replace values are applied.
+            locator (Tuple): Formatted locator to be evaluated.
+            elem_name (str): description of the element.
+
+        Returns:
+            Tuple: XPath time in ms, CSS time in ms (None if not translatable) and number of matches
+        """
+        if locator[0] != By.XPATH:
+            return None
+        css_locator = to_css_locator(locator)
+        css = css_locator[1] if css_locator[0] == By.CSS_SELECTOR else None
+        try:
+            xpath_ms, css_ms, count = driver.execute_script(
+                _PROFILE_SCRIPT, locator[1], css, self.repeat
+            )
+        except JavascriptException as e:
+            logger.warning("Unable to profile locator %s : %s", locator, e.msg)
+            return None
+
+        with self.lock:
+            stat = self.stats.setdefault(
+                template[1],
+                {
+                    "template": template[1],
+                    "elem_name": elem_name,
+                    "css": css_locator[1] if css else None,
+                    "samples": 0,
+                    "xpath_ms": 0.0,
+                    "css_ms": 0.0,
+                    "max_xpath_ms": 0.0,
+                    "matches": 0,
+                },
+            )
+            stat["samples"] += 1
+            stat["xpath_ms"] += xpath_ms
+            stat["css_ms"] += css_ms or 0.0
+            stat["max_xpath_ms"] = max(stat["max_xpath_ms"], xpath_ms)
+            stat["matches"] = count
+        return xpath_ms, css_ms, count
+
+    def ranking(self) -> List[dict]:
+        """Rank locator templates by mean XPath evaluation time, most expensive first
+
+        Returns:
+            list: List of locator template stats with mean timings
+        """
+        ranked = []
+        with self.lock:
+            stats = [dict(stat) for stat in self.stats.values()]
+        for stat in stats:
+            samples = stat["samples"]
+            ranked.append(
+                {
+                    "template": stat["template"],
+                    "elem_name": stat["elem_name"],
+                    "css": stat["css"],
+                    "samples": samples,
+                    "mean_xpath_ms": round(stat["xpath_ms"] / samples, 4),
+                    "mean_css_ms": (
+                        round(stat["css_ms"] / samples, 4) if stat["css"] else None
+                    ),
+                    "max_xpath_ms": round(stat["max_xpath_ms"], 4),
+                    "last_matches": stat["matches"],
+                }
+            )
+        return sorted(ranked, key=lambda stat: stat["mean_xpath_ms"], reverse=True)
+
+    def format_ranking(self, top: int = 15) -> str:
+        """Format ranking as text table
+
+        Args:
+            top (int, optional): Number of most expensive templates to include. Defaults to 15.
+
+        Returns:
+            str: Ranking table
+        """
+        lines = [f"{'XPath ms':>10} {'CSS ms':>10} {'Samples':>8}  Template"]
+        for stat in self.ranking()[:top]:
+            css_ms = "-" if stat["mean_css_ms"] is None else f"{stat['mean_css_ms']:.4f}"
+            lines.append(
+                f"{stat['mean_xpath_ms']:>10.4f} {css_ms:>10} {stat['samples']:>8}  {stat['template']}"
+            )
+        return "\n".join(lines)
+
+    def write_report(self, report_path: str):
+        """Write ranking as JSON report
+
+        Args:
+            report_path (str): Report file path
+        """
+        os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(self.ranking(), f, indent=2)
+        logger.info("Locator profile saved at Location : %s", report_path)
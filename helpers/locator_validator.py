@@ -0,0 +1,175 @@
+"""Locator Validator to evaluate locator templates against saved HTML snapshots without a browser
+
+Usage: python -m helpers.locator_validator [--snapshots DIR] [--samples FILE] [--report FILE] [--strict]
+"""
+
+import argparse
+import glob
+import gzip
+import importlib
+import json
+import logging
+import os
+import pkgutil
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import yaml
+from lxml import etree, html
+
+try:
+    from lxml.cssselect import CSSSelector
+except ImportError:
+    CSSSelector = None
+from selenium.webdriver.common.by import By
+
+from helpers.driver_manager import PAGE_SOURCES_DIR
+from helpers.locator_profiler import to_css_locator
+from helpers.page_snapshot import format_locator
+
+logger = logging.getLogger(__name__)
+
+LOCATORS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "locators")
+SAMPLE_VALUES_FILE = os.path.join(LOCATORS_DIR, "sample_values.yaml")
+FAILING_STATUSES = ("miss", "multiple", "error", "css mismatch")
+# Snapshots are captured in any page state, so only these fail the validation unless strict
+ALWAYS_FAILING_STATUSES = ("error", "css mismatch")
+
+
+def get_locators() -> Dict[str, Tuple[By, str]]:
+    """Get all XPath locators of `locators` modules by name"""
+    all_locators = {}
+    for module_info in pkgutil.iter_modules([LOCATORS_DIR]):
+        module = importlib.import_module(f"locators.{module_info.name}")
+        for name, value in vars(module).items():
+            if isinstance(value, tuple) and len(value) == 2 and value[0] == By.XPATH:
+                all_locators[name] = value
+    return all_locators
+
+
+def load_snapshots(snapshots_dir: str) -> Dict[str, etree._ElementTree]:  # pylint:disable=W0212
+    """Parse saved `.html` and `.html.gz` page sources, also of per thread subdirectories, by relative path"""
+    snapshots = {}
+    for path in sorted(glob.glob(os.path.join(snapshots_dir, "**", "*.html*"), recursive=True)):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            snapshots[os.path.relpath(path, snapshots_dir)] = html.document_fromstring(f.read()).getroottree()
+    return snapshots
+
+
+def validate_locator(
+    name: str, locator: Tuple[By, str], snapshots: Dict[str, etree._ElementTree], multiple: bool  # pylint:disable=W0212
+) -> dict:
+    """Evaluate formatted locator against every snapshot
+
+    Args:
+        name (str): Locator name
+        locator (Tuple): Formatted locator
+        snapshots (dict): Parsed snapshots by relative path
+        multiple (bool): Locator is expected to match more than one element
+
+    Returns:
+        dict: Result with status, matches per snapshot and evaluation time
+    """
+    result = {"name": name, "locator": locator[1], "matches": {}, "time_ms": 0.0}
+    css_locator = to_css_locator(locator)
+    css_selector = (
+        CSSSelector(css_locator[1]) if CSSSelector and css_locator[0] == By.CSS_SELECTOR else None
+    )
+    try:
+        xpath = etree.XPath(locator[1])
+        for snapshot_name, tree in snapshots.items():
+            start = time.perf_counter()
+            count = len(xpath(tree))
+            result["time_ms"] += (time.perf_counter() - start) * 1000
+            result["matches"][snapshot_name] = count
+            if css_selector is not None and len(css_selector(tree)) != count:
+                result["status"] = "css mismatch"
+    except etree.XPathError as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+        return result
+    most = max(result["matches"].values(), default=0)
+    if "status" not in result:
+        result["status"] = "miss" if most == 0 else "multiple" if most > 1 and not multiple else "ok"
+    return result
+
+
+def validate(snapshots_dir: str, samples_file: str = SAMPLE_VALUES_FILE) -> List[dict]:
+    """Validate all locator templates with sample replace values against snapshots
+
+    Args:
+        snapshots_dir (str): Directory of saved `.html` / `.html.gz` page sources
+        samples_file (str, optional): Sample replace values YAML. Defaults to locators/sample_values.yaml.
+
+    Returns:
+        list: Result per formatted locator, templates without samples have `no sample` status
+    """
+    with open(samples_file, encoding="utf-8") as f:
+        sample_values = yaml.safe_load(f)
+    samples, multiple = sample_values.get("samples", {}), set(sample_values.get("multiple", []))
+    snapshots = load_snapshots(snapshots_dir)
+    if not snapshots:
+        return []
+
+    results = []
+    for name, locator in get_locators().items():
+        if "{}" not in locator[1]:
+            values = [None]
+        elif name in samples:
+            values = samples[name]
+        else:
+            results.append({"name": name, "locator": locator[1], "status": "no sample"})
+            continue
+        for value in values:
+            results.append(
+                validate_locator(name, format_locator(locator, value), snapshots, name in multiple)
+            )
+    return results
+
+
+def format_results(results: List[dict]) -> str:
+    """Format results as table, failures first"""
+    lines = [f"{'Status':<13} {'Matches':>7} {'Time ms':>8}  Locator"]
+    for result in sorted(results, key=lambda r: (r["status"] not in FAILING_STATUSES, r["name"])):
+        matches = max(result.get("matches", {}).values(), default=0)
+        lines.append(
+            f"{result['status']:<13} {matches:>7} {result.get('time_ms', 0):>8.2f}  {result['name']}: {result['locator']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    """Validate locators and print results
+
+    Returns:
+        int: Exit status, 1 if a locator is invalid, or with `--strict` if any locator fails
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--snapshots", default=PAGE_SOURCES_DIR, help="Directory of saved page sources")
+    parser.add_argument("--samples", default=SAMPLE_VALUES_FILE, help="Sample replace values YAML")
+    parser.add_argument("--report", help="Write results as JSON to this file")
+    parser.add_argument("--strict", action="store_true", help="Fail on misses and unexpected multiple matches")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = validate(args.snapshots, args.samples)
+    if not results:
+        print(f"No snapshots found in {args.snapshots}, nothing to validate")
+        return 0
+    print(format_results(results))
+    failures = [result for result in results if result["status"] in FAILING_STATUSES]
+    print(
+        f"{len(results)} locators validated, {len(failures)} failed in {time.perf_counter() - start:.2f}s"
+        + ("" if CSSSelector else " (install cssselect to verify CSS translations)")
+    )
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    failing_statuses = FAILING_STATUSES if args.strict else ALWAYS_FAILING_STATUSES
+    return 1 if any(result["status"] in failing_statuses for result in failures) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
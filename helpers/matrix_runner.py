@@ -0,0 +1,167 @@
+"""Matrix Runner to run the selected tests on several browsers concurrently and merge their results
+
+Usage: python -m helpers.matrix_runner [--browsers chrome firefox edge] [pytest args...]
+"""
+
+import argparse
+import html
+import json
+import logging
+import os
+import subprocess  # nosec B404
+import sys
+import time
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+BROWSERS = ("chrome", "firefox", "edge")
+MATRIX_DIR = os.path.join("test-results", "matrix")
+
+
+def start_pytest_run(results_dir: str, pytest_args: List[str]) -> subprocess.Popen:
+    """Start pytest with its own artifacts directory and streamed report
+
+    Args:
+        results_dir (str): Artifacts directory of the run
+        pytest_args (list): Extra pytest arguments
+
+    Returns:
+        subprocess.Popen: pytest process, output is written to `pytest-output.log` of the results directory
+    """
+    os.makedirs(results_dir, exist_ok=True)
+    command = [
+        sys.executable,
+        "-m",
+        "pytest",
+        "--stream-report",
+        "-o",
+        f"log_file={os.path.join(results_dir, 'bookingdotcom-test-logs.log')}",
+        *pytest_args,
+    ]
+    env = dict(os.environ, TEST_RESULTS_DIR=results_dir)
+    with open(os.path.join(results_dir, "pytest-output.log"), "w", encoding="utf-8") as output:
+        return subprocess.Popen(  # nosec B603
+            command, env=env, stdout=output, stderr=subprocess.STDOUT
+        )
+
+
+def start_browser_run(browser: str, pytest_args: List[str], matrix_dir: str) -> subprocess.Popen:
+    """Start pytest for a browser with its own artifacts directory and streamed report
+
+    Args:
+        browser (str): Browser name
+        pytest_args (list): Extra pytest arguments
+        matrix_dir (str): Matrix results directory
+
+    Returns:
+        subprocess.Popen: pytest process, output is written to `<browser>/pytest-output.log`
+    """
+    return start_pytest_run(os.path.join(matrix_dir, browser), ["--browser", browser, *pytest_args])
+
+
+def merge_results(browsers: List[str], matrix_dir: str) -> Dict[str, Dict[str, dict]]:
+    """Merge streamed reports of every browser by test
+
+    Returns:
+        dict: Test node id to browser to result with outcome and duration
+    """
+    matrix = {}
+    for browser in browsers:
+        report_path = os.path.join(matrix_dir, browser, "report.jsonl")
+        if not os.path.exists(report_path):
+            continue
+        with open(report_path, encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                result = matrix.setdefault(entry["nodeid"], {}).setdefault(
+                    browser, {"outcome": "passed", "duration": 0.0}
+                )
+                result["duration"] = round(result["duration"] + entry["duration"], 3)
+                # Any failed, errored or skipped phase decides the outcome of the test
+                if entry["outcome"] != "passed":
+                    result["outcome"] = entry["outcome"]
+    return matrix
+
+
+def write_matrix_report(
+    matrix: Dict[str, Dict[str, dict]], browsers: List[str], runs: Dict[str, dict], matrix_dir: str
+) -> str:
+    """Write merged results as `matrix-report.json` and side by side `matrix-report.html`
+
+    Returns:
+        str: HTML report path
+    """
+    with open(os.path.join(matrix_dir, "matrix-report.json"), "w", encoding="utf-8") as f:
+        json.dump({"runs": runs, "tests": matrix}, f, indent=2)
+
+    header = "".join(
+        f'<th><a href="{browser}/report.html">{browser}</a><br>'
+        f'exit {runs[browser]["returncode"]}, {runs[browser]["wall_time"]:.1f}s</th>'
+        for browser in browsers
+    )
+    rows = []
+    for nodeid, results in sorted(matrix.items()):
+        cells = "".join(
+            f'<td class="{results[browser]["outcome"]}">{results[browser]["outcome"]} '
+            f'({results[browser]["duration"]:.1f}s)</td>'
+            if browser in results
+            else "<td>-</td>"
+            for browser in browsers
+        )
+        rows.append(f"<tr><td>{html.escape(nodeid)}</td>{cells}</tr>")
+    html_path = os.path.join(matrix_dir, "matrix-report.html")
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>Browser Matrix Report</title>\n"
+            "<style>body { font-family: sans-serif; } table { border-collapse: collapse; } "
+            "td, th { border: 1px solid #ccc; padding: 4px 8px; } .passed { color: green; } "
+            ".failed, .error { color: red; } .skipped { color: orange; }</style>\n</head>\n<body>\n"
+            f"<h1>Browser Matrix Report</h1>\n<table>\n<tr><th>Test</th>{header}</tr>\n"
+            + "\n".join(rows)
+            + "\n</table>\n</body>\n</html>\n"
+        )
+    return html_path
+
+
+def run_matrix(browsers: List[str], pytest_args: List[str], matrix_dir: str = MATRIX_DIR) -> int:
+    """Run tests on all browsers concurrently and merge the results
+
+    Args:
+        browsers (list): Browser names
+        pytest_args (list): Extra pytest arguments, e.g. tests to select
+        matrix_dir (str, optional): Matrix results directory. Defaults to test-results/matrix.
+
+    Returns:
+        int: Highest pytest exit code of all browsers
+    """
+    start = time.perf_counter()
+    processes = {browser: start_browser_run(browser, pytest_args, matrix_dir) for browser in browsers}
+    runs = {}
+    while len(runs) < len(processes):
+        for browser, process in processes.items():
+            if browser not in runs and process.poll() is not None:
+                runs[browser] = {"returncode": process.returncode, "wall_time": time.perf_counter() - start}
+                logger.info("Tests on %s finished with exit code %s", browser, process.returncode)
+        time.sleep(0.5)
+
+    html_path = write_matrix_report(merge_results(browsers, matrix_dir), browsers, runs, matrix_dir)
+    print(
+        f"Matrix of {', '.join(browsers)} finished in {time.perf_counter() - start:.1f}s, "
+        f"report at {html_path}"
+    )
+    return max(run["returncode"] for run in runs.values())
+
+
+def main(argv: List[str] = None) -> int:
+    """Parse browsers and pass every other argument to pytest"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browsers", nargs="+", choices=BROWSERS, default=list(BROWSERS))
+    parser.add_argument("--matrix-dir", default=MATRIX_DIR, help="Matrix results directory")
+    args, pytest_args = parser.parse_known_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    return run_matrix(args.browsers, pytest_args, args.matrix_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
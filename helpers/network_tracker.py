@@ -0,0 +1,196 @@
+"""Network Tracker to know when fetch/XHR requests triggered on the page are finished"""
+
+import json
+import logging
+import re
+from collections import deque
+from typing import Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+MAX_COMPLETED_REQUESTS = 200
+TRACKED_RESOURCE_TYPES = ("XHR", "Fetch")
+
+# Records fetch/XHR requests of the page in window.__wdOpsNetwork
+INSTALL_TRACKER_JS = """
+if (!window.__wdOpsNetwork) {
+    const net = window.__wdOpsNetwork = {seq: 0, inflight: {}, done: []};
+    const start = (url) => {
+        const id = ++net.seq;
+        net.inflight[id] = {id: id, url: String(url)};
+        return id;
+    };
+    const end = (id) => {
+        const request = net.inflight[id];
+        if (!request) {
+            return;
+        }
+        delete net.inflight[id];
+        request.end = performance.now();
+        net.done.push(request);
+        if (net.done.length > %d) {
+            net.done.shift();
+        }
+    };
+    const fetch = window.fetch;
+    if (fetch) {
+        window.fetch = function (input) {
+            const id = start(input && input.url ? input.url : input);
+            return fetch.apply(this, arguments).finally(() => end(id));
+        };
+    }
+    const open = XMLHttpRequest.prototype.open;
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__wdOpsUrl = url;
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        const id = start(this.__wdOpsUrl);
+        this.addEventListener("loadend", () => end(id));
+        return send.apply(this, arguments);
+    };
+}
+""" % MAX_COMPLETED_REQUESTS
+
+_CHECKPOINT_SCRIPT = (
+    INSTALL_TRACKER_JS
+    + """
+return [performance.timeOrigin, window.__wdOpsNetwork.seq, performance.now()];
+"""
+)
+
+_STATUS_SCRIPT = (
+    INSTALL_TRACKER_JS
+    + """
+const net = window.__wdOpsNetwork;
+const match = arguments[0] ? new RegExp(arguments[0]) : null;
+let since = arguments[1], sinceTime = arguments[2];
+if (arguments[3] !== performance.timeOrigin) {
+    since = 0;
+    sinceTime = 0;
+}
+const matches = (request) => request.id > since && (!match || match.test(request.url));
+const inflight = Object.values(net.inflight).filter(matches).length;
+let started = inflight, last = sinceTime;
+for (const request of net.done) {
+    if (matches(request)) {
+        started++;
+        last = Math.max(last, request.end);
+    }
+}
+return [started, inflight, performance.now() - last];
+"""
+)
+
+# Wall clock of the browser host, which also stamps performance log entries
+_BROWSER_TIME_SCRIPT = "return Date.now();"
+
+Checkpoint = Tuple[float, int, float]
+
+
+class NetworkTracker:
+    """Track fetch/XHR requests of the page
+
+    Uses CDP `Network.*` events from the performance log when the Chromium driver was created with
+    `network_events` enabled, else a fetch/XHR monkeypatch injected into the page.
+    """
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.cdp_events = self._performance_log_enabled()
+        self.seq = 0
+        self.inflight = {}
+        self.done = deque(maxlen=MAX_COMPLETED_REQUESTS)
+        if not self.cdp_events and driver.capabilities["browserName"].lower() != "firefox":
+            # Keep monkeypatch installed across navigations to track requests made while page loads
+            driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": INSTALL_TRACKER_JS}
+            )
+        logger.info(
+            "Tracking network with %s",
+            "CDP Network events" if self.cdp_events else "fetch/XHR monkeypatch",
+        )
+
+    def _performance_log_enabled(self) -> bool:
+        """Check whether the driver records CDP events in performance log"""
+        try:
+            self.driver.get_log("performance")
+        except (AttributeError, WebDriverException):
+            return False
+        return True
+
+    def _drain_performance_log(self):
+        """Update tracked requests from CDP Network events in performance log"""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method, params = message["method"], message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                if params.get("type") in TRACKED_RESOURCE_TYPES:
+                    self.seq += 1
+                    self.inflight[params["requestId"]] = {
+                        "id": self.seq,
+                        "url": params["request"]["url"],
+                    }
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                request = self.inflight.pop(params["requestId"], None)
+                if request:
+                    request["end"] = entry["timestamp"]
+                    self.done.append(request)
+
+    def _browser_time(self) -> float:
+        """Get milliseconds since epoch on the browser host, the clock of performance log timestamps"""
+        return self.driver.execute_script(_BROWSER_TIME_SCRIPT)
+
+    def checkpoint(self) -> Checkpoint:
+        """Mark current point in time to only consider requests made after it
+
+        Returns:
+            Checkpoint: Checkpoint to pass to `status`
+        """
+        if self.cdp_events:
+            self._drain_performance_log()
+            return 0.0, self.seq, self._browser_time()
+        time_origin, seq, now = self.driver.execute_script(_CHECKPOINT_SCRIPT)
+        return time_origin, seq, now
+
+    def status(
+        self, match: str = None, since: Optional[Checkpoint] = None
+    ) -> Tuple[int, int, float]:
+        """Get matching requests made and in flight, and time since the last matching request finished
+
+        Args:
+            match (str, optional): Regex pattern of request URLs to consider. Defaults to all requests.
+            since (Checkpoint, optional): Only consider requests made after checkpoint. Defaults to all requests.
+
+        Returns:
+            Tuple: Number of requests made and in flight, milliseconds since last request finished or checkpoint
+        """
+        time_origin, since_seq, since_time = since or (None, 0, 0)
+        if not self.cdp_events:
+            started, inflight, quiet_ms = self.driver.execute_script(
+                _STATUS_SCRIPT, match, since_seq, since_time, time_origin
+            )
+            return started, inflight, quiet_ms
+
+        self._drain_performance_log()
+        pattern = re.compile(match) if match else None
+
+        def matches(request):
+            return request["id"] > since_seq and (
+                not pattern or pattern.search(request["url"])
+            )
+
+        inflight = sum(1 for request in self.inflight.values() if matches(request))
+        ends = [request["end"] for request in self.done if matches(request)]
+        return inflight + len(ends), inflight, self._browser_time() - max([since_time] + ends)
+
+    def is_idle(
+        self, quiet_ms: float, match: str = None, since: Optional[Checkpoint] = None
+    ) -> bool:
+        """Check a matching request was made, none is in flight and none finished for `quiet_ms`"""
+        started, inflight, quiet = self.status(match, since)
+        return started > 0 and inflight == 0 and quiet >= quiet_ms
@@ -0,0 +1,79 @@
+"""Page Snapshot to evaluate batches of locator assertions locally against one page source transfer"""
+
+import functools
+import time
+from typing import List, NamedTuple, Tuple, Union
+
+from selenium.webdriver.common.by import By
+
+
+class SnapshotCheck(NamedTuple):
+    """Assertion that a locator matches an element in the snapshot, optionally containing text"""
+
+    locator: Tuple[By, str]
+    elem_name: str
+    replace_value: Union[str, List, Tuple] = None
+    text: str = None
+
+
+def format_locator(locator: Tuple[By, str], replace_value) -> Tuple[By, str]:
+    """Apply replace value to locator template as WebDriverOps does"""
+    if replace_value is None:
+        return locator
+    if not isinstance(replace_value, (list, tuple)):
+        replace_value = [replace_value]
+    return locator[0], locator[1].format(*replace_value)
+
+
+@functools.lru_cache(maxsize=None)
+def load_css_selector():
+    """lxml CSSSelector imported on first use, None when cssselect is not installed"""
+    try:
+        from lxml.cssselect import CSSSelector  # pylint:disable=C0415
+    except ImportError:
+        return None
+    return CSSSelector
+
+
+def find_in_snapshot(tree, locator: Tuple[By, str]) -> list:
+    """Find elements of XPath, or CSS selector when cssselect is installed, in parsed snapshot"""
+    by, value = locator
+    if by == By.XPATH:
+        return tree.xpath(value)
+    css_selector = load_css_selector() if by == By.CSS_SELECTOR else None
+    if css_selector:
+        return css_selector(value)(tree)
+    raise ValueError(f"Locator {locator} can not be evaluated in snapshot")
+
+
+def evaluate_checks(source: str, checks: List[SnapshotCheck]) -> Tuple[List[str], float]:
+    """Evaluate every check against page source, element visibility is not evaluated
+
+    Args:
+        source (str): Page source or outerHTML of a subtree
+        checks (list): Checks to evaluate
+
+    Returns:
+        Tuple: Failure messages of all failed checks and evaluation time in ms
+    """
+    from lxml import etree, html  # pylint:disable=C0415
+
+    start = time.perf_counter()
+    tree = html.document_fromstring(source).getroottree()
+    failures = []
+    for check in checks:
+        locator = format_locator(check.locator, check.replace_value)
+        try:
+            elements = find_in_snapshot(tree, locator)
+        except (etree.XPathError, ValueError) as e:
+            failures.append(f"{check.elem_name}: invalid locator {locator} : {e}")
+            continue
+        if not elements:
+            failures.append(f"{check.elem_name}: no element with locator {locator}")
+        elif check.text is not None and not any(
+            check.text in " ".join(element.text_content().split()) for element in elements
+        ):
+            failures.append(
+                f"{check.elem_name}: no element with locator {locator} contains text {check.text!r}"
+            )
+    return failures, (time.perf_counter() - start) * 1000
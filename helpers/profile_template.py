@@ -0,0 +1,243 @@
+"""Profile Template to warm a browser profile once per run, clone it per session and measure first navigations"""
+
+import json
+import logging
+import os
+import shutil
+import stat
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+# Directories of HTTP, code and GPU caches of Chromium and Firefox profiles
+CACHE_DIR_NAMES = ("Cache", "Code Cache", "GPUCache", "Service Worker", "cache2", "startupCache")
+# Files marking a profile in use by a running browser
+LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lock", ".parentlock", "parent.lock")
+NAVIGATION_TIMING_SCRIPT = """
+const navigation = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+return {
+    duration_ms: navigation ? Math.round(navigation.duration) : null,
+    transfer_bytes: (navigation ? navigation.transferSize : 0)
+        + resources.reduce((total, resource) => total + resource.transferSize, 0),
+    resources: resources.length,
+    cached_resources: resources.filter((r) => r.transferSize === 0 && r.decodedBodySize > 0).length,
+};
+"""
+
+
+def is_cache_path(relative_path: str) -> bool:
+    """Whether path relative to the profile is inside a cache directory"""
+    return any(part in CACHE_DIR_NAMES for part in relative_path.split(os.sep))
+
+
+def set_cache_writable(profile_dir: str, writable: bool):
+    """Make cache files of profile read-only or writable again"""
+    for root, _, files in os.walk(profile_dir):
+        if not is_cache_path(os.path.relpath(root, profile_dir)):
+            continue
+        for name in files:
+            path = os.path.join(root, name)
+            if os.path.islink(path):
+                continue
+            mode = os.stat(path).st_mode
+            write_bits = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+            os.chmod(path, mode | stat.S_IWUSR if writable else mode & ~write_bits)
+
+
+def can_hardlink(path: str) -> bool:
+    """Whether file is safe to share with clones as a hardlink
+
+    Only read-only files are shared, a browser has to replace them instead of changing the template.
+    Root ignores missing write permissions, so nothing is shared when running as root.
+    """
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        return False
+    return not os.stat(path).st_mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def clone_tree(template_dir: str, clone_dir: str) -> str:
+    """Clone profile with copy-on-write reflinks when the file system supports them, else hardlink
+    read-only cache files and copy the rest
+
+    Args:
+        template_dir (str): Warmed profile directory
+        clone_dir (str): Clone directory, must not exist
+
+    Returns:
+        str: Clone method, `reflink`, `hardlink` or `copy` when no file could be hardlinked
+    """
+    if sys.platform in ("linux", "darwin"):
+        command = ["cp", "-c", "-R"] if sys.platform == "darwin" else ["cp", "-R", "--reflink=always"]
+        result = subprocess.run(  # nosec B603 B607
+            [*command, template_dir, clone_dir], capture_output=True, check=False
+        )
+        if result.returncode == 0:
+            set_cache_writable(clone_dir, True)
+            return "reflink"
+        shutil.rmtree(clone_dir, ignore_errors=True)
+    method = "copy"
+    for root, _, files in os.walk(template_dir):
+        relative = os.path.relpath(root, template_dir)
+        target_root = os.path.normpath(os.path.join(clone_dir, relative))
+        os.makedirs(target_root, exist_ok=True)
+        for name in files:
+            source, target = os.path.join(root, name), os.path.join(target_root, name)
+            if name in LOCK_FILES or os.path.islink(source):
+                continue
+            if is_cache_path(relative) and can_hardlink(source):
+                try:
+                    os.link(source, target)
+                    method = "hardlink"
+                    continue
+                except OSError:
+                    pass
+            shutil.copy2(source, target)
+            if is_cache_path(relative):
+                os.chmod(target, os.stat(target).st_mode | stat.S_IWUSR)
+    return method
+
+
+def navigation_timing(driver: "WebDriver") -> dict:
+    """Duration of the current document navigation and bytes transferred for it and its resources
+
+    Bytes are as reported by Resource Timing, cross-origin resources without `Timing-Allow-Origin` count as 0.
+    """
+    return driver.execute_script(NAVIGATION_TIMING_SCRIPT)
+
+
+class NavigationMetrics:
+    """First navigation time and transferred bytes per browser session, by profile"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: List[dict] = []
+        self.profiles: Dict[str, str] = {}
+
+    def set_profile(self, driver: "WebDriver", profile: str):
+        """Label the profile the session started from"""
+        with self.lock:
+            self.profiles[driver.session_id] = profile
+
+    def record(self, driver: "WebDriver", name: str, profile: str = None):
+        """Record timing of the current document if it is the first recorded of the session"""
+        with self.lock:
+            if any(entry["session_id"] == driver.session_id for entry in self.entries):
+                return
+        entry = {
+            "name": name,
+            "session_id": driver.session_id,
+            "profile": profile or self.profiles.get(driver.session_id, "clean"),
+            **navigation_timing(driver),
+        }
+        logger.info("First navigation of %s with %s profile : %s", name, entry["profile"], entry)
+        with self.lock:
+            self.entries.append(entry)
+
+    def summary(self) -> Dict[str, dict]:
+        """Median first navigation duration and transferred bytes per profile"""
+        profiles = {}
+        for entry in self.entries:
+            profiles.setdefault(entry["profile"], []).append(entry)
+        return {
+            profile: {
+                "sessions": len(entries),
+                "median_duration_ms": statistics.median(e["duration_ms"] or 0 for e in entries),
+                "median_transfer_bytes": statistics.median(e["transfer_bytes"] for e in entries),
+                "median_cached_resources": statistics.median(e["cached_resources"] for e in entries),
+            }
+            for profile, entries in profiles.items()
+        }
+
+    def format_summary(self) -> str:
+        """Format summary as text table"""
+        lines = [f"{'Profile':<20} {'Sessions':>8} {'Duration ms':>12} {'Transferred KB':>15} {'Cached':>7}"]
+        for profile, stats in self.summary().items():
+            lines.append(
+                f"{profile:<20} {stats['sessions']:>8} {stats['median_duration_ms']:>12.0f} "
+                f"{stats['median_transfer_bytes'] / 1024:>15.1f} {stats['median_cached_resources']:>7.0f}"
+            )
+        return "\n".join(lines)
+
+    def save(self, report_path: str):
+        """Save first navigation entries and summary as JSON"""
+        os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump({"summary": self.summary(), "sessions": self.entries}, f, indent=2)
+        logger.info("First navigation metrics saved at Location : %s", report_path)
+
+
+class ProfileTemplate:
+    """Browser profiles warmed once per run and browser, every session starts from a clone
+
+    Warming visits the home page twice, so the HTTP cache and the compiled code cache are populated,
+    and accepts cookie consent so that preference is kept.
+    """
+
+    def __init__(self, navigation_metrics: NavigationMetrics = None, root_dir: str = None):
+        self.navigation_metrics = navigation_metrics
+        self.root_dir = root_dir or tempfile.mkdtemp(prefix="profile-template-")
+        self.templates: Dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    def warm(self, browser: str, headless: bool, url: str) -> str:
+        """Prepare warmed profile of browser
+
+        Returns:
+            str: Template profile directory
+        """
+        # Imported once a browser is started, not at collection
+        from helpers.driver_manager import WebDriverOps, get_driver  # pylint:disable=C0415
+        from locators.home_page_locators import accept_cookies_button  # pylint:disable=C0415
+
+        template_dir = os.path.join(self.root_dir, browser)
+        os.makedirs(template_dir, exist_ok=True)
+        driver = get_driver(browser, headless, profile_dir=template_dir)
+        try:
+            webdriver_ops = WebDriverOps(driver, 30)
+            webdriver_ops.goto_url(url)
+            if self.navigation_metrics:
+                self.navigation_metrics.record(driver, f"{browser} profile warm-up", "clean")
+            if webdriver_ops.is_element_present(accept_cookies_button, "Accept cookies button", wait_time=5):
+                webdriver_ops.click(accept_cookies_button, "Accept cookies button")
+            # Scripts run again are compiled into the code cache
+            webdriver_ops.goto_url(url)
+        finally:
+            driver.quit()
+        set_cache_writable(template_dir, False)
+        logger.info("Warmed %s profile template at Location : %s", browser, template_dir)
+        return template_dir
+
+    def clone(self, browser: str, headless: bool, url: str) -> str:
+        """Clone warmed profile of browser for a new session, warming it on first use
+
+        Returns:
+            str: Profile directory of the session
+        """
+        with self.lock:
+            if browser not in self.templates:
+                self.templates[browser] = self.warm(browser, headless, url)
+        clone_dir = tempfile.mkdtemp(prefix=f"{browser}-", dir=self.root_dir)
+        os.rmdir(clone_dir)
+        method = clone_tree(self.templates[browser], clone_dir)
+        logger.info("Cloned %s profile template with %s at Location : %s", browser, method, clone_dir)
+        return clone_dir
+
+    @staticmethod
+    def remove_clone(clone_dir: str):
+        """Remove profile of a finished session"""
+        shutil.rmtree(clone_dir, ignore_errors=True)
+
+    def cleanup(self):
+        """Remove templates and remaining clones"""
+        for template_dir in self.templates.values():
+            set_cache_writable(template_dir, True)
+        shutil.rmtree(self.root_dir, ignore_errors=True)
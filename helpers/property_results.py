@@ -0,0 +1,244 @@
+"""Property Results to capture property card records as columns, export them and verify filters"""
+
+import csv
+import json
+import logging
+import math
+import os
+from array import array
+from typing import Iterable, List
+
+import constants
+from helpers import utils
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+COLUMNS = (
+    "page",
+    "index",
+    "title",
+    "price",
+    "review_score",
+    "rating_stars",
+    "recommended_units",
+    "duration_member_info",
+)
+
+
+def stay_nights(request_data: dict) -> int:
+    """Number of nights of a search request
+
+    Args:
+        request_data (dict): Search request with `x_nights` or `check_in_date` and `check_out_date`
+
+    Raises:
+        ValueError: if the search request has neither nights nor check in / out dates
+
+    Returns:
+        int: Number of nights
+    """
+    if "x_nights" in request_data:
+        return request_data["x_nights"]
+    if "check_in_date" not in request_data or "check_out_date" not in request_data:
+        raise ValueError("Search request needs x_nights or check_in_date and check_out_date")
+    return (
+        utils.parse_datetime(request_data["check_out_date"], constants.YMD_DATE_FORMAT)
+        - utils.parse_datetime(request_data["check_in_date"], constants.YMD_DATE_FORMAT)
+    ).days
+
+
+def duration_and_members(request_data: dict) -> str:
+    """Build the stay duration and guests text shown on property cards for a search request
+
+    Args:
+        request_data (dict): Search request with nights, see `stay_nights`, and `adults` / `children`
+
+    Returns:
+        str: Duration and members text, e.g. "2 weeks, 2 adults, 1 child"
+    """
+    x_nights = stay_nights(request_data)
+    adults = request_data.get("adults", 1)
+    children = request_data.get("children", 0)
+    parts = []
+    if x_nights % 7 == 0:
+        weeks = x_nights // 7
+        parts.append(f"{weeks} week" if weeks == 1 else f"{weeks} weeks")
+    else:
+        parts.append(f"{x_nights} night" if x_nights == 1 else f"{x_nights} nights")
+    parts.append(f"{adults} adult" if adults == 1 else f"{adults} adults")
+    if children:
+        parts.append(f"{children} child" if children == 1 else f"{children} children")
+    return ", ".join(parts)
+
+
+class PropertyCardRecord:
+    """Property card record scraped from search results"""
+
+    __slots__ = COLUMNS
+
+    def __init__(self, **fields):
+        for field in self.__slots__:
+            setattr(self, field, fields.get(field))
+
+    @classmethod
+    def from_card_texts(cls, card: dict, page: int, index: int) -> "PropertyCardRecord":
+        """Build record from property card texts
+
+        Args:
+            card (dict): Property card detail texts
+            page (int): Results page number
+            index (int): Property index across results
+
+        Returns:
+            PropertyCardRecord: Property card record with numbers parsed from texts
+        """
+        price = card.get("price")
+        return cls(
+            page=page,
+            index=index,
+            title=card.get("title"),
+            price=utils.get_number_from_text(price) if price else None,
+            review_score=utils.get_decimal_from_text(card.get("review_score")),
+            rating_stars=card.get("rating_stars") or 0,
+            recommended_units=card.get("recommended_units") or "",
+            duration_member_info=card.get("duration_member_info") or "",
+        )
+
+    def to_dict(self) -> dict:
+        """Record as dictionary"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class PropertyResultsTable:
+    """Columnar table of property card records"""
+
+    def __init__(self, records: Iterable[PropertyCardRecord] = ()):
+        self.page = array("I")
+        self.index = array("I")
+        self.price = array("d")
+        self.review_score = array("d")
+        self.rating_stars = array("B")
+        self.title: List[str] = []
+        self.recommended_units: List[str] = []
+        self.duration_member_info: List[str] = []
+        for record in records:
+            self.append(record)
+
+    def __len__(self):
+        return len(self.index)
+
+    def append(self, record: PropertyCardRecord):
+        """Append record to columns, missing numbers are stored as NaN"""
+        self.page.append(record.page)
+        self.index.append(record.index)
+        self.price.append(math.nan if record.price is None else record.price)
+        self.review_score.append(
+            math.nan if record.review_score is None else record.review_score
+        )
+        self.rating_stars.append(record.rating_stars)
+        self.title.append(record.title or "")
+        self.recommended_units.append(record.recommended_units)
+        self.duration_member_info.append(record.duration_member_info)
+
+    def columns(self) -> dict:
+        """Columns as NumPy arrays"""
+        import numpy as np  # pylint:disable=C0415
+
+        return {
+            "page": np.array(self.page, dtype=np.uint32),
+            "index": np.array(self.index, dtype=np.uint32),
+            "title": np.array(self.title, dtype=str),
+            "price": np.array(self.price, dtype=np.float64),
+            "review_score": np.array(self.review_score, dtype=np.float64),
+            "rating_stars": np.array(self.rating_stars, dtype=np.uint8),
+            "recommended_units": np.array(self.recommended_units, dtype=str),
+            "duration_member_info": np.array(self.duration_member_info, dtype=str),
+        }
+
+    def rows(self) -> Iterable[dict]:
+        """Rows as dictionaries"""
+        for values in zip(*(getattr(self, name) for name in COLUMNS)):
+            row = dict(zip(COLUMNS, values))
+            for name in ("price", "review_score"):
+                if math.isnan(row[name]):
+                    row[name] = None
+            yield row
+
+    def check_filters(self, request_data: dict, filter_data: dict) -> List[str]:
+        """Check all records against applied Filter with vectorized column operations
+
+        Args:
+            request_data (dict): Search request, its nights and guests are needed for the budget filter
+            filter_data (dict): Filter Data dictionary
+
+        Raises:
+            ValueError: if the budget filter is applied and the search request has no nights
+
+        Returns:
+            list: Failure messages, empty if every record satisfies all filters
+        """
+        import numpy as np  # pylint:disable=C0415
+
+        columns = self.columns()
+        failures = []
+        for group, value in filter_data.items():
+            if group == "Review score":
+                passed = columns["review_score"] > utils.get_number_from_text(value)
+            elif group == "Property rating":
+                passed = columns["rating_stars"] == utils.get_number_from_text(value)
+            elif group == "Reservation policy":
+                passed = np.char.find(columns["recommended_units"], value) >= 0
+            elif group == "Your budget (per night)":
+                passed = (
+                    columns["duration_member_info"] == duration_and_members(request_data)
+                ) & (columns["price"] / stay_nights(request_data) <= value)
+            else:
+                continue
+            for i in np.flatnonzero(~passed):
+                failures.append(
+                    f"Property {columns['index'][i]} '{columns['title'][i]}' on page {columns['page'][i]} "
+                    f"does not match {group} {value}"
+                )
+        return failures
+
+    def export(self, path: str, export_format: str = None) -> str:
+        """Export records as CSV, JSON Lines or Parquet
+
+        Args:
+            path (str): Export file path, the extension is added when missing
+            export_format (str, optional): csv, jsonl or parquet. Defaults to file extension.
+
+        Raises:
+            ValueError: if export format is not supported
+            ImportError: if Parquet is requested and pyarrow is not installed
+
+        Returns:
+            str: Exported file path
+        """
+        export_format = export_format or os.path.splitext(path)[1].lstrip(".")
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError("Unsupported export format " + export_format)
+        if not path.endswith("." + export_format):
+            path += "." + export_format
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        if export_format == "csv":
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=COLUMNS)
+                writer.writeheader()
+                writer.writerows(self.rows())
+        elif export_format == "jsonl":
+            with open(path, "w", encoding="utf-8") as f:
+                for row in self.rows():
+                    f.write(json.dumps(row) + "\n")
+        else:
+            try:
+                import pyarrow  # pylint:disable=C0415
+                import pyarrow.parquet  # pylint:disable=C0415
+            except ImportError as e:
+                raise ImportError("Parquet export requires pyarrow: pip install pyarrow") from e
+            pyarrow.parquet.write_table(pyarrow.table(self.columns()), path)
+
+        logger.info("Exported %s property results at Location : %s", len(self), path)
+        return path
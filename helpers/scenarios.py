@@ -0,0 +1,149 @@
+"""Scenarios to generate data driven search and filter test cases from YAML / JSON Lines data files"""
+
+import itertools
+import json
+import logging
+from typing import Dict, Iterator, List, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+REDUCTIONS = ("pairwise", "all")
+
+
+class Scenario(NamedTuple):
+    """Search request with the filters to apply on its results"""
+
+    search_request: dict
+    filter_data: dict
+
+    @property
+    def search_key(self) -> str:
+        """Key of the search, scenarios with the same key share one results page"""
+        return json.dumps(self.search_request, sort_keys=True)
+
+    @property
+    def id(self) -> str:
+        """Readable pytest id"""
+        search = self.search_request
+        parts = [search.get("dest_search", "")]
+        if {"adults", "children", "rooms"} & search.keys():
+            parts.append(f"{search.get('adults', 1)}a{search.get('children', 0)}c{search.get('rooms', 1)}r")
+        return "-".join(parts + [str(value) for value in self.filter_data.values()])
+
+
+def pairwise(sizes: List[int]) -> Iterator[List[int]]:
+    """Greedily generate value index combinations covering every value pair of any two dimensions
+
+    Args:
+        sizes (list): Number of values per dimension
+
+    Yields:
+        list: Value index per dimension
+    """
+    if len(sizes) < 2:
+        yield from ([index] for index in range(sizes[0] if sizes else 0))
+        return
+    uncovered = {
+        (i, a, j, b)
+        for i, j in itertools.combinations(range(len(sizes)), 2)
+        for a in range(sizes[i])
+        for b in range(sizes[j])
+    }
+    usage = [[0] * size for size in sizes]
+    while uncovered:
+        i, a, j, b = min(uncovered)
+        case = {i: a, j: b}
+        for k, size in enumerate(sizes):
+            if k in case:
+                continue
+            # Value covering most uncovered pairs with the values chosen so far, least used on ties
+            case[k] = max(
+                range(size),
+                key=lambda value, k=k: (
+                    sum(
+                        (min(k, d), value if k < d else v, max(k, d), v if k < d else value) in uncovered
+                        for d, v in case.items()
+                    ),
+                    -usage[k][value],
+                ),
+            )
+        uncovered -= {
+            (i, case[i], j, case[j]) for i, j in itertools.combinations(range(len(sizes)), 2)
+        }
+        for k, value in case.items():
+            usage[k][value] += 1
+        yield [case[k] for k in range(len(sizes))]
+
+
+def combine(search_dimensions: Dict[str, list], filter_dimensions: Dict[str, list], reduction: str) -> Iterator[Scenario]:
+    """Combine dimension values into scenarios
+
+    Mapping values of a search dimension are merged into the search request, other values are set
+    under the dimension name. `null` filter values leave the filter out.
+
+    Args:
+        search_dimensions (dict): Search request dimension to its values
+        filter_dimensions (dict): Filter group to its values
+        reduction (str): `pairwise` to cover every value pair, `all` for every combination
+
+    Yields:
+        Scenario: Scenario per combination
+    """
+    dimensions = list(search_dimensions.items()) + list(filter_dimensions.items())
+    sizes = [len(values) for _, values in dimensions]
+    if reduction == "pairwise":
+        combinations = pairwise(sizes)
+    else:
+        combinations = itertools.product(*(range(size) for size in sizes))
+    for combination in combinations:
+        search_request, filter_data = {}, {}
+        for position, ((name, values), index) in enumerate(zip(dimensions, combination)):
+            value = values[index]
+            if position >= len(search_dimensions):
+                if value is not None:
+                    filter_data[name] = value
+            elif isinstance(value, dict):
+                search_request.update(value)
+            else:
+                search_request[name] = value
+        yield Scenario(search_request, filter_data)
+
+
+def iter_scenarios(path: str, reduction: str = "pairwise") -> Iterator[Scenario]:
+    """Read scenarios of data file as they are consumed
+
+    JSON Lines files hold one `{"search_request": ..., "filter_data": ...}` scenario per line.
+    YAML files hold `search` and `filters` dimensions which are combined as per reduction.
+
+    Args:
+        path (str): Scenario data file
+        reduction (str, optional): `pairwise` or `all`. Defaults to pairwise.
+
+    Yields:
+        Scenario: Scenarios of the data file
+    """
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    data = json.loads(line)
+                    yield Scenario(data["search_request"], data.get("filter_data", {}))
+        return
+    import yaml  # pylint:disable=C0415
+
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    yield from combine(data.get("search", {}), data.get("filters", {}), reduction)
+
+
+def load_grouped_scenarios(path: str, reduction: str = "pairwise") -> List[Scenario]:
+    """Load scenarios ordered so that scenarios sharing a search run one after another"""
+    scenarios = list(iter_scenarios(path, reduction))
+    order = {}
+    for scenario in scenarios:
+        order.setdefault(scenario.search_key, len(order))
+    scenarios.sort(key=lambda scenario: order[scenario.search_key])
+    logger.info(
+        "Loaded %s scenarios of %s searches from %s", len(scenarios), len(order), path
+    )
+    return scenarios
@@ -0,0 +1,219 @@
+"""Screencast to keep the last low resolution frames of the browser, encoded only when a test fails"""
+
+import base64
+import collections
+import io
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Deque, Optional, Tuple
+
+from selenium.webdriver.remote.command import Command
+
+import constants
+from helpers import utils
+
+if TYPE_CHECKING:
+    import trio
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = logging.getLogger(__name__)
+
+SCREENCASTS_DIR = os.path.join(constants.RESULTS_DIR, "screencasts")
+LAST_FRAME_MS = 1000
+
+
+def load_pillow():
+    """Pillow Image module imported on first use, None when Pillow is not installed"""
+    try:
+        from PIL import Image  # pylint:disable=C0415
+    except ImportError:
+        return None
+    return Image
+
+
+class ScreencastBuffer:
+    """Bounded ring buffer of browser frames captured in a background thread
+
+    Chromium browsers push JPEG frames with CDP `Page.startScreencast`, acknowledged at most once per
+    interval to throttle the browser. Other browsers, or when CDP is unavailable, are polled with
+    screenshots. Frames are held in memory only, until `save` encodes them as an animated GIF.
+    """
+
+    def __init__(
+        self,
+        driver: "WebDriver",
+        max_frames: int = 50,
+        interval: float = 0.2,
+        poll_interval: float = 0.5,
+        max_width: int = 640,
+        quality: int = 40,
+    ):
+        self.driver = driver
+        self.frames: Deque[Tuple[float, bytes]] = collections.deque(maxlen=max_frames)
+        self.interval = interval
+        self.poll_interval = poll_interval
+        self.max_width = max_width
+        self.quality = quality
+        self.mode = None
+        self.lock = threading.Lock()
+        self._connection = None
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self, timeout: float = 10) -> "ScreencastBuffer":
+        """Start capturing frames
+
+        Waits until the capture is set up so that its WebDriver commands are issued before the command
+        executor is wrapped, e.g. by trace recording or command profiling.
+
+        Args:
+            timeout (float, optional): Max seconds to wait for the capture to start. Defaults to 10.
+
+        Returns:
+            ScreencastBuffer: self
+        """
+        self._connection = self.driver.command_executor
+        cdp = self.driver.capabilities["browserName"].lower() != "firefox"
+        self._thread = threading.Thread(
+            target=self._run, args=(cdp,), name="screencast", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait(timeout)
+        logger.info("Screencast started with %s", self.mode)
+        return self
+
+    def stop(self):
+        """Stop capturing frames"""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(5)
+
+    def clear(self):
+        """Drop captured frames, e.g. at the start of a test"""
+        with self.lock:
+            self.frames.clear()
+
+    def _add_frame(self, frame: bytes):
+        with self.lock:
+            self.frames.append((time.monotonic(), frame))
+
+    def _run(self, cdp: bool):
+        if cdp:
+            try:
+                import trio  # pylint:disable=C0415,W0621
+
+                trio.run(self._cdp_screencast)
+                return
+            except Exception as e:  # pylint:disable=W0718
+                logger.warning("CDP screencast unavailable, polling screenshots : %s", e)
+        self._poll_screenshots()
+
+    async def _cdp_screencast(self):
+        """Receive screencast frames until stopped"""
+        import trio  # pylint:disable=C0415,W0621
+
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            frames = session.listen(devtools.page.ScreencastFrame, buffer_size=2)
+            await session.execute(
+                devtools.page.start_screencast(
+                    format_="jpeg",
+                    quality=self.quality,
+                    max_width=self.max_width,
+                    max_height=self.max_width,
+                )
+            )
+            self.mode = "CDP screencast"
+            self._ready.set()
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(self._cancel_on_stop, nursery.cancel_scope)
+                async for frame in frames:
+                    self._add_frame(base64.b64decode(frame.data))
+                    # Browser sends the next frame only after the ack
+                    await trio.sleep(self.interval)
+                    await session.execute(devtools.page.screencast_frame_ack(frame.session_id))
+
+    async def _cancel_on_stop(self, cancel_scope: "trio.CancelScope"):
+        import trio  # pylint:disable=C0415,W0621
+
+        while not self._stopped.is_set():
+            await trio.sleep(0.1)
+        cancel_scope.cancel()
+
+    def _poll_screenshots(self):
+        """Take viewport screenshots until stopped, on the unwrapped command executor"""
+        self.mode = "screenshot polling"
+        self._ready.set()
+        while not self._stopped.wait(self.poll_interval):
+            try:
+                response = self._connection.execute(
+                    Command.SCREENSHOT, {"sessionId": self.driver.session_id}
+                )
+                self._add_frame(self._shrink(base64.b64decode(response["value"])))
+            except Exception as e:  # pylint:disable=W0718
+                logger.debug("Screencast screenshot failed : %s", e)
+
+    def _shrink(self, png: bytes) -> bytes:
+        """Downscale screenshot to a low resolution JPEG when Pillow is installed"""
+        image_module = load_pillow()
+        if image_module is None:
+            return png
+        image = image_module.open(io.BytesIO(png)).convert("RGB")
+        image.thumbnail((self.max_width, self.max_width))
+        output = io.BytesIO()
+        image.save(output, "JPEG", quality=self.quality)
+        return output.getvalue()
+
+    def save(self, screencast_name: str) -> Optional[str]:
+        """Encode buffered frames as animated GIF, or save the last frame only without Pillow
+
+        Args:
+            screencast_name (str): Screencast name prefix
+
+        Returns:
+            str: Saved file path, None when there are no frames
+        """
+        with self.lock:
+            frames = list(self.frames)
+        if not frames:
+            return None
+        screencasts_dir = utils.thread_artifact_dir(SCREENCASTS_DIR)
+        os.makedirs(screencasts_dir, exist_ok=True)
+        time_stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        image_module = load_pillow()
+        if image_module is None:
+            frame = frames[-1][1]
+            extension = "png" if frame.startswith(b"\x89PNG") else "jpg"
+            screencast_path = os.path.join(
+                screencasts_dir, f"{screencast_name}_{time_stamp}.{extension}"
+            )
+            with open(screencast_path, "wb") as f:
+                f.write(frame)
+            logger.warning("Install Pillow to encode screencasts, saved last frame only")
+        else:
+            screencast_path = os.path.join(
+                screencasts_dir, f"{screencast_name}_{time_stamp}.gif"
+            )
+            images = []
+            for _, frame in frames:
+                image = image_module.open(io.BytesIO(frame)).convert("RGB")
+                image.thumbnail((self.max_width, self.max_width))
+                images.append(image)
+            durations = [
+                max(20, round((current - previous) * 1000))
+                for (previous, _), (current, _) in zip(frames, frames[1:])
+            ] + [LAST_FRAME_MS]
+            images[0].save(
+                screencast_path,
+                save_all=True,
+                append_images=images[1:],
+                duration=durations,
+                loop=0,
+                optimize=True,
+            )
+        logger.info("Screencast saved at Location : %s", screencast_path)
+        return screencast_path
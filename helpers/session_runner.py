@@ -0,0 +1,140 @@
+"""Session Runner to run the selected tests on several pytest sessions concurrently, one browser session each
+
+Usage: python -m helpers.session_runner [--workers N] [--grid-url URL] [pytest args...]
+Selected tests are dealt out to at most `--workers` pytest processes with `--shard`, by default the free
+slots of `--grid-url` or half the CPUs for local browsers. Each worker keeps its own artifacts directory.
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess  # nosec B404
+import sys
+import time
+from collections import Counter
+from typing import List, Optional, Tuple
+from urllib.error import URLError
+from urllib.request import urlopen
+
+import pytest
+
+import constants
+from helpers.matrix_runner import merge_results, start_pytest_run
+
+logger = logging.getLogger(__name__)
+
+WORKERS_DIR = os.path.join(constants.RESULTS_DIR, "workers")
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse `--shard` value `I/N` into zero based shard index and shard count"""
+    index, count = (int(part) for part in value.split("/"))
+    if not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"Shard index must be within 0 and {count - 1} : {value}")
+    return index, count
+
+
+def grid_slots(grid_url: str) -> Optional[int]:
+    """Get free browser slots of a Selenium Grid, None when its status is unavailable"""
+    try:
+        with urlopen(f"{grid_url.rstrip('/')}/status", timeout=10) as response:  # nosec B310
+            status = json.load(response)
+    except (URLError, OSError, ValueError) as e:
+        logger.warning("Unable to get Selenium Grid status : %s", e)
+        return None
+    return sum(
+        1
+        for node in status["value"].get("nodes", [])
+        if node.get("availability") == "UP"
+        for slot in node.get("slots", [])
+        if not slot.get("session")
+    )
+
+
+def count_selected_tests(pytest_args: List[str]) -> int:
+    """Count the tests pytest selects for the arguments, 0 when collection fails"""
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-m", "pytest", "--collect-only", "-qq", *pytest_args],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+        logger.error("Test collection failed :\n%s", result.stdout + result.stderr)
+        return 0
+    return sum(1 for line in result.stdout.splitlines() if "::" in line)
+
+
+def start_worker(shard: str, pytest_args: List[str], workers_dir: str) -> subprocess.Popen:
+    """Start pytest for a shard of the selected tests with its own artifacts directory and streamed report
+
+    Args:
+        shard (str): Shard of the worker, `I/N`
+        pytest_args (list): Extra pytest arguments
+        workers_dir (str): Workers results directory
+
+    Returns:
+        subprocess.Popen: pytest process, output is written to `worker-<I>/pytest-output.log`
+    """
+    results_dir = os.path.join(workers_dir, f"worker-{shard.split('/')[0]}")
+    return start_pytest_run(results_dir, ["--shard", shard, *pytest_args])
+
+
+def run_sessions(workers: int, pytest_args: List[str], workers_dir: str = WORKERS_DIR) -> int:
+    """Run the selected tests on at most `workers` concurrent pytest sessions and merge the results
+
+    Args:
+        workers (int): Max concurrent browser sessions
+        pytest_args (list): Extra pytest arguments, e.g. tests to select
+        workers_dir (str, optional): Workers results directory. Defaults to test-results/workers.
+
+    Returns:
+        int: Highest pytest exit code of all workers
+    """
+    start = time.perf_counter()
+    selected = count_selected_tests(pytest_args)
+    if not selected:
+        logger.error("No tests selected")
+        return pytest.ExitCode.NO_TESTS_COLLECTED
+    workers = min(workers, selected)
+    logger.info("Running %s tests on %s sessions", selected, workers)
+    processes = {
+        f"worker-{index}": start_worker(f"{index}/{workers}", pytest_args, workers_dir)
+        for index in range(workers)
+    }
+    returncodes = {name: process.wait() for name, process in processes.items()}
+
+    results = merge_results(list(processes), workers_dir)
+    outcomes = Counter(
+        result["outcome"] for worker_results in results.values() for result in worker_results.values()
+    )
+    with open(os.path.join(workers_dir, "session-report.json"), "w", encoding="utf-8") as f:
+        json.dump({"returncodes": returncodes, "tests": results}, f, indent=2)
+    print(
+        f"{workers} sessions finished in {time.perf_counter() - start:.1f}s, "
+        + ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items()))
+        + f", results at {workers_dir}"
+    )
+    return max(returncodes.values())
+
+
+def main(argv: List[str] = None) -> int:
+    """Parse workers and pass every other argument to pytest"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, help="Max concurrent browser sessions")
+    parser.add_argument("--grid-url", help="Selenium Grid Hub URL, its free slots bound the workers")
+    parser.add_argument("--workers-dir", default=WORKERS_DIR, help="Workers results directory")
+    args, pytest_args = parser.parse_known_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    workers = args.workers
+    if args.grid_url:
+        pytest_args = ["--grid-url", args.grid_url, *pytest_args]
+        slots = grid_slots(args.grid_url)
+        workers = workers or (max(1, slots) if slots is not None else None)
+    workers = max(1, workers or (os.cpu_count() or 2) // 2)
+    return run_sessions(workers, pytest_args, args.workers_dir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
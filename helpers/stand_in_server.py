@@ -0,0 +1,168 @@
+"""Stand-in Server serving a local copy of the home and search results pages for offline load runs
+
+Usage: python -m helpers.stand_in_server [--port PORT] [--latency-ms MS]
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import random
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stand_in_site")
+DESTINATIONS = [
+    ("Chennai", "Tamil Nadu, India"),
+    ("Chennai Central", "Chennai, Tamil Nadu, India"),
+    ("Chengalpattu", "Tamil Nadu, India"),
+    ("Bengaluru", "Karnataka, India"),
+    ("Mumbai", "Maharashtra, India"),
+    ("Goa", "India"),
+    ("Paris", "Ile de France, France"),
+    ("London", "Greater London, United Kingdom"),
+]
+PROPERTIES_PER_DESTINATION = 60
+MAX_RESULTS = 25
+
+
+@functools.lru_cache(maxsize=None)
+def get_properties(destination: str) -> List[dict]:
+    """Generate the same properties of a destination on every call"""
+    rng = random.Random(destination)  # nosec B311
+    return [
+        {
+            "name": f"{destination} Stay {index}",
+            "stars": rng.randint(1, 5),
+            "review_score": round(rng.uniform(5, 9.8), 1),
+            "free_cancellation": rng.random() < 0.6,
+            "price": rng.randrange(1000, 20000, 100),
+        }
+        for index in range(1, PROPERTIES_PER_DESTINATION + 1)
+    ]
+
+
+class StandInRequestHandler(SimpleHTTPRequestHandler):
+    """Serves site files with `autocomplete` and `searchresults` JSON endpoints"""
+
+    latency_ms = 0
+
+    def log_message(self, format, *args):  # pylint:disable=W0622
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def end_headers(self):
+        # Site scripts and styles are immutable like the static assets of the real site
+        if urlparse(self.path).path.endswith((".css", ".js")):
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        super().end_headers()
+
+    def send_json(self, data):
+        """Send data as JSON response after the configured backend latency"""
+        time.sleep(self.latency_ms / 1000)
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # pylint:disable=C0103
+        """Serve JSON endpoints, else site files"""
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path == "/autocomplete":
+            text = query.get("q", "").strip().lower()
+            matches = [
+                {"name": name, "region": region}
+                for name, region in DESTINATIONS
+                if text and name.lower().startswith(text)
+            ]
+            self.send_json(matches)
+        elif url.path == "/searchresults":
+            self.send_json(self.search_results(query))
+        else:
+            super().do_GET()
+
+    @staticmethod
+    def search_results(query: dict) -> dict:
+        """Filter properties of destination by stars, free cancellation and max price per night"""
+        destination = query.get("ss", "")
+        stars = {int(value) for value in query.get("stars", "").split(",") if value}
+        max_price = int(query["max_price"]) if "max_price" in query else None
+        properties = [
+            prop
+            for prop in get_properties(destination)
+            if (not stars or prop["stars"] in stars)
+            and (query.get("free_cancellation") != "1" or prop["free_cancellation"])
+            and (max_price is None or prop["price"] <= max_price)
+        ]
+        return {
+            "destination": destination,
+            "total": len(properties),
+            "properties": properties[:MAX_RESULTS],
+        }
+
+
+class StandInServer:
+    """Stand-in site served from a background thread"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: int = 0):
+        handler = type(
+            "Handler",
+            (StandInRequestHandler,),
+            {"latency_ms": latency_ms},
+        )
+        self.server = ThreadingHTTPServer(
+            (host, port), functools.partial(handler, directory=SITE_DIR)
+        )
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name="stand-in-server", daemon=True
+        )
+
+    @property
+    def url(self) -> str:
+        """URL of the home page"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/index.html"
+
+    def start(self) -> "StandInServer":
+        """Start serving requests"""
+        self.thread.start()
+        logger.info("Stand-in site is served at %s", self.url)
+        return self
+
+    def stop(self):
+        """Stop serving requests"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    """Serve stand-in site until interrupted"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=int, default=0, help="Delay of JSON endpoints")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    with StandInServer(port=args.port, latency_ms=args.latency_ms) as server:
+        print(f"Serving stand-in site at {server.url}, press Ctrl+C to stop")
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+// Stand-in for the home and search results pages, mimics the markup targeted by locators/*.py
+const StandIn = (() => {
+    const $ = (selector) => document.querySelector(selector);
+    const pad = (n) => String(n).padStart(2, "0");
+    const isoDate = (d) => `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())}`;
+    const parseDate = (s) => {
+        const [year, month, day] = s.split("-").map(Number);
+        return new Date(year, month - 1, day);
+    };
+    const displayDate = (d) =>
+        `${d.toLocaleDateString("en-US", {weekday: "short"})}, ${d.toLocaleDateString("en-US", {month: "short"})} ${d.getDate()}`;
+    const formatNumber = (n) => n.toLocaleString("en-US");
+
+    function signInDialog() {
+        const dialog = $("#sign-in-dialog");
+        dialog.hidden = sessionStorage.getItem("signInDismissed") === "1";
+        dialog.querySelector("button").addEventListener("click", () => {
+            dialog.hidden = true;
+            sessionStorage.setItem("signInDismissed", "1");
+        });
+    }
+
+    function currencyPicker() {
+        const trigger = $('[data-testid="header-currency-picker-trigger"]');
+        const list = $("#currency-list");
+        trigger.textContent = sessionStorage.getItem("currency") || "USD";
+        trigger.addEventListener("click", () => (list.hidden = !list.hidden));
+        list.addEventListener("click", (event) => {
+            if (event.target.matches("button")) {
+                trigger.textContent = event.target.textContent;
+                sessionStorage.setItem("currency", event.target.textContent);
+                list.hidden = true;
+            }
+        });
+    }
+
+    function autocomplete() {
+        const input = $('[placeholder="Where are you going?"]');
+        const results = $("#autocomplete-results");
+        let timer = null;
+        let sequence = 0;
+        input.addEventListener("input", () => {
+            clearTimeout(timer);
+            timer = setTimeout(async () => {
+                const current = ++sequence;
+                const response = await fetch("autocomplete?q=" + encodeURIComponent(input.value));
+                const destinations = await response.json();
+                if (current !== sequence) {
+                    return;
+                }
+                results.innerHTML = "";
+                for (const destination of destinations) {
+                    const item = document.createElement("li");
+                    item.innerHTML = "<div></div><div></div>";
+                    item.children[0].textContent = destination.name;
+                    item.children[1].textContent = destination.region;
+                    item.addEventListener("click", () => {
+                        const value = `${destination.name}, ${destination.region}`;
+                        input.value = value;
+                        input.setAttribute("value", value);
+                        results.hidden = true;
+                    });
+                    results.appendChild(item);
+                }
+                results.hidden = destinations.length === 0;
+            }, 150);
+        });
+    }
+
+    function datePicker(state) {
+        const months = $("#months");
+        const today = new Date();
+        let first = new Date(today.getFullYear(), today.getMonth(), 1);
+        const render = () => {
+            months.innerHTML = "";
+            for (let offset = 0; offset < 2; offset++) {
+                const month = new Date(first.getFullYear(), first.getMonth() + offset, 1);
+                const table = document.createElement("table");
+                table.innerHTML = `<caption>${month.toLocaleDateString("en-US", {month: "long", year: "numeric"})}</caption>`;
+                let row = table.insertRow();
+                for (let blank = 0; blank < month.getDay(); blank++) {
+                    row.insertCell();
+                }
+                for (let day = new Date(month); day.getMonth() === month.getMonth(); day.setDate(day.getDate() + 1)) {
+                    if (day.getDay() === 0 && day.getDate() !== 1) {
+                        row = table.insertRow();
+                    }
+                    const cell = row.insertCell();
+                    cell.dataset.date = isoDate(day);
+                    cell.innerHTML = `<span>${day.getDate()}</span>`;
+                    if (cell.dataset.date === state.checkIn || cell.dataset.date === state.checkOut) {
+                        cell.classList.add("selected");
+                    }
+                }
+                months.appendChild(table);
+            }
+        };
+        const move = (delta) => {
+            first = new Date(first.getFullYear(), first.getMonth() + delta, 1);
+            render();
+        };
+        $('[aria-label="Next month"]').addEventListener("click", () => move(1));
+        $('[aria-label="Previous month"]').addEventListener("click", () => move(-1));
+        months.addEventListener("click", (event) => {
+            const cell = event.target.closest("[data-date]");
+            if (!cell) {
+                return;
+            }
+            const date = cell.dataset.date;
+            if (!state.checkIn || state.checkOut || date <= state.checkIn) {
+                state.checkIn = date;
+                state.checkOut = null;
+            } else {
+                state.checkOut = date;
+            }
+            $('[data-testid="date-display-field-start"]').textContent =
+                state.checkIn ? displayDate(parseDate(state.checkIn)) : "Check-in date";
+            $('[data-testid="date-display-field-end"]').textContent =
+                state.checkOut ? displayDate(parseDate(state.checkOut)) : "Check-out date";
+            render();
+        });
+        render();
+    }
+
+    function home() {
+        const state = {checkIn: null, checkOut: null};
+        signInDialog();
+        currencyPicker();
+        autocomplete();
+        datePicker(state);
+        $("#searchbox").addEventListener("submit", (event) => {
+            event.preventDefault();
+            const destination = $('[placeholder="Where are you going?"]').value;
+            const params = new URLSearchParams({
+                ss: destination.split(",")[0],
+                checkin: state.checkIn || "",
+                checkout: state.checkOut || "",
+            });
+            location.href = "search.html?" + params;
+        });
+    }
+
+    function results() {
+        const query = new URLSearchParams(location.search);
+        const filters = {stars: new Set(), free_cancellation: false, max_price: null};
+        const currency = sessionStorage.getItem("currency") === "INR" ? "₹" : "US$";
+        const nights = query.get("checkin") && query.get("checkout")
+            ? Math.round((parseDate(query.get("checkout")) - parseDate(query.get("checkin"))) / 86400000)
+            : 1;
+        let sequence = 0;
+
+        const renderTags = () => {
+            const tags = [...filters.stars].sort().map((stars) => (stars === "1" ? "1 star" : `${stars} stars`));
+            if (filters.free_cancellation) {
+                tags.push("Free cancellation");
+            }
+            if (filters.max_price !== null) {
+                tags.push(`${currency} 0 – ${currency} ${formatNumber(filters.max_price)} (per night)`);
+            }
+            $("#filter-tags").innerHTML = "";
+            for (const tag of tags) {
+                const span = document.createElement("span");
+                span.textContent = tag;
+                $("#filter-tags").appendChild(span);
+            }
+        };
+
+        const load = async () => {
+            const current = ++sequence;
+            const params = new URLSearchParams({ss: query.get("ss") || "", nights: nights});
+            if (filters.stars.size) {
+                params.set("stars", [...filters.stars].join(","));
+            }
+            if (filters.free_cancellation) {
+                params.set("free_cancellation", "1");
+            }
+            if (filters.max_price !== null) {
+                params.set("max_price", filters.max_price);
+            }
+            const response = await fetch("searchresults?" + params);
+            const data = await response.json();
+            if (current !== sequence) {
+                return;
+            }
+            $("#results-title").textContent = `${data.destination}: ${data.total} properties found`;
+            const cards = $("#property-cards");
+            cards.innerHTML = "";
+            for (const property of data.properties) {
+                const card = document.createElement("div");
+                card.dataset.testid = "property-card";
+                card.innerHTML = `
+                    <div data-testid="title"></div>
+                    <div data-testid="rating-stars">${"<span></span>".repeat(property.stars)}</div>
+                    <div data-testid="review-score"><div>Scored ${property.review_score}</div><div>${property.review_score}</div></div>
+                    <div data-testid="recommended-units"><span>${property.free_cancellation ? "Free cancellation" : "Pay at the property"}</span></div>
+                    <span data-testid="price-and-discounted-price">${currency} ${formatNumber(property.price * nights)}</span>
+                    <div data-testid="price-for-x-nights">${nights} night${nights === 1 ? "" : "s"}, 2 adults</div>`;
+                card.querySelector('[data-testid="title"]').textContent = property.name;
+                cards.appendChild(card);
+            }
+            renderTags();
+        };
+
+        document.querySelectorAll(".filter").forEach((element) =>
+            element.addEventListener("click", () => {
+                if (element.dataset.filter === "stars") {
+                    const stars = element.dataset.value;
+                    filters.stars.has(stars) ? filters.stars.delete(stars) : filters.stars.add(stars);
+                } else {
+                    filters.free_cancellation = !filters.free_cancellation;
+                }
+                element.classList.toggle("active");
+                load();
+            })
+        );
+        const track = $(".slider-track");
+        track.addEventListener("click", (event) => {
+            const ranges = document.querySelectorAll('[data-filters-group="price"] [type="range"]');
+            const min = Number(ranges[0].value);
+            const max = Number(ranges[1].max);
+            const ratio = (event.clientX - track.getBoundingClientRect().left) / track.offsetWidth;
+            filters.max_price = Math.round((min + ratio * (max - min)) / 100) * 100;
+            ranges[1].value = filters.max_price;
+            load();
+        });
+        load();
+    }
+
+    return {home, results};
+})();
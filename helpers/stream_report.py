@@ -0,0 +1,120 @@
+"""Stream Report to write test results incrementally as JSON Lines and HTML with external artifacts"""
+
+import html
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from datetime import datetime
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+_HTML_HEADER = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Test Report</title>
+<style>
+body { font-family: sans-serif; margin: 1em; }
+table { border-collapse: collapse; width: 100%; }
+td, th { border: 1px solid #ccc; padding: 4px 8px; vertical-align: top; text-align: left; }
+tr.passed td:first-child { color: green; }
+tr.failed td:first-child, tr.error td:first-child { color: red; }
+tr.skipped td:first-child { color: orange; }
+pre { white-space: pre-wrap; max-height: 30em; overflow: auto; margin: 0; }
+img { max-width: 60em; }
+</style>
+<script>
+function toggle(outcome, show) {
+    document.querySelectorAll("tr." + outcome).forEach((row) => row.hidden = !show);
+}
+</script>
+</head>
+<body>
+<h1>Test Report</h1>
+<p>Started __STARTED__. Show:
+<label><input type="checkbox" checked onchange="toggle('passed', this.checked)"> passed</label>
+<label><input type="checkbox" checked onchange="toggle('failed', this.checked)"> failed</label>
+<label><input type="checkbox" checked onchange="toggle('error', this.checked)"> error</label>
+<label><input type="checkbox" checked onchange="toggle('skipped', this.checked)"> skipped</label>
+</p>
+<table>
+<tr><th>Result</th><th>Test</th><th>Duration</th><th>Details</th></tr>
+"""
+
+
+class StreamReport:
+    """Test report written as results arrive, artifacts are referenced as files and loaded lazily"""
+
+    def __init__(self, report_dir: str):
+        self.report_dir = report_dir
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        os.makedirs(report_dir, exist_ok=True)
+        self.jsonl_path = os.path.join(report_dir, "report.jsonl")
+        self.html_path = os.path.join(report_dir, "report.html")
+        self._jsonl = open(self.jsonl_path, "w", encoding="utf-8", buffering=1)  # pylint:disable=R1732
+        self._html = open(self.html_path, "w", encoding="utf-8", buffering=1)  # pylint:disable=R1732
+        self._html.write(
+            _HTML_HEADER.replace("__STARTED__", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        )
+
+    @staticmethod
+    def get_outcome(report: pytest.TestReport) -> str:
+        """Get result of report, failures outside test call are errors"""
+        if report.failed and report.when != "call":
+            return "error"
+        return report.outcome
+
+    def add(self, report: pytest.TestReport, artifacts: dict = None):
+        """Write result of a test phase, passed setup and teardown are not reported
+
+        Args:
+            report (pytest.TestReport): Test phase report
+            artifacts (dict, optional): Artifact name to file path. Defaults to None.
+        """
+        if report.when != "call" and report.passed:
+            return
+        outcome = self.get_outcome(report)
+        artifacts = {
+            name: os.path.relpath(path, self.report_dir).replace(os.sep, "/")
+            for name, path in (artifacts or {}).items()
+        }
+        details = report.longreprtext if not report.passed else ""
+        entry = {
+            "nodeid": report.nodeid,
+            "when": report.when,
+            "outcome": outcome,
+            "duration": round(report.duration, 3),
+            "details": details,
+            "artifacts": artifacts,
+        }
+        cells = [f"<pre>{html.escape(details)}</pre>"] if details else []
+        for name, path in artifacts.items():
+            if path.endswith((".png", ".jpg", ".gif")):
+                cells.append(
+                    f'<details><summary>{html.escape(name)}</summary>'
+                    f'<a href="{html.escape(path)}"><img loading="lazy" src="{html.escape(path)}"></a></details>'
+                )
+            else:
+                cells.append(f'<a href="{html.escape(path)}">{html.escape(name)}</a>')
+        with self.lock:
+            self.counts[outcome] += 1
+            self._jsonl.write(json.dumps(entry) + "\n")
+            self._html.write(
+                f'<tr class="{outcome}"><td>{outcome}</td><td>{html.escape(report.nodeid)} ({report.when})</td>'
+                f'<td>{report.duration:.2f}s</td><td>{"".join(cells)}</td></tr>\n'
+            )
+
+    def close(self):
+        """Write summary and close report files"""
+        if self._html.closed:
+            return
+        summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(self.counts.items()))
+        self._html.write(f"</table>\n<p>{html.escape(summary or 'No tests')}</p>\n</body>\n</html>\n")
+        self._html.close()
+        self._jsonl.close()
+        logger.info("Stream report saved at Location : %s", self.html_path)
@@ -0,0 +1,284 @@
+"""Test Selection to run only tests affected by changed page objects and locators"""
+
+import ast
+import json
+import logging
+import os
+import subprocess  # nosec B404
+import sys
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES_DIR = "pages"
+LOCATORS_DIR = "locators"
+TESTS_DIR = "tests"
+# Changes to these files never affect test behaviour
+IGNORED_CHANGES = (".md", ".github/", ".gitignore", ".pylintrc")
+
+
+def _relpath(filename: str) -> str:
+    return os.path.relpath(filename, PROJECT_DIR).replace(os.sep, "/")
+
+
+def _git(*args: str) -> Optional[str]:
+    """Run git command in project dir, None if it fails"""
+    result = subprocess.run(  # nosec B603 B607
+        ["git", *args], cwd=PROJECT_DIR, capture_output=True, text=True, check=False
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+def _code_names(code) -> Set[str]:
+    """Global names referenced by code object and its nested functions"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_names"):
+            names |= _code_names(const)
+    return names
+
+
+def get_locator_index() -> Dict[str, str]:
+    """Map locator constant names to their locators module
+
+    Returns:
+        dict: Locator constant name to module path
+    """
+    index = {}
+    locators_dir = os.path.join(PROJECT_DIR, LOCATORS_DIR)
+    for file_name in sorted(os.listdir(locators_dir)):
+        if file_name.endswith(".py"):
+            with open(os.path.join(locators_dir, file_name), encoding="utf-8") as f:
+                for name in _top_level_definitions(f.read()):
+                    if name:
+                        index[name] = f"{LOCATORS_DIR}/{file_name}"
+    return index
+
+
+def _top_level_definitions(source: str) -> Dict[str, ast.AST]:
+    """Top level assignments, functions and classes with nested methods by qualified name
+
+    Classes map to their statements other than methods, other module statements such as imports map to `""`.
+    """
+    definitions = {}
+
+    def add(nodes: Iterable[ast.AST], prefix: str) -> list:
+        others = []
+        for node in nodes:
+            if isinstance(node, ast.Assign) and all(isinstance(target, ast.Name) for target in node.targets):
+                for target in node.targets:
+                    definitions[prefix + target.id] = node
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                definitions[prefix + node.name] = node
+            elif isinstance(node, ast.ClassDef):
+                body = add(node.body, f"{prefix}{node.name}.")
+                definitions[prefix + node.name] = ast.Module(
+                    body=node.decorator_list + node.bases + body, type_ignores=[]
+                )
+            elif not isinstance(node, ast.Expr) or prefix:
+                others.append(node)
+        return others
+
+    definitions[""] = ast.Module(body=add(ast.parse(source).body, ""), type_ignores=[])
+    return definitions
+
+
+def changed_definitions(path: str, base_ref: str) -> Optional[Set[str]]:
+    """Get names of definitions changed in a module since base ref
+
+    Changes of a locator constant also mark the constants built from it as changed.
+
+    Args:
+        path (str): Module path relative to project dir
+        base_ref (str): Git ref to compare with
+
+    Returns:
+        set: Changed definition names, None if the whole module must be considered changed
+    """
+    old_source = _git("show", f"{base_ref}:{path}")
+    new_file = os.path.join(PROJECT_DIR, path)
+    if old_source is None or not os.path.exists(new_file):
+        return None
+    with open(new_file, encoding="utf-8") as f:
+        new_source = f.read()
+    try:
+        old, new = _top_level_definitions(old_source), _top_level_definitions(new_source)
+    except SyntaxError:
+        return None
+
+    changed = {
+        name
+        for name in old.keys() | new.keys()
+        if name not in old or name not in new or ast.dump(old[name]) != ast.dump(new[name])
+    }
+    if "" in changed:
+        return None
+    # Propagate to definitions referencing changed ones, e.g. locators built from other locators
+    propagated = True
+    while propagated:
+        propagated = False
+        for name, node in new.items():
+            if name not in changed and any(
+                isinstance(child, ast.Name) and child.id in changed for child in ast.walk(node)
+            ):
+                changed.add(name)
+                propagated = True
+    return changed
+
+
+class DependencyRecorder:
+    """Record page object functions and locator constants exercised by each test
+
+    Calls are recorded per thread, threads started by a test on the main thread count for that test.
+    """
+
+    def __init__(self):
+        self.locator_index = get_locator_index()
+        self.tracked_dirs = tuple(
+            os.path.join(PROJECT_DIR, directory) + os.sep for directory in (PAGES_DIR, "helpers")
+        )
+        self.codes = set()
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.dependencies: Dict[str, dict] = {}
+
+    def _profile(self, frame, event, _):
+        if event == "call" and frame.f_code.co_filename.startswith(self.tracked_dirs):
+            getattr(self.local, "codes", self.codes).add(frame.f_code)
+
+    def start(self):
+        """Start recording calls of the test"""
+        self.local.codes = set()
+        if threading.current_thread() is threading.main_thread():
+            self.codes = self.local.codes
+            threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+
+    def stop(self, nodeid: str):
+        """Stop recording and store dependencies of the test"""
+        sys.setprofile(None)
+        if threading.current_thread() is threading.main_thread():
+            threading.setprofile(None)
+        functions, locators = set(), set()
+        for code in self.local.codes:
+            path = _relpath(code.co_filename)
+            if path.startswith(PAGES_DIR + "/"):
+                functions.add(f"{path}::{getattr(code, 'co_qualname', code.co_name)}")
+            for name in _code_names(code):
+                if name in self.locator_index:
+                    locators.add(f"{self.locator_index[name]}::{name}")
+        with self.lock:
+            self.dependencies[nodeid] = {
+                "functions": sorted(functions),
+                "locators": sorted(locators),
+            }
+
+    def save(self, map_path: str):
+        """Merge recorded dependencies into dependency map file"""
+        dependency_map = load_dependency_map(map_path) or {"tests": {}}
+        dependency_map["commit"] = (_git("rev-parse", "HEAD") or "").strip()
+        dependency_map["tests"].update(self.dependencies)
+        os.makedirs(os.path.dirname(map_path) or ".", exist_ok=True)
+        with open(map_path, "w", encoding="utf-8") as f:
+            json.dump(dependency_map, f, indent=2)
+        logger.info("Dependency map saved at Location : %s", map_path)
+
+
+def load_dependency_map(map_path: str) -> Optional[dict]:
+    """Load dependency map, None if it is missing or unreadable"""
+    try:
+        with open(map_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def changed_files_since(*refs: str) -> Optional[Dict[str, Set[str]]]:
+    """Get files changed since any of the refs, with the refs each file changed since
+
+    Returns:
+        dict: Changed file path to refs, None if a diff fails
+    """
+    changed_refs: Dict[str, Set[str]] = {}
+    for ref in dict.fromkeys(refs):
+        changed_files = _git("diff", "--name-only", ref)
+        if changed_files is None:
+            logger.warning("Unable to diff against %s, running full suite", ref)
+            return None
+        for path in changed_files.split():
+            changed_refs.setdefault(path, set()).add(ref)
+    return changed_refs
+
+
+def changed_dependencies(changed_refs: Dict[str, Set[str]]) -> Optional[Tuple[Set[str], Set[str]]]:
+    """Get changed page object / locator definitions and changed test modules
+
+    Args:
+        changed_refs (dict): Changed file path to the refs it changed since
+
+    Returns:
+        Tuple: Changed definitions as `path::name` and changed test module paths, None if other files changed
+    """
+    changed_deps, changed_tests = set(), set()
+    for path, refs in changed_refs.items():
+        if path.endswith(IGNORED_CHANGES) or path.startswith(IGNORED_CHANGES):
+            continue
+        directory = path.split("/")[0]
+        if directory in (PAGES_DIR, LOCATORS_DIR) and path.endswith(".py"):
+            for ref in sorted(refs):
+                names = changed_definitions(path, ref)
+                if names is None:
+                    changed_deps.add(f"{path}::*")
+                changed_deps.update(f"{path}::{name}" for name in names or ())
+        elif directory == TESTS_DIR and os.path.basename(path).startswith("test_"):
+            changed_tests.add(path)
+        else:
+            logger.info("%s changed, running full suite", path)
+            return None
+    return changed_deps, changed_tests
+
+
+def select_tests(nodeids: Iterable[str], map_path: str, base_ref: str) -> Optional[Set[str]]:
+    """Select tests affected by changes since base ref, or since the dependency map was recorded
+
+    Changes made after the map's commit are not in its dependencies, so files changed since
+    `merge-base(map commit, HEAD)` are selected on as well as those changed since base ref.
+
+    Args:
+        nodeids (Iterable): Collected test node ids
+        map_path (str): Dependency map file path
+        base_ref (str): Git ref to compare with
+
+    Returns:
+        set: Selected test node ids, None if the full suite must run
+    """
+    dependency_map = load_dependency_map(map_path)
+    if not dependency_map or _git("merge-base", "--is-ancestor", dependency_map.get("commit", ""), "HEAD") is None:
+        logger.warning("Dependency map %s is missing or stale, running full suite", map_path)
+        return None
+    map_base = (_git("merge-base", dependency_map["commit"], "HEAD") or "").strip()
+    if not map_base:
+        logger.warning("Unable to find merge base of dependency map commit, running full suite")
+        return None
+    changed_refs = changed_files_since(base_ref, map_base)
+    changes = changed_dependencies(changed_refs) if changed_refs is not None else None
+    if changes is None:
+        return None
+    changed_deps, changed_tests = changes
+
+    selected = set()
+    for nodeid in nodeids:
+        deps = dependency_map["tests"].get(nodeid)
+        if deps is None or nodeid.split("::")[0] in changed_tests:
+            selected.add(nodeid)
+            continue
+        for dep in deps["functions"] + deps["locators"]:
+            path = dep.split("::", 1)[0]
+            if dep in changed_deps or f"{path}::*" in changed_deps or any(
+                changed.startswith(f"{dep}.") or dep.startswith(f"{changed}.") for changed in changed_deps
+            ):
+                selected.add(nodeid)
+                break
+    return selected
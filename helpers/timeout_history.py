@@ -0,0 +1,87 @@
+"""Timeout History to derive adaptive wait timeouts per locator template from recorded wait durations"""
+
+import json
+import logging
+import math
+import os
+import threading
+from collections import defaultdict, deque
+from typing import Dict, Tuple
+
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+MAX_SAMPLES = 200
+
+
+def template_key(locator: Tuple[By, str]) -> str:
+    """Key of locator template in the history"""
+    return f"{locator[0]}={locator[1]}"
+
+
+class TimeoutHistory:
+    """Wait durations per locator template of an environment, persisted across runs
+
+    The adaptive timeout of a template is its p99 wait duration times `factor`, no lower than `floor`
+    and no higher than the default timeout, once `min_samples` durations are recorded.
+    """
+
+    def __init__(
+        self,
+        history_path: str,
+        env: str,
+        factor: float = 3.0,
+        floor: float = 5.0,
+        min_samples: int = 5,
+    ):
+        self.history_path = history_path
+        self.env = env
+        self.factor = factor
+        self.floor = floor
+        self.min_samples = min_samples
+        self.lock = threading.Lock()
+        self.history = {}
+        if os.path.exists(history_path):
+            with open(history_path, encoding="utf-8") as f:
+                self.history = json.load(f)
+        self.samples: Dict[str, deque] = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+        for key, durations in self.history.get(env, {}).items():
+            self.samples[key].extend(durations)
+
+    def record(self, key: str, duration: float):
+        """Record wait duration in seconds of a template"""
+        with self.lock:
+            self.samples[key].append(round(duration, 3))
+
+    def percentile(self, key: str, percent: float = 99) -> float:
+        """Get percentile of recorded wait durations of a template, None without enough samples"""
+        with self.lock:
+            durations = sorted(self.samples.get(key, ()))
+        if len(durations) < self.min_samples:
+            return None
+        return durations[min(len(durations) - 1, math.ceil(percent / 100 * len(durations)) - 1)]
+
+    def timeout_for(self, key: str, default: float) -> float:
+        """Get adaptive timeout of a template
+
+        Args:
+            key (str): Template key
+            default (float): Default timeout, also the upper limit of adaptive timeout
+
+        Returns:
+            float: Adaptive timeout, default timeout without enough samples
+        """
+        p99 = self.percentile(key)
+        if p99 is None:
+            return default
+        return min(default, max(self.floor, p99 * self.factor))
+
+    def save(self):
+        """Save recorded durations of the environment to history file"""
+        with self.lock:
+            self.history[self.env] = {key: list(durations) for key, durations in self.samples.items()}
+        os.makedirs(os.path.dirname(self.history_path) or ".", exist_ok=True)
+        with open(self.history_path, "w", encoding="utf-8") as f:
+            json.dump(self.history, f, indent=1)
+        logger.info("Timeout history saved at Location : %s", self.history_path)
@@ -1,5 +1,8 @@
 """Utils Module"""
+import logging
+import os
 import re
+import threading
 from datetime import datetime
 
 
@@ -39,3 +42,38 @@ def get_number_from_text(text):
         int: Number from text 
     """
     return int(re.sub("[^0-9]", "", text))
+
+
+def get_decimal_from_text(text):
+    """Get first decimal Number from text
+
+    Args:
+        text (str): Text String
+
+    Returns:
+        float: First decimal number in text, None if text has no number
+    """
+    match = re.search(r"\d+(?:\.\d+)?", text.replace(",", "")) if text else None
+    return float(match.group()) if match else None
+
+
+def thread_artifact_dir(base_dir: str) -> str:
+    """Get artifacts directory of the current thread
+
+    Args:
+        base_dir (str): Artifacts directory, used as is on the main thread
+
+    Returns:
+        str: Sub directory named after the thread when tests run on a thread per session
+    """
+    thread = threading.current_thread()
+    if thread is threading.main_thread():
+        return base_dir
+    return os.path.join(base_dir, re.sub(r"[^\w.-]+", "_", thread.name))
+
+
+class SessionLogger(logging.LoggerAdapter):
+    """Logger prefixing messages with the browser session, to tell concurrent sessions apart"""
+
+    def process(self, msg, kwargs):
+        return f"[{self.extra['session']}] {msg}", kwargs
@@ -0,0 +1,182 @@
+"""WebDriver Trace to record WebDriver commands of a session and replay them without a browser"""
+
+import gzip
+import json
+import logging
+import os
+from typing import Optional
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+TIMEOUT_MARK = "__timeout__"
+
+
+class ReplayMismatchError(AssertionError):
+    """Raised when a replayed session issues a command different from the recorded one"""
+
+
+def _copy_params(params: Optional[dict]) -> Optional[dict]:
+    """Copy command params without session id, RemoteConnection consumes path params"""
+    if not params:
+        return params
+    params = json.loads(json.dumps(params))
+    params.pop("sessionId", None)
+    return params
+
+
+class RecordingConnection:
+    """Command executor wrapper which writes every command and response to a trace file"""
+
+    def __init__(self, connection, trace_path: str, header: dict):
+        self.wrapped = connection
+        self.trace_path = trace_path
+        os.makedirs(os.path.dirname(trace_path) or ".", exist_ok=True)
+        self._trace = gzip.open(trace_path, "wt", encoding="utf-8")
+        self._write(header)
+
+    def __getattr__(self, name):
+        return getattr(self.wrapped, name)
+
+    def _write(self, entry: dict):
+        self._trace.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def execute(self, command: str, params: dict):
+        """Execute command and record it with its response"""
+        recorded_params = _copy_params(params)
+        response = self.wrapped.execute(command, params)
+        self._write({"c": command, "p": recorded_params, "r": response})
+        return response
+
+    def mark_timeout(self):
+        """Record that a wait timed out at this point of the session"""
+        self._write({"c": TIMEOUT_MARK})
+
+    def close(self):
+        """Close trace file and the wrapped connection"""
+        if not self._trace.closed:
+            self._trace.close()
+            logger.info("WebDriver trace saved at Location : %s", self.trace_path)
+        if hasattr(self.wrapped, "close"):
+            self.wrapped.close()
+
+
+class ReplayConnection:
+    """Command executor which serves recorded responses in order"""
+
+    def __init__(self, trace_path: str, strict: bool = False):
+        self.trace_path = trace_path
+        self.strict = strict
+        with gzip.open(trace_path, "rt", encoding="utf-8") as f:
+            self.header = json.loads(f.readline())
+            self.entries = [json.loads(line) for line in f]
+        self.position = 0
+
+    def next_is_timeout(self) -> bool:
+        """Consume the next entry if it records a wait timeout"""
+        if self.position < len(self.entries) and self.entries[self.position]["c"] == TIMEOUT_MARK:
+            self.position += 1
+            return True
+        return False
+
+    def execute(self, command: str, params: dict):
+        """Serve the recorded response of the next command
+
+        Raises:
+            ReplayMismatchError: if the command (or its params in strict mode) differs from the recording
+        """
+        if command == Command.NEW_SESSION:
+            return {
+                "value": {
+                    "sessionId": self.header["sessionId"],
+                    "capabilities": self.header["capabilities"],
+                }
+            }
+        if self.position >= len(self.entries):
+            raise ReplayMismatchError(f"Trace {self.trace_path} ended before command {command}")
+        entry = self.entries[self.position]
+        if entry["c"] != command or (
+            self.strict and entry["p"] != _copy_params(params)
+        ):
+            raise ReplayMismatchError(
+                f"Command {self.position} of trace {self.trace_path} is {entry['c']} {entry.get('p')}, "
+                f"but replay issued {command} {_copy_params(params)}"
+            )
+        self.position += 1
+        return entry["r"]
+
+    def close(self):
+        """Nothing to close for replay"""
+
+
+class TraceWait(WebDriverWait):
+    """WebDriverWait which records wait timeouts and replays them without polling delays"""
+
+    def until(self, method, message: str = ""):
+        connection = getattr(self._driver, "parent", self._driver).command_executor
+        while not isinstance(connection, (ReplayConnection, RecordingConnection)) and hasattr(
+            connection, "wrapped"
+        ):
+            connection = connection.wrapped
+        if isinstance(connection, ReplayConnection):
+            while not connection.next_is_timeout():
+                try:
+                    value = method(self._driver)
+                    if value:
+                        return value
+                except self._ignored_exceptions:
+                    pass
+            raise TimeoutException(message)
+        try:
+            return super().until(method, message)
+        except TimeoutException:
+            if isinstance(connection, RecordingConnection):
+                connection.mark_timeout()
+            raise
+
+
+def start_recording(driver: WebDriver, trace_path: str) -> RecordingConnection:
+    """Record every command of the driver session into a trace file
+
+    Args:
+        driver (WebDriver): WebDriver instance
+        trace_path (str): Trace file path (gzip compressed JSON Lines)
+
+    Returns:
+        RecordingConnection: Recording command executor, close it after the driver quits
+    """
+    header = {
+        "sessionId": driver.session_id,
+        "capabilities": driver.capabilities,
+        "get_log": hasattr(driver, "get_log"),
+    }
+    recorder = RecordingConnection(driver.command_executor, trace_path, header)
+    driver.command_executor = recorder
+    driver.wait_class = TraceWait
+    return recorder
+
+
+class ReplayWebDriver(WebDriver):
+    """WebDriver which replays a recorded trace without a browser"""
+
+    wait_class = TraceWait
+
+    def __init__(self, trace_path: str, strict: bool = False):
+        super().__init__(
+            command_executor=ReplayConnection(trace_path, strict), options=ArgOptions()
+        )
+
+    def get_log(self, log_type: str):
+        """Get recorded browser log
+
+        Raises:
+            AttributeError: if the recorded driver does not support logs
+        """
+        if not self.command_executor.header["get_log"]:
+            raise AttributeError("Recorded driver has no attribute 'get_log'")
+        return self.execute(Command.GET_LOG, {"type": log_type})["value"]
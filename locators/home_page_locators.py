@@ -8,6 +8,8 @@ dismiss_sign_in_popup_button = (
     '/descendant::button[@aria-label="Dismiss sign-in info."]',
 )
 
+accept_cookies_button = (By.XPATH, '//button[@id="onetrust-accept-btn-handler"]')
+
 auto_complete_results = (
     By.XPATH,
     '//*[@id="autocomplete-results"][count(descendant::*[text()= "Trending destinations"])={}]',
@@ -30,6 +32,22 @@ date_display_field = (
     '//*[@data-testid="date-display-field-{}" and text()="{}"]',
 )
 
+date_display_field_pair = (
+    By.XPATH,
+    '//*[@data-testid="date-display-field-start" and text()="{}"]'
+    ' | //*[@data-testid="date-display-field-end" and text()="{}"]',
+)
+
+calendar_next_month_button = (
+    By.XPATH,
+    '//*[@data-testid="searchbox-datepicker-calendar"]/descendant::button[@aria-label="Next month"]',
+)
+
+calendar_previous_month_button = (
+    By.XPATH,
+    '//*[@data-testid="searchbox-datepicker-calendar"]/descendant::button[@aria-label="Previous month"]',
+)
+
 occupancy_group_detail_button = (
     By.XPATH,
     '//*[contains(@id, "{}")]/preceding-sibling::*/button[{}]',
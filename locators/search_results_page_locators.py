@@ -27,34 +27,27 @@ filter_tag = (
     '//*[contains(@data-testid,"filter")]/descendant::*[contains(text(),"{}")]',
 )
 
-PROPERTY_CARD_WITH_INDEX = '//*[@data-testid="property-card"][{}]'
-
-property_card_review_score = (
-    By.XPATH,
-    PROPERTY_CARD_WITH_INDEX
-    + '/descendant::*[@data-testid="review-score"]/descendant::*[text()>{}]',
-)
-
-property_card_recommended_units = (
+property_card_after_position = (
     By.XPATH,
-    PROPERTY_CARD_WITH_INDEX
-    + '/descendant::*[@data-testid="recommended-units"]/descendant::*[contains(text(),"{}")]',
+    '(//*[@data-testid="property-card"])[position() > {}]',
 )
 
-property_card_rating_stars = (
+load_more_results_button = (
     By.XPATH,
-    PROPERTY_CARD_WITH_INDEX
-    + '/descendant::*[@data-testid="rating-stars" or @data-testid="rating-squares"][count(*)={}]',
+    '//button[descendant::*[text()="Load more results"]]',
 )
 
-property_card_price = (
+pagination_next_page_button = (
     By.XPATH,
-    PROPERTY_CARD_WITH_INDEX
-    + '/descendant::*[@data-testid="price-and-discounted-price"]',
+    '//button[@aria-label="Next page" and not(@disabled)]',
 )
 
-property_card_duration_member_info = (
-    By.XPATH,
-    PROPERTY_CARD_WITH_INDEX
-    + '/descendant::*[@data-testid="price-for-x-nights"][normalize-space()="{}"]',
-)
+# CSS selectors of property card details, read within each card by the property card record script
+PROPERTY_CARD_FIELD_SELECTORS = {
+    "title": '[data-testid="title"]',
+    "price": '[data-testid="price-and-discounted-price"]',
+    "review_score": '[data-testid="review-score"]',
+    "rating_stars": '[data-testid="rating-stars"], [data-testid="rating-squares"]',
+    "recommended_units": '[data-testid="recommended-units"]',
+    "duration_member_info": '[data-testid="price-for-x-nights"]',
+}
@@ -0,0 +1,119 @@
+"""Date Picker Functions"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import constants
+from helpers import utils
+from locators.home_page_locators import *
+
+if TYPE_CHECKING:
+    from helpers.driver_manager import WebDriverOps
+
+MONTH_RENDER_TIMEOUT_MS = 2000
+
+# Clicks next / previous month until the target date is rendered. Moves are recomputed from the rendered
+# month, and every click waits for the calendar to re-render, so fast clicks can not overshoot the target.
+NAVIGATE_TO_DATE_SCRIPT = """
+const target = arguments[0], nextXPath = arguments[1], previousXPath = arguments[2];
+const renderTimeout = arguments[3];
+const done = arguments[arguments.length - 1];
+const rendered = () => document.querySelector('[data-date="' + target + '"]');
+const find = (xpath) => document.evaluate(
+    xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue;
+const months = (date) => {
+    const [year, month] = date.split("-").map(Number);
+    return year * 12 + month;
+};
+const firstDate = () => {
+    const first = document.querySelector("[data-date]");
+    return first ? first.getAttribute("data-date") : null;
+};
+let clicks = 0, clickedFrom = null, clickedAt = 0;
+const next = () => requestAnimationFrame(() => setTimeout(step, 0));
+const step = () => {
+    if (rendered()) {
+        return done(clicks);
+    }
+    const current = firstDate();
+    if (!current) {
+        return done(null);
+    }
+    if (current === clickedFrom) {
+        // Calendar has not rendered the month of the last click yet
+        return performance.now() - clickedAt > renderTimeout ? done(null) : next();
+    }
+    const moves = months(target) - months(current);
+    const element = moves && find(moves > 0 ? nextXPath : previousXPath);
+    if (!element) {
+        return done(null);
+    }
+    element.click();
+    clicks++;
+    clickedFrom = current;
+    clickedAt = performance.now();
+    next();
+};
+step();
+"""
+
+class DatePicker:
+    """Date Picker class to select check in and check out dates of any month"""
+
+    def __init__(self, webdriver_ops):
+        self.webdriver_ops: "WebDriverOps" = webdriver_ops
+
+    def navigate_to_date(self, date: datetime):
+        """Navigate calendar to the month of the date in one script
+
+        Args:
+            date (datetime): Date to be rendered in the calendar
+
+        Returns:
+            int: Number of next / previous month clicks
+        """
+        date_str = utils.format_datetime(date)
+        clicks = self.webdriver_ops.execute_async_js_script(
+            NAVIGATE_TO_DATE_SCRIPT,
+            date_str,
+            calendar_next_month_button[1],
+            calendar_previous_month_button[1],
+            MONTH_RENDER_TIMEOUT_MS,
+        )
+        assert clicks is not None, f"Unable to navigate calendar to date {date_str}"
+        return clicks
+
+    @staticmethod
+    def get_display_date(date: datetime) -> str:
+        """Get date as displayed in date display field, e.g. `Mon, Oct 5`"""
+        return (
+            utils.format_datetime(date, constants.DAY_MONTH_FORMAT).strip()
+            + " "
+            + utils.format_datetime(date, constants.DATE_SINGLE_DIGIT_FORMAT).strip()
+        )
+
+    def select_dates(self, check_in_date: datetime, check_out_date: datetime):
+        """Select check in and check out dates and verify both selected dates at once
+
+        Args:
+            check_in_date (datetime): Check in date
+            check_out_date (datetime): Check out date
+        """
+        self.navigate_to_date(check_in_date)
+        self.webdriver_ops.click(
+            check_in_out_date, "Check In date", utils.format_datetime(check_in_date)
+        )
+        self.navigate_to_date(check_out_date)
+        self.webdriver_ops.click(
+            check_in_out_date, "Check out date", utils.format_datetime(check_out_date)
+        )
+        self.webdriver_ops.count_visible_elements(
+            date_display_field_pair,
+            "Selected Check In and Check out date",
+            [
+                self.get_display_date(check_in_date),
+                self.get_display_date(check_out_date),
+            ],
+            min_count=2,
+        )
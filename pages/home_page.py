@@ -1,14 +1,20 @@
 """Home Page Functions"""
 
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 import constants
 from helpers import utils
-from helpers.driver_manager import WebDriverOps
+from helpers.page_snapshot import SnapshotCheck
+from helpers.property_results import duration_and_members
 from locators.common_locators import *
 from locators.home_page_locators import *
+from pages.date_picker import DatePicker
 from pages.search_results_page import SearchResultsPage
 
+if TYPE_CHECKING:
+    from helpers.driver_manager import WebDriverOps
+
 OCCUPANCY_LIMITS = {
     "adults": {"min": 1, "max": 30, "default": 2},
     "children": {"min": 0, "max": 10, "default": 0},
@@ -20,16 +26,16 @@ class HomePage:
     """Home Page class"""
 
     def __init__(self, webdriver_ops):
-        self.webdriver_ops: WebDriverOps = webdriver_ops
+        self.webdriver_ops: "WebDriverOps" = webdriver_ops
 
     def verify_home_page(self):
         """Verify Home page"""
         self.webdriver_ops.wait_for_page_title_contains(constants.HOME_PAGE_TITLE)
-        self.webdriver_ops.is_element_present(
-            generic_text_locator, "Register link", True, "Register"
-        )
-        self.webdriver_ops.is_element_present(
-            generic_text_locator, "Sign in link", True, "Sign in"
+        self.webdriver_ops.assert_snapshot(
+            [
+                SnapshotCheck(generic_text_locator, "Register link", "Register"),
+                SnapshotCheck(generic_text_locator, "Sign in link", "Sign in"),
+            ]
         )
 
     def select_currency(self, currency: str):
@@ -50,21 +56,21 @@ class HomePage:
             search_request (dict): Search request dictionary
         """
         self.select_currency(search_request["currency"])
+        checkpoint = self.webdriver_ops.network_checkpoint()
         self.webdriver_ops.enter_text(
             generic_attribute_locator,
             search_request["dest_search"],
             "Destination",
             ["placeholder", "Where are you going?"],
         )
-        if self.webdriver_ops.is_element_present(
-            auto_complete_results,
-            "Auto Complete Results Trending",
-            replace_value=1,
-            wait_time=5,
-        ):
-            self.webdriver_ops.wait_for_element_to_be_visible(
-                auto_complete_results, "Auto Complete Results not Trending", 0
-            )
+        self.webdriver_ops.wait_for_network_idle(
+            constants.NETWORK_QUIET_MS,
+            constants.AUTOCOMPLETE_REQUEST_PATTERN,
+            checkpoint,
+        )
+        self.webdriver_ops.wait_for_element_to_be_visible(
+            auto_complete_results, "Auto Complete Results not Trending", 0
+        )
         self.webdriver_ops.click(
             auto_complete_results_with_text,
             "Auto Complete Results",
@@ -100,33 +106,7 @@ class HomePage:
         else:
             check_out_date = datetime.today() + timedelta(weeks=2)
 
-        self.webdriver_ops.click(
-            check_in_out_date, "Check In date", utils.format_datetime(check_in_date)
-        )
-        self.webdriver_ops.click(
-            check_in_out_date, "Check out date", utils.format_datetime(check_out_date)
-        )
-
-        check_in_str = (
-            utils.format_datetime(check_in_date, constants.DAY_MONTH_FORMAT).strip()
-            + " "
-            + utils.format_datetime(
-                check_in_date, constants.DATE_SINGLE_DIGIT_FORMAT
-            ).strip()
-        )
-        check_out_str = (
-            utils.format_datetime(check_out_date, constants.DAY_MONTH_FORMAT).strip()
-            + " "
-            + utils.format_datetime(
-                check_out_date, constants.DATE_SINGLE_DIGIT_FORMAT
-            ).strip()
-        )
-        self.webdriver_ops.wait_for_element_to_be_visible(
-            date_display_field, "Selected Check In date", ["start", check_in_str]
-        )
-        self.webdriver_ops.wait_for_element_to_be_visible(
-            date_display_field, "Selected Check out date", ["end", check_out_str]
-        )
+        DatePicker(self.webdriver_ops).select_dates(check_in_date, check_out_date)
 
         days = (check_out_date - check_in_date).days
         search_request["x_nights"] = days
@@ -144,22 +124,7 @@ class HomePage:
         self.update_occupant_detail("children", children)
         self.update_children_age(search_request.get("children_ages", None))
         self.update_occupant_detail("rooms", search_request.get("rooms", 1))
-        # region build duration member info
-        parts = []
-        x_nights = search_request["x_nights"]
-        if x_nights % 7 == 0:
-            weeks = x_nights // 7
-            parts.append(f"{weeks} week" if weeks == 1 else f"{weeks} weeks")
-
-        parts.append(f"{adults} adult" if adults == 1 else f"{adults} adults")
-
-        if children:
-            parts.append(
-                f"{children} child" if children == 1 else f"{children} children"
-            )
-
-        search_request["duration_and_members"] = ", ".join(parts)
-        # endregion
+        search_request["duration_and_members"] = duration_and_members(search_request)
 
     def update_occupant_detail(self, occupant_entity, occupant_count):
         """Update Occupant details
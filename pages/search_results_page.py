@@ -1,16 +1,44 @@
 """Search Results Page Functions"""
 
-from helpers import utils
-from helpers.driver_manager import WebDriverOps
+from typing import TYPE_CHECKING, Iterator
+
+import constants
+from helpers.page_snapshot import SnapshotCheck
+from helpers.property_results import PropertyCardRecord, PropertyResultsTable
 from locators.common_locators import *
 from locators.search_results_page_locators import *
 
+if TYPE_CHECKING:
+    from helpers.driver_manager import WebDriverOps
+
+RESULTS_LOAD_WAIT_TIME = 15
+LAZY_LOAD = "lazy load"
+LOAD_MORE = "load more"
+NEXT_PAGE = "next page"
+
+PROPERTY_CARD_RECORD_SCRIPT = """
+const card = arguments[0], selectors = arguments[1];
+const text = (selector) => {
+    const el = card.querySelector(selector);
+    return el ? (el.innerText || el.textContent).trim() : null;
+};
+const stars = card.querySelector(selectors.rating_stars);
+return {
+    title: text(selectors.title),
+    price: text(selectors.price),
+    review_score: text(selectors.review_score),
+    rating_stars: stars ? stars.children.length : 0,
+    recommended_units: text(selectors.recommended_units),
+    duration_member_info: text(selectors.duration_member_info),
+};
+"""
+
 
 class SearchResultsPage:
     """Search Results Page class"""
 
     def __init__(self, webdriver_ops):
-        self.webdriver_ops: WebDriverOps = webdriver_ops
+        self.webdriver_ops: "WebDriverOps" = webdriver_ops
 
     def verify_search_results(self, search_request: dict):
         """Verify Search Results
@@ -18,15 +46,17 @@ class SearchResultsPage:
         Args:
             search_request (dict): Search request dictionary
         """
-        self.webdriver_ops.wait_for_element_to_be_visible(
-            generic_text_locator, "Results Breadcrumb", "Search results"
-        )
-        self.webdriver_ops.wait_for_element_to_be_visible(
-            search_results_title, "Location Title", search_request["dest_search"]
-        )
         # At least 1 property is available in results
-        self.webdriver_ops.wait_for_element_to_be_visible(
-            data_testid_locator, "Property card", "property-card"
+        property_card = SnapshotCheck(data_testid_locator, "Property card", "property-card")
+        self.webdriver_ops.assert_snapshot(
+            [
+                SnapshotCheck(generic_text_locator, "Results Breadcrumb", "Search results"),
+                SnapshotCheck(
+                    search_results_title, "Location Title", search_request["dest_search"]
+                ),
+                property_card,
+            ],
+            ready=property_card,
         )
 
     def apply_filters(self, filter_data: dict):
@@ -36,6 +66,7 @@ class SearchResultsPage:
             filter_data (dict): Filter Data dictionary
 
         """
+        filter_tags = []
         for group, value in filter_data.items():
             if group == "Your budget (per night)":
                 slider_width = int(
@@ -68,78 +99,141 @@ class SearchResultsPage:
                         / (slider_max_value - slider_min_value)
                     )
                     offset_from_center = offset - slider_width // 2
+                    checkpoint = self.webdriver_ops.network_checkpoint()
                     self.webdriver_ops.click_on_element_by_offset(
                         price_slider_bar, "Max price Slider", offset_from_center
                     )
-                    value = f"{value:,} (per night)"
-                    self.webdriver_ops.wait_for_element_to_be_visible(
-                        filter_tag, "Filter Tag", value
+                    self.webdriver_ops.wait_for_network_idle(
+                        constants.NETWORK_QUIET_MS,
+                        constants.SEARCH_RESULTS_REQUEST_PATTERN,
+                        checkpoint,
                     )
+                    filter_tags.append(f"{value:,} (per night)")
             else:
+                checkpoint = self.webdriver_ops.network_checkpoint()
                 self.webdriver_ops.click(filter_group, "Select Filter", [group, value])
-                self.webdriver_ops.wait_for_element_to_be_visible(
-                    filter_tag, "Filter Tag", value
+                self.webdriver_ops.wait_for_network_idle(
+                    constants.NETWORK_QUIET_MS,
+                    constants.SEARCH_RESULTS_REQUEST_PATTERN,
+                    checkpoint,
                 )
-            self.webdriver_ops.wait_for_element_to_be_visible(
+                filter_tags.append(value)
+        # Results are settled after network idle of every filter, verify all filter tags at once
+        self.webdriver_ops.assert_snapshot(
+            [SnapshotCheck(filter_tag, "Filter Tag", tag) for tag in filter_tags],
+            ready=SnapshotCheck(data_testid_locator, "Property card", "property-card"),
+        )
+
+    def load_more_property_cards(self):
+        """Trigger loading of more property cards by lazy loading, Load more button or next page
+
+        Returns:
+            str: LAZY_LOAD, LOAD_MORE or NEXT_PAGE as per the triggered action, None if no more results
+        """
+        rendered = self.webdriver_ops.get_number_of_elements(
+            data_testid_locator, "Property card", "property-card"
+        )
+        self.webdriver_ops.execute_js_script(
+            "window.scrollTo(0, document.body.scrollHeight)"
+        )
+        # Scrolling alone may render more cards without any button
+        if self.webdriver_ops.is_element_present(
+            property_card_after_position,
+            "Lazy loaded property card",
+            replace_value=rendered,
+            wait_time=2,
+        ):
+            return LAZY_LOAD
+        if self.webdriver_ops.is_element_present(
+            load_more_results_button, "Load more results button", wait_time=2
+        ):
+            self.webdriver_ops.click(load_more_results_button, "Load more results button")
+            return LOAD_MORE
+        if self.webdriver_ops.is_element_present(
+            pagination_next_page_button, "Next page button", wait_time=1
+        ):
+            first_card = self.webdriver_ops.get_elements(
                 data_testid_locator, "Property card", "property-card"
+            )[0]
+            self.webdriver_ops.click(pagination_next_page_button, "Next page button")
+            self.webdriver_ops.wait_for_element_to_be_stale(
+                first_card, "Property card of previous page"
             )
+            return NEXT_PAGE
+        return None
 
-    def get_locator_for_property_dtl(self, key, value):
-        """Build and return Locator For Property Detail
+    def iter_property_cards(
+        self, max_items: int = None, load_more: bool = True
+    ) -> Iterator[PropertyCardRecord]:
+        """Yield property card records page by page, loading more results only as they are consumed
+
+        Only the cards of the current batch are held, so memory stays constant regardless of result count.
 
         Args:
-            key (str): Property key
-            value (_type_): Property value
+            max_items (int, optional): Maximum number of property cards to yield. Defaults to all results.
+            load_more (bool, optional): Load more results / next page once rendered cards are consumed.
+                Defaults to True.
 
-        Returns:
-            tuple: Tuple of locator and value
+        Yields:
+            PropertyCardRecord: Property card record
         """
-        locator = None
-        if key == "Review score":
-            locator = property_card_review_score
-            value = utils.get_number_from_text(value)
-        elif key == "Property rating":
-            locator = property_card_rating_stars
-            value = utils.get_number_from_text(value)
-        elif key == "Reservation policy":
-            locator = property_card_recommended_units
-        elif key == "Your budget (per night)":
-            locator = property_card_price
-        return locator, value
-
-    def verify_properties_for_applied_filter(self, request_data, filter_data: dict):
-        """Verify properties for applied Filter
+        yielded, offset, page = 0, 0, 1
+        wait_time = 1
+        while max_items is None or yielded < max_items:
+            if not self.webdriver_ops.is_element_present(
+                property_card_after_position,
+                "Next property card",
+                replace_value=offset,
+                wait_time=wait_time,
+            ):
+                if not load_more or wait_time == RESULTS_LOAD_WAIT_TIME:
+                    break
+                loaded = self.load_more_property_cards()
+                if loaded is None:
+                    break
+                if loaded == NEXT_PAGE:
+                    offset, page = 0, page + 1
+                wait_time = RESULTS_LOAD_WAIT_TIME
+                continue
+            wait_time = 1
+            cards = self.webdriver_ops.get_elements(
+                property_card_after_position, "Next property cards", offset
+            )
+            for card in cards:
+                if max_items is not None and yielded >= max_items:
+                    return
+                card_texts = self.webdriver_ops.execute_js_script(
+                    PROPERTY_CARD_RECORD_SCRIPT, card, PROPERTY_CARD_FIELD_SELECTORS
+                )
+                yielded += 1
+                yield PropertyCardRecord.from_card_texts(card_texts, page, yielded)
+            offset += len(cards)
+
+    def verify_properties_across_results(
+        self,
+        request_data,
+        filter_data: dict,
+        max_items: int = None,
+        load_more: bool = True,
+        results: PropertyResultsTable = None,
+    ) -> PropertyResultsTable:
+        """Verify properties for applied Filter across all pages of results
 
         Args:
             request_data (dict): Request Data dictionary
             filter_data (dict): Filter Data dictionary
+            max_items (int, optional): Maximum number of properties to verify. Defaults to all results.
+            load_more (bool, optional): Verify beyond rendered cards. Defaults to True.
+            results (PropertyResultsTable, optional): Table to capture property records into.
+
+        Returns:
+            PropertyResultsTable: Captured property records
         """
-        for i in range(
-            1,
-            self.webdriver_ops.get_number_of_elements(
-                data_testid_locator, "Property card", "property-card"
-            )
-            + 1,
-        ):
-            for group, value in filter_data.items():
-                locator, value = self.get_locator_for_property_dtl(group, value)
-                if group == "Your budget (per night)":
-                    self.webdriver_ops.is_element_present(
-                        property_card_duration_member_info,
-                        "Duration Memeber Info",
-                        stop_on_fail=True,
-                        replace_value=[i, request_data["duration_and_members"]],
-                    )
-                    price = self.webdriver_ops.get_element_text(
-                        locator, "Property card", i
-                    )
-                    price = utils.get_number_from_text(price)
-                    assert price / request_data["x_nights"] <= value
-
-                else:
-                    self.webdriver_ops.is_element_present(
-                        locator,
-                        f"Property card with {group}",
-                        stop_on_fail=True,
-                        replace_value=[i, value],
-                    )
+        results = PropertyResultsTable() if results is None else results
+        captured = len(results)
+        for record in self.iter_property_cards(max_items, load_more):
+            results.append(record)
+        assert len(results) > captured, "No properties found for applied filter"
+        failures = results.check_filters(request_data, filter_data)
+        assert not failures, "\n".join(failures)
+        return results
@@ -1,21 +1,54 @@
 """Base Test Module"""
 
+from typing import TYPE_CHECKING
+
 import pytest
-from selenium.webdriver.remote.webdriver import WebDriver
 
-from helpers.driver_manager import WebDriverOps
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+    from helpers.driver_manager import WebDriverOps
 
 
 class BaseTest:
-    """Base Test Class"""
+    """Base Test Class
+
+    `driver` and `webdriver_ops` are bound to each test instance, never to the class, so classes
+    running on a thread per session do not share them.
+    """
 
-    driver: WebDriver
-    webdriver_ops: WebDriverOps
+    driver: "WebDriver"
+    webdriver_ops: "WebDriverOps"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def class_webdriver_ops(
+        cls,
+        request,
+        driver,
+        env_config,
+        locator_profiler,
+        timeout_history,
+        navigation_metrics,
+    ):
+        """Initialize WebDriverOps of the driver once per test class"""
+        # Imported once a driver is needed, collection does not load Selenium
+        from helpers.driver_manager import WebDriverOps  # pylint:disable=C0415
 
-    @pytest.fixture(scope="class", autouse=True)
-    def init_driver(self, request, driver, env_config):
-        """Initialize driver to test class"""
         request.node.driver = driver
-        request.cls.driver = driver
-        request.cls.webdriver_ops = WebDriverOps(driver, env_config["timeout"])
-        request.cls.webdriver_ops.goto_url(env_config["url"])
+        webdriver_ops = WebDriverOps(
+            driver,
+            env_config["timeout"],
+            locator_profiler=locator_profiler,
+            timeout_history=timeout_history,
+        )
+        webdriver_ops.goto_url(env_config["url"])
+        if navigation_metrics:
+            navigation_metrics.record(driver, request.node.nodeid)
+        return webdriver_ops
+
+    @pytest.fixture(autouse=True)
+    def init_driver(self, driver, class_webdriver_ops):
+        """Initialize driver to test instance"""
+        self.driver = driver
+        self.webdriver_ops = class_webdriver_ops
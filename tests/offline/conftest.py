@@ -0,0 +1,9 @@
+"""Conftest.py for offline tests of helpers and page objects which run without a browser"""
+
+import pytest
+
+
+@pytest.fixture(scope="module", autouse=True)
+def driver():
+    """No browser session for offline tests, replay tests start their own ReplayWebDriver"""
+    return None
@@ -0,0 +1,127 @@
+"""Caching Proxy Test"""
+
+import http.client
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from helpers.caching_proxy import CachingProxy, DiskCache
+from helpers.stand_in_server import StandInServer
+
+HEADERS = [("Content-Type", "text/css")]
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    """Origin answering requests with the request body"""
+
+    def log_message(self, format, *args):  # pylint:disable=W0622
+        pass
+
+    def do_POST(self):  # pylint:disable=C0103
+        """Echo Content-Length request body"""
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(name="caching_proxy")
+def caching_proxy_fixture(tmp_path):
+    """Caching proxy caching responses of the local origin"""
+    proxy = CachingProxy(cache_dir=str(tmp_path / "cache"), static_hosts=("127.0.0.1",)).start()
+    yield proxy
+    proxy.stop()
+
+
+def proxy_request(proxy: CachingProxy, method: str, url: str, body=None, headers=None):
+    """Send request through proxy, returns response status, X-Cache header and body"""
+    host, port = proxy.address.split(":")
+    connection = http.client.HTTPConnection(host, int(port), timeout=10)
+    try:
+        headers = headers or {}
+        connection.request(
+            method, url, body=body, headers=headers, encode_chunked="Transfer-Encoding" in headers
+        )
+        response = connection.getresponse()
+        return response.status, response.getheader("X-Cache"), response.read()
+    finally:
+        connection.close()
+
+
+class TestCachingProxy:
+    """Caching Proxy Test Class"""
+
+    def test_disk_cache_evicts_least_recently_used(self, tmp_path):
+        """Responses above max size are evicted least recently used first, hits and misses are counted"""
+        cache = DiskCache(str(tmp_path), max_bytes=25)
+        cache.put("a", "https://cf.bstatic.com/a.css", 200, HEADERS, b"a" * 10)
+        cache.put("b", "https://cf.bstatic.com/b.css", 200, HEADERS, b"b" * 10)
+        assert cache.get("a") == (200, HEADERS, b"a" * 10)
+        cache.put("c", "https://cf.bstatic.com/c.css", 200, HEADERS, b"c" * 10)
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert (cache.hits, cache.misses, cache.size) == (2, 1, 20)
+        assert sorted(os.listdir(tmp_path)) == ["a.body", "a.json", "c.body", "c.json"]
+
+    def test_disk_cache_skips_bodies_above_max_size(self, tmp_path):
+        """A response larger than the whole cache is not stored"""
+        cache = DiskCache(str(tmp_path), max_bytes=5)
+        cache.put("a", "https://cf.bstatic.com/a.js", 200, HEADERS, b"a" * 10)
+        assert cache.get("a") is None
+        assert not os.listdir(tmp_path)
+
+    def test_disk_cache_evicts_on_load_above_max_size(self, tmp_path):
+        """Responses cached by earlier runs are evicted oldest first when the max size shrinks"""
+        cache = DiskCache(str(tmp_path), max_bytes=100)
+        for key in "abc":
+            cache.put(key, f"https://cf.bstatic.com/{key}.js", 200, HEADERS, key.encode() * 10)
+        for mtime, key in enumerate("bca"):
+            os.utime(tmp_path / f"{key}.body", (mtime, mtime))
+        cache = DiskCache(str(tmp_path), max_bytes=20)
+        assert list(cache.entries) == ["c", "a"]
+
+    def test_proxy_serves_immutable_asset_from_cache(self, caching_proxy):
+        """The second request of an immutable asset is a cache hit with the same body"""
+        with StandInServer() as server:
+            url = server.url.replace("index.html", "site.css")
+            first = proxy_request(caching_proxy, "GET", url)
+            second = proxy_request(caching_proxy, "GET", url)
+        assert first[:2] == (200, "MISS")
+        assert second == (200, "HIT", first[2])
+        assert (caching_proxy.cache.hits, caching_proxy.cache.misses) == (1, 1)
+
+    def test_proxy_forwards_chunked_request_body(self, caching_proxy):
+        """Chunked request bodies are read whole and forwarded with their length"""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            body = (chunk for chunk in (b"first chunk, ", b"second chunk"))
+            response = proxy_request(
+                caching_proxy,
+                "POST",
+                f"http://127.0.0.1:{server.server_address[1]}/echo",
+                body=body,
+                headers={"Transfer-Encoding": "chunked"},
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert response == (200, "PASS", b"first chunk, second chunk")
+
+    def test_chrome_trusts_only_the_proxy_authority(self, caching_proxy):
+        """Chrome is given the authority key hash instead of accepting any certificate, Firefox is not proxied"""
+        from selenium import webdriver  # pylint:disable=C0415
+
+        from helpers.driver_manager import add_proxy_option  # pylint:disable=C0415
+
+        spki_hash = caching_proxy.authority.spki_hash
+        chrome_options = webdriver.ChromeOptions()
+        add_proxy_option(chrome_options, "chrome", caching_proxy.address, spki_hash)
+        assert f"--ignore-certificate-errors-spki-list={spki_hash}" in chrome_options.arguments
+        assert not chrome_options.to_capabilities().get("acceptInsecureCerts")
+        firefox_options = webdriver.FirefoxOptions()
+        add_proxy_option(firefox_options, "firefox", caching_proxy.address, spki_hash)
+        assert firefox_options.proxy is None
@@ -0,0 +1,30 @@
+"""Locator Profiler Test"""
+
+from selenium.webdriver.common.by import By
+
+from helpers.locator_profiler import to_css_locator
+
+
+class TestLocatorProfiler:
+    """Locator Profiler Test Class"""
+
+    def test_to_css_locator_translates_simple_xpath(self):
+        """Attribute equality and contains predicates are translated to CSS selectors"""
+        assert to_css_locator((By.XPATH, '//*[@data-testid="property-card"]')) == (
+            By.CSS_SELECTOR,
+            '[data-testid="property-card"]',
+        )
+        assert to_css_locator(
+            (By.XPATH, '//input[@type="range"][contains(@class, "max")]')
+        ) == (By.CSS_SELECTOR, 'input[type="range"][class*="max"]')
+
+    def test_to_css_locator_keeps_other_locators(self):
+        """Text, positional and scoped XPath and non XPath locators are returned as is"""
+        for locator in (
+            (By.XPATH, '//*[text()="Register"]'),
+            (By.XPATH, '(//*[@data-testid="property-card"])[position() > 0]'),
+            (By.XPATH, './/*[@data-testid="title"]'),
+            (By.XPATH, '//div[@role="group"]/div'),
+            (By.ID, "results-title"),
+        ):
+            assert to_css_locator(locator) == locator
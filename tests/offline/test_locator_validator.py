@@ -0,0 +1,19 @@
+"""Locator Validator Test"""
+
+import gzip
+
+
+class TestLocatorValidator:
+    """Locator Validator Test Class"""
+
+    def test_load_snapshots_includes_thread_subdirectories(self, tmp_path):
+        """Page sources saved by session threads in subdirectories are loaded by relative path"""
+        from helpers.locator_validator import load_snapshots  # pylint:disable=C0415
+
+        (tmp_path / "session_0").mkdir()
+        (tmp_path / "home.html").write_text("<html><body><a>Register</a></body></html>", encoding="utf-8")
+        with gzip.open(tmp_path / "session_0" / "results.html.gz", "wt", encoding="utf-8") as f:
+            f.write('<html><body><div data-testid="property-card"></div></body></html>')
+        snapshots = load_snapshots(str(tmp_path))
+        assert sorted(snapshots) == ["home.html", "session_0/results.html.gz"]
+        assert snapshots["session_0/results.html.gz"].xpath('//*[@data-testid="property-card"]')
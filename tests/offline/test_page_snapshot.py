@@ -0,0 +1,45 @@
+"""Page Snapshot Test"""
+
+from helpers.page_snapshot import SnapshotCheck, evaluate_checks
+from locators.common_locators import data_testid_locator, generic_text_locator
+
+SOURCE = """
+<html><body>
+<nav><a href="index.html">Home</a> <span>Search results</span></nav>
+<div data-testid="filter-tags"><span>3 stars</span><span>Free   cancellation</span></div>
+<div data-testid="property-card"><div data-testid="title">Chennai Stay 1</div></div>
+</body></html>
+"""
+
+
+class TestPageSnapshot:
+    """Page Snapshot Test Class"""
+
+    def test_evaluate_checks_passes_present_elements(self):
+        """Presence and whitespace normalized text checks pass"""
+        failures, evaluation_ms = evaluate_checks(
+            SOURCE,
+            [
+                SnapshotCheck(generic_text_locator, "Results Breadcrumb", "Search results"),
+                SnapshotCheck(data_testid_locator, "Filter tags", "filter-tags", text="Free cancellation"),
+                SnapshotCheck(data_testid_locator, "Property card", "property-card"),
+            ],
+        )
+        assert not failures
+        assert evaluation_ms >= 0
+
+    def test_evaluate_checks_reports_every_failure(self):
+        """Missing elements, missing texts and invalid locators are all reported"""
+        failures, _ = evaluate_checks(
+            SOURCE,
+            [
+                SnapshotCheck(generic_text_locator, "Sign in link", "Sign in"),
+                SnapshotCheck(data_testid_locator, "Filter tags", "filter-tags", text="5 stars"),
+                SnapshotCheck(("xpath", "//*["), "Broken locator"),
+                SnapshotCheck(data_testid_locator, "Property card", "property-card"),
+            ],
+        )
+        assert len(failures) == 3
+        assert failures[0] == 'Sign in link: no element with locator (\'xpath\', \'//*[text()="Sign in"]\')'
+        assert failures[1].endswith("contains text '5 stars'")
+        assert failures[2].startswith("Broken locator: invalid locator")
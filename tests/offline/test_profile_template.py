@@ -0,0 +1,57 @@
+"""Profile Template Test"""
+
+import os
+import subprocess  # nosec B404
+
+import pytest
+
+from helpers import profile_template
+
+
+@pytest.fixture(name="template_dir")
+def template_dir_fixture(tmp_path, monkeypatch):
+    """Warmed profile with a read-only and a writable cache file, cloned without reflinks"""
+    template_dir = tmp_path / "template"
+    (template_dir / "Default" / "Cache").mkdir(parents=True)
+    (template_dir / "Default" / "Cache" / "entry_0").write_bytes(b"cached")
+    (template_dir / "Default" / "Cache" / "index").write_bytes(b"index")
+    (template_dir / "Default" / "Preferences").write_text("{}", encoding="utf-8")
+    (template_dir / "SingletonLock").write_text("", encoding="utf-8")
+    profile_template.set_cache_writable(str(template_dir), False)
+    os.chmod(template_dir / "Default" / "Cache" / "index", 0o644)
+    monkeypatch.setattr(
+        profile_template.subprocess,
+        "run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(args, 1),
+    )
+    yield template_dir
+    profile_template.set_cache_writable(str(template_dir), True)
+
+
+def same_file(template_dir, clone_dir, relative_path: str) -> bool:
+    """Whether clone shares the template file"""
+    return os.path.samefile(template_dir / relative_path, clone_dir / relative_path)
+
+
+class TestProfileTemplate:
+    """Profile Template Test Class"""
+
+    def test_clone_tree_hardlinks_only_read_only_cache_files(self, template_dir, tmp_path, monkeypatch):
+        """Read-only cache files are shared, writable cache files and the rest are writable copies"""
+        monkeypatch.setattr(profile_template.os, "geteuid", lambda: 1000, raising=False)
+        clone_dir = tmp_path / "clone"
+        assert profile_template.clone_tree(str(template_dir), str(clone_dir)) == "hardlink"
+        assert same_file(template_dir, clone_dir, "Default/Cache/entry_0")
+        assert not same_file(template_dir, clone_dir, "Default/Cache/index")
+        assert not same_file(template_dir, clone_dir, "Default/Preferences")
+        assert os.access(clone_dir / "Default" / "Cache" / "index", os.W_OK)
+        assert not (clone_dir / "SingletonLock").exists()
+
+    def test_clone_tree_copies_everything_as_root(self, template_dir, tmp_path, monkeypatch):
+        """Root ignores read-only permissions, so no template file is shared"""
+        monkeypatch.setattr(profile_template.os, "geteuid", lambda: 0, raising=False)
+        clone_dir = tmp_path / "clone"
+        assert profile_template.clone_tree(str(template_dir), str(clone_dir)) == "copy"
+        assert not same_file(template_dir, clone_dir, "Default/Cache/entry_0")
+        (clone_dir / "Default" / "Cache" / "entry_0").write_bytes(b"changed")
+        assert (template_dir / "Default" / "Cache" / "entry_0").read_bytes() == b"cached"
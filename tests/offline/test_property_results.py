@@ -0,0 +1,81 @@
+"""Property Results Test"""
+
+import pytest
+
+from helpers.property_results import (
+    PropertyCardRecord,
+    PropertyResultsTable,
+    duration_and_members,
+)
+
+SEARCH_REQUEST = {
+    "check_in_date": "2030-01-01",
+    "check_out_date": "2030-01-15",
+    "adults": 2,
+    "children": 1,
+}
+
+
+def property_record(index: int, **fields) -> PropertyCardRecord:
+    """Property card record of a 3 star property with free cancellation within budget"""
+    card = {
+        "title": f"Property {index}",
+        "price": "₹ 56,000",
+        "review_score": "Scored 8.4",
+        "rating_stars": 3,
+        "recommended_units": "Free cancellation",
+        "duration_member_info": "2 weeks, 2 adults, 1 child",
+    }
+    card.update(fields)
+    return PropertyCardRecord.from_card_texts(card, 1, index)
+
+
+class TestPropertyResults:
+    """Property Results Test Class"""
+
+    def test_duration_and_members_from_check_in_out_dates(self):
+        """Nights are computed from check in / out dates without x_nights"""
+        assert duration_and_members(SEARCH_REQUEST) == "2 weeks, 2 adults, 1 child"
+        assert duration_and_members({"x_nights": 1}) == "1 night, 1 adult"
+        assert duration_and_members({"x_nights": 3, "adults": 4}) == "3 nights, 4 adults"
+
+    def test_check_filters_passes_matching_records(self):
+        """Records within every filter report no failures"""
+        table = PropertyResultsTable(property_record(i) for i in range(1, 4))
+        filter_data = {
+            "Review score": "8+",
+            "Property rating": "3 stars",
+            "Reservation policy": "Free cancellation",
+            "Your budget (per night)": 5000,
+        }
+        assert not table.check_filters(SEARCH_REQUEST, filter_data)
+
+    def test_check_filters_reports_failing_records(self):
+        """Every failing record and filter is reported"""
+        table = PropertyResultsTable(
+            [
+                property_record(1),
+                property_record(2, rating_stars=4),
+                property_record(3, price="₹ 84,000"),
+                property_record(4, duration_member_info="2 weeks, 2 adults"),
+                property_record(5, recommended_units="Non-refundable"),
+            ]
+        )
+        filter_data = {
+            "Property rating": "3 stars",
+            "Reservation policy": "Free cancellation",
+            "Your budget (per night)": 5000,
+        }
+        failures = table.check_filters(SEARCH_REQUEST, filter_data)
+        assert failures == [
+            "Property 2 'Property 2' on page 1 does not match Property rating 3 stars",
+            "Property 5 'Property 5' on page 1 does not match Reservation policy Free cancellation",
+            "Property 3 'Property 3' on page 1 does not match Your budget (per night) 5000",
+            "Property 4 'Property 4' on page 1 does not match Your budget (per night) 5000",
+        ]
+
+    def test_check_filters_budget_needs_nights(self):
+        """Budget filter without nights in the search request fails with a clear error"""
+        table = PropertyResultsTable([property_record(1)])
+        with pytest.raises(ValueError, match="x_nights or check_in_date and check_out_date"):
+            table.check_filters({"adults": 2}, {"Your budget (per night)": 5000})
@@ -0,0 +1,24 @@
+"""Scenarios Test"""
+
+import itertools
+
+from helpers.scenarios import pairwise
+
+
+class TestScenarios:
+    """Scenarios Test Class"""
+
+    def test_pairwise_covers_every_value_pair(self):
+        """Every value pair of any two dimensions is in some combination, with far fewer combinations"""
+        sizes = [3, 3, 2, 2, 4]
+        combinations = list(pairwise(sizes))
+        for i, j in itertools.combinations(range(len(sizes)), 2):
+            covered = {(combination[i], combination[j]) for combination in combinations}
+            assert covered == set(itertools.product(range(sizes[i]), range(sizes[j])))
+        assert len(combinations) < 3 * 3 * 2 * 2 * 4 / 4
+        assert len({tuple(combination) for combination in combinations}) == len(combinations)
+
+    def test_pairwise_single_dimension(self):
+        """A single dimension yields each of its values"""
+        assert list(pairwise([3])) == [[0], [1], [2]]
+        assert not list(pairwise([]))
@@ -0,0 +1,43 @@
+"""Session Runner Test"""
+
+import json
+import os
+import subprocess  # nosec B404
+import sys
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TESTS = ["tests/offline/test_scenarios.py", "tests/offline/test_locator_profiler.py"]
+
+
+class TestSessionRunner:
+    """Session Runner Test Class"""
+
+    def test_tests_are_dealt_out_to_concurrent_sessions(self, tmp_path):
+        """Each selected test runs once, on one of two pytest sessions with their own results directory"""
+        result = subprocess.run(  # nosec B603
+            [
+                sys.executable,
+                "-m",
+                "helpers.session_runner",
+                "--workers",
+                "2",
+                "--workers-dir",
+                str(tmp_path),
+                "-p",
+                "no:cacheprovider",
+                *TESTS,
+            ],
+            cwd=PROJECT_DIR,
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=False,
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "2 sessions finished" in result.stdout
+        with open(tmp_path / "session-report.json", encoding="utf-8") as f:
+            tests = json.load(f)["tests"]
+        assert len(tests) == 4
+        assert all(len(workers) == 1 for workers in tests.values())
+        assert {worker for workers in tests.values() for worker in workers} == {"worker-0", "worker-1"}
+        assert all(result["outcome"] == "passed" for workers in tests.values() for result in workers.values())
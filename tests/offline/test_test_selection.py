@@ -0,0 +1,67 @@
+"""Test Selection Test"""
+
+import json
+
+import pytest
+
+from helpers import test_selection
+
+MAP_COMMIT = "a" * 40
+MAP_BASE = "b" * 40
+DEPENDENCIES = {
+    "tests/test_booking_hotels.py::test_search": {
+        "functions": ["pages/home_page.py::HomePage.search_hotels"],
+        "locators": [],
+    },
+    "tests/test_booking_hotels.py::test_filters": {
+        "functions": ["pages/search_results_page.py::SearchResultsPage.apply_filters"],
+        "locators": [],
+    },
+}
+
+
+@pytest.fixture(name="dependency_map")
+def dependency_map_fixture(tmp_path):
+    """Dependency map recorded at MAP_COMMIT"""
+    map_path = tmp_path / "dependency-map.json"
+    map_path.write_text(json.dumps({"commit": MAP_COMMIT, "tests": DEPENDENCIES}), encoding="utf-8")
+    return str(map_path)
+
+
+def fake_git(diffs: dict):
+    """Git stub where the map commit is an ancestor of HEAD and diffs are given per ref"""
+
+    def git(*args):
+        if args[:2] == ("merge-base", "--is-ancestor"):
+            return ""
+        if args[0] == "merge-base":
+            return MAP_BASE + "\n"
+        if args[:2] == ("diff", "--name-only"):
+            return "\n".join(diffs[args[2]])
+        return None
+
+    return git
+
+
+class TestTestSelection:
+    """Test Selection Test Class"""
+
+    def test_select_tests_unions_changes_since_map_commit(self, dependency_map, monkeypatch):
+        """Tests depending on changes made after the map commit are selected even if base ref has them"""
+        monkeypatch.setattr(
+            test_selection,
+            "_git",
+            fake_git({"origin/main": ["pages/home_page.py"], MAP_BASE: ["pages/search_results_page.py"]}),
+        )
+        monkeypatch.setattr(test_selection, "changed_definitions", lambda path, ref: None)
+        assert test_selection.select_tests(DEPENDENCIES, dependency_map, "origin/main") == set(DEPENDENCIES)
+
+    def test_select_tests_runs_full_suite_on_other_changes(self, dependency_map, monkeypatch):
+        """Changes outside pages, locators and test modules since the map commit run the full suite"""
+        monkeypatch.setattr(
+            test_selection,
+            "_git",
+            fake_git({"origin/main": ["pages/home_page.py"], MAP_BASE: ["helpers/driver_manager.py"]}),
+        )
+        monkeypatch.setattr(test_selection, "changed_definitions", lambda path, ref: None)
+        assert test_selection.select_tests(DEPENDENCIES, dependency_map, "origin/main") is None
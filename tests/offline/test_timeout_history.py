@@ -0,0 +1,40 @@
+"""Timeout History Test"""
+
+import json
+
+from helpers.timeout_history import TimeoutHistory
+
+
+class TestTimeoutHistory:
+    """Timeout History Test Class"""
+
+    def test_timeout_for_is_default_without_enough_samples(self, tmp_path):
+        """Templates with fewer than min samples wait for the default timeout"""
+        history = TimeoutHistory(str(tmp_path / "history.json"), "prod", min_samples=3)
+        history.record("xpath=//a", 1.0)
+        history.record("xpath=//a", 1.0)
+        assert history.percentile("xpath=//a") is None
+        assert history.timeout_for("xpath=//a", 60) == 60
+
+    def test_timeout_for_is_p99_times_factor_within_floor_and_default(self, tmp_path):
+        """Adaptive timeout is p99 times factor, no lower than floor and no higher than default"""
+        history = TimeoutHistory(str(tmp_path / "history.json"), "prod", factor=3, floor=5, min_samples=5)
+        for duration in (0.5, 1.0, 1.5, 2.0, 4.0):
+            history.record("slow", duration)
+            history.record("fast", duration / 10)
+        assert history.percentile("slow") == 4.0
+        assert history.timeout_for("slow", 60) == 12.0
+        assert history.timeout_for("slow", 10) == 10
+        assert history.timeout_for("fast", 60) == 5
+
+    def test_save_keeps_other_environments(self, tmp_path):
+        """Durations are saved per environment and loaded back"""
+        history_path = str(tmp_path / "history.json")
+        with open(history_path, "w", encoding="utf-8") as f:
+            json.dump({"qa": {"xpath=//a": [2.0]}}, f)
+        history = TimeoutHistory(history_path, "prod")
+        history.record("xpath=//a", 1.23456)
+        history.save()
+        with open(history_path, encoding="utf-8") as f:
+            assert json.load(f) == {"qa": {"xpath=//a": [2.0]}, "prod": {"xpath=//a": [1.235]}}
+        assert list(TimeoutHistory(history_path, "prod").samples["xpath=//a"]) == [1.235]
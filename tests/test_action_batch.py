@@ -0,0 +1,84 @@
+"""Action Batch Test"""
+
+from datetime import date
+
+import pytest
+
+from locators.common_locators import generic_attribute_locator
+from locators.home_page_locators import calendar_next_month_button, dismiss_sign_in_popup_button
+
+FIRST_DATE_AND_DESTINATION_SCRIPT = """
+return [
+    document.querySelector("[data-date]").dataset.date,
+    document.querySelector('[placeholder="Where are you going?"]').value,
+];
+"""
+
+
+@pytest.fixture(scope="module", autouse=True)
+def driver():
+    """The test starts its own browser against the stand-in site, no module browser session is needed"""
+    return None
+
+
+@pytest.fixture(name="stand_in_ops")
+def stand_in_ops_fixture(browser_config):
+    """WebDriverOps of a local headless browser on the stand-in home page"""
+    from selenium.common.exceptions import WebDriverException  # pylint:disable=C0415
+
+    from helpers.driver_manager import WebDriverOps, get_driver  # pylint:disable=C0415
+    from helpers.stand_in_server import StandInServer  # pylint:disable=C0415
+
+    if browser_config["grid_url"]:
+        pytest.skip("Stand-in site on localhost is not reachable by Selenium Grid browsers")
+    try:
+        browser = get_driver(browser_config["browser"], True)
+    except WebDriverException as e:
+        pytest.skip(f"No local {browser_config['browser']} browser : {e.msg}")
+    try:
+        with StandInServer() as server:
+            webdriver_ops = WebDriverOps(browser, 10)
+            webdriver_ops.goto_url(server.url)
+            yield webdriver_ops
+    finally:
+        browser.quit()
+
+
+class TestActionBatch:
+    """Action Batch Test Class"""
+
+    def test_multi_step_gesture_in_one_actions_command(self, stand_in_ops, monkeypatch):
+        """Dismissing the sign in popup, two month clicks and typing a destination are sent as one command"""
+        from selenium.webdriver.remote.command import Command  # pylint:disable=C0415
+
+        from helpers.action_batch import ActionBatch  # pylint:disable=C0415
+
+        batch = (
+            ActionBatch(stand_in_ops)
+            .click(dismiss_sign_in_popup_button, "Dismiss sign in popup")
+            .click(calendar_next_month_button, "Next month")
+            .click(calendar_next_month_button, "Next month")
+            .enter_text(
+                generic_attribute_locator,
+                "Paris",
+                "Destination",
+                ["placeholder", "Where are you going?"],
+            )
+        )
+        commands = []
+        execute = stand_in_ops.driver.execute
+
+        def record_command(command, params=None):
+            commands.append(command)
+            return execute(command, params)
+
+        monkeypatch.setattr(stand_in_ops.driver, "execute", record_command)
+        batch.perform()
+        monkeypatch.undo()
+
+        assert commands == [Command.W3C_ACTIONS]
+        months = date.today().year * 12 + date.today().month + 1
+        assert stand_in_ops.execute_js_script(FIRST_DATE_AND_DESTINATION_SCRIPT) == [
+            f"{months // 12}-{months % 12 + 1:02d}-01",
+            "Paris",
+        ]
@@ -1,5 +1,8 @@
 """Home Page Test"""
 
+import copy
+
+from helpers.scenarios import Scenario
 from pages.home_page import HomePage
 from pages.search_results_page import SearchResultsPage
 from tests.base_test import BaseTest
@@ -11,7 +14,9 @@ class TestBookingHotels(BaseTest):
     homepage: HomePage
     search_results_page: SearchResultsPage
 
-    def test_search_hotels_apply_multiple_filters_and_verify_result(self):
+    def test_search_hotels_apply_multiple_filters_and_verify_result(
+        self, property_results
+    ):
         """TC001: Search Hotels + Apply Multiple Filters And Result Verification"""
         self.homepage = HomePage(self.webdriver_ops)
         self.homepage.verify_home_page()
@@ -32,6 +37,32 @@ class TestBookingHotels(BaseTest):
             "Your budget (per night)": 5000,
         }
         self.search_results_page.apply_filters(filter_data)
-        self.search_results_page.verify_properties_for_applied_filter(
-            search_request, filter_data
+        # Beyond the first batch of rendered cards, so more results are loaded
+        self.search_results_page.verify_properties_across_results(
+            search_request, filter_data, max_items=40, results=property_results
+        )
+
+    def test_search_hotels_scenarios(
+        self, scenario: Scenario, searched_results, env_config, property_results
+    ):
+        """TC002: Data Driven Search Hotels + Apply Filters, scenarios of the same search reuse its results page"""
+        if scenario.search_key in searched_results:
+            results_url, search_request = searched_results[scenario.search_key]
+            self.webdriver_ops.goto_url(results_url)
+            self.search_results_page = SearchResultsPage(self.webdriver_ops)
+        else:
+            search_request = copy.deepcopy(scenario.search_request)
+            self.webdriver_ops.goto_url(env_config["url"])
+            self.homepage = HomePage(self.webdriver_ops)
+            self.homepage.verify_home_page()
+            self.search_results_page = self.homepage.search_hotels(search_request)
+            self.search_results_page.verify_search_results(search_request)
+            searched_results[scenario.search_key] = (
+                self.driver.current_url,
+                search_request,
+            )
+        filter_data = dict(scenario.filter_data)
+        self.search_results_page.apply_filters(filter_data)
+        self.search_results_page.verify_properties_across_results(
+            search_request, filter_data, load_more=False, results=property_results
         )
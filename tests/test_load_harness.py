@@ -0,0 +1,40 @@
+"""Load Harness Smoke Test"""
+
+import pytest
+
+STEPS = ["goto_url", "verify_home_page", "search_hotels", "verify_search_results", "apply_filters"]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def driver():
+    """Virtual users start their own browsers, no module browser session is needed"""
+    return None
+
+
+@pytest.mark.load
+class TestLoadHarness:
+    """Load Harness Smoke Test Class, deselected by default, run it with `-m load`"""
+
+    def test_load_harness_against_stand_in_site(self, browser_config):
+        """Two virtual users run the search and filter flow against the local stand-in site without errors"""
+        from selenium.common.exceptions import WebDriverException  # pylint:disable=C0415
+
+        from helpers.driver_manager import get_driver  # pylint:disable=C0415
+        from helpers.load_harness import LoadHarness, format_summary  # pylint:disable=C0415
+        from helpers.stand_in_server import StandInServer  # pylint:disable=C0415
+
+        if browser_config["grid_url"]:
+            pytest.skip("Stand-in site on localhost is not reachable by Selenium Grid browsers")
+        try:
+            get_driver(browser_config["browser"], True).quit()
+        except WebDriverException as e:
+            pytest.skip(f"No local {browser_config['browser']} browser : {e.msg}")
+
+        with StandInServer(latency_ms=50) as server:
+            harness = LoadHarness(
+                server.url, users=2, ramp_up=1, think_time=0, duration=10, browser=browser_config["browser"]
+            )
+            summary = harness.run()
+        assert summary["flows"] >= 1, f"No flow completed\n{format_summary(summary)}"
+        assert summary["flow_error_rate"] == 0, format_summary(summary)
+        assert list(summary["steps"]) == STEPS, format_summary(summary)